@@ -0,0 +1,25 @@
+from typing import Generator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from utilities.plugins.openai_emulator import OpenAIEmulatorConfig, start_openai_emulator
+from utilities.plugins.tgis_fake_server import FakeTGISConfig, start_fake_tgis_server
+
+
+@pytest.fixture(scope="class")
+def fake_tgis_server(request: FixtureRequest) -> Generator[str, None, None]:
+    """Fake TGIS server address; the server behavior is set with an indirect `FakeTGISConfig` param"""
+    server, address = start_fake_tgis_server(config=getattr(request, "param", FakeTGISConfig()))
+    yield address
+
+    server.stop(grace=None)
+
+
+@pytest.fixture(scope="class")
+def openai_emulator(request: FixtureRequest) -> Generator[str, None, None]:
+    """OpenAI emulator base URL; the emulator behavior is set with an indirect `OpenAIEmulatorConfig` param"""
+    server = start_openai_emulator(config=getattr(request, "param", OpenAIEmulatorConfig()))
+    yield server.url
+
+    server.stop()
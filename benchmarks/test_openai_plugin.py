@@ -0,0 +1,124 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched
+from typing import Any
+
+import pytest
+
+from tests.model_serving.model_runtime.utils import fetch_openai_response
+from utilities.plugins.constant import OpenAIEnpoints
+from utilities.plugins.openai_emulator import OpenAIEmulatorConfig
+from utilities.plugins.openai_plugin import SSE_DONE, OpenAIClient, SSEParser
+
+pytest.importorskip("pytest_benchmark")
+
+MODEL_NAME = "emulated-model"
+MAX_TOKENS = 16
+SERVER_LATENCY = 0.01
+NUM_CONCURRENT_REQUESTS = 64
+NUM_ROUNDS = 3
+NUM_STREAM_EVENTS = 1000
+STREAM_CHUNK_SIZE = 1024
+COMPLETION_QUERY = {"text": "What are the key benefits of renewable energy sources compared to fossil fuels?"}
+CHAT_QUERY = [{"role": "user", "content": COMPLETION_QUERY["text"]}]
+
+
+def get_sse_stream_chunks(num_events: int, chunk_size: int) -> list[bytes]:
+    """A completions SSE stream split in fixed size chunks, so events span chunk boundaries"""
+    stream = b"".join(
+        b"data: " + json.dumps({"choices": [{"index": 0, "text": f" token{index}"}]}).encode() + b"\n\n"
+        for index in range(num_events)
+    )
+    stream += b"data: " + SSE_DONE + b"\n\n"
+    return [bytes(chunk) for chunk in batched(stream, chunk_size)]
+
+
+class TestOpenAIClientBenchmark:
+    """Request overhead, streaming parse cost and concurrency scaling of OpenAIClient against a local emulator"""
+
+    def test_completion_request_overhead(self, benchmark: Any, openai_emulator: str) -> None:
+        """Completions request against an instant emulator, measures the client cost per request"""
+        with OpenAIClient(host=openai_emulator, model_name=MODEL_NAME) as client:
+            response = benchmark(
+                client.request_http,
+                endpoint=OpenAIEnpoints.COMPLETIONS,
+                query=COMPLETION_QUERY,
+                extra_param={"max_tokens": MAX_TOKENS},
+            )
+            pool_stats = client.pool_stats()
+
+        assert response["text"] == "".join(f" token{index}" for index in range(MAX_TOKENS))
+        assert pool_stats["connections_opened"] == 1
+
+    def test_chat_request_overhead(self, benchmark: Any, openai_emulator: str) -> None:
+        """Chat completions request against an instant emulator"""
+        with OpenAIClient(host=openai_emulator, model_name=MODEL_NAME) as client:
+            response = benchmark(
+                client.request_http,
+                endpoint=OpenAIEnpoints.CHAT_COMPLETIONS,
+                query=CHAT_QUERY,
+                extra_param={"max_tokens": MAX_TOKENS},
+            )
+
+        assert response["message"]["role"] == "assistant"
+
+    def test_streaming_parse_cost(self, benchmark: Any) -> None:
+        """SSE framing and JSON decoding of a stream, no network involved"""
+        chunks = get_sse_stream_chunks(num_events=NUM_STREAM_EVENTS, chunk_size=STREAM_CHUNK_SIZE)
+
+        def parse_stream() -> int:
+            parser = SSEParser()
+            num_tokens = 0
+            for chunk in chunks:
+                for event_data in parser.feed(chunk=chunk):
+                    if event_data != SSE_DONE:
+                        json.loads(event_data)
+                        num_tokens += 1
+
+            return num_tokens
+
+        assert benchmark(parse_stream) == NUM_STREAM_EVENTS
+
+    def test_streaming_request(self, benchmark: Any, openai_emulator: str) -> None:
+        """Streaming completions request against an instant emulator"""
+        with OpenAIClient(host=openai_emulator, model_name=MODEL_NAME, streaming=True) as client:
+            result = benchmark(
+                client.streaming_request_http,
+                endpoint=OpenAIEnpoints.COMPLETIONS,
+                query=COMPLETION_QUERY,
+                extra_param={"max_tokens": MAX_TOKENS},
+            )
+
+        assert result.token_count == MAX_TOKENS
+
+    @pytest.mark.parametrize(
+        "openai_emulator", [pytest.param(OpenAIEmulatorConfig(time_to_first_token=SERVER_LATENCY))], indirect=True
+    )
+    @pytest.mark.parametrize("concurrency", [1, 4, 16])
+    def test_concurrency_scaling(self, benchmark: Any, openai_emulator: str, concurrency: int) -> None:
+        """Requests sent from a thread pool sharing one client; the pool size matches the concurrency"""
+        with OpenAIClient(host=openai_emulator, model_name=MODEL_NAME, pool_size=concurrency) as client:
+
+            def send_requests() -> list[Any]:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    return list(
+                        executor.map(
+                            lambda _: client.request_http(endpoint=OpenAIEnpoints.COMPLETIONS, query=COMPLETION_QUERY),
+                            range(NUM_CONCURRENT_REQUESTS),
+                        )
+                    )
+
+            start_time = time.perf_counter()
+            responses = benchmark.pedantic(send_requests, rounds=NUM_ROUNDS)
+            duration = time.perf_counter() - start_time
+            benchmark.extra_info["requests_per_second"] = NUM_CONCURRENT_REQUESTS * NUM_ROUNDS / duration
+
+        assert len(responses) == NUM_CONCURRENT_REQUESTS
+
+    def test_fetch_openai_response(self, benchmark: Any, openai_emulator: str) -> None:
+        """Model runtime completions flow: completion queries over a new client, then the models endpoint"""
+        model_info, completion_responses = benchmark(fetch_openai_response, url=openai_emulator, model_name=MODEL_NAME)
+
+        assert model_info[0]["owned_by"] == "emulator"
+        assert completion_responses
@@ -0,0 +1,98 @@
+import asyncio
+import statistics
+import time
+
+import pytest
+from simple_logger.logger import get_logger
+
+from utilities.plugins.openai_plugin import StreamingResult
+from utilities.plugins.tgis_fake_server import DEFAULT_MAX_NEW_TOKENS, FakeTGISConfig
+from utilities.plugins.tgis_grpc_plugin import AsyncTGISGRPCPlugin, TGISGRPCPlugin
+
+LOGGER = get_logger(name=__name__)
+
+MODEL_NAME = "fake-model"
+NUM_REQUESTS = 200
+SERVER_LATENCY = 0.01
+NUM_PROMPTS = 32
+NUM_STREAMS = 32
+
+
+def get_queries(num_queries: int) -> list[dict[str, str]]:
+    return [{"text": f"prompt number {index}"} for index in range(num_queries)]
+
+
+class TestTGISGRPCPluginBenchmark:
+    """Throughput and overhead of the TGIS gRPC clients against a fake TGIS server on localhost"""
+
+    @pytest.mark.parametrize("fake_tgis_server", [pytest.param(FakeTGISConfig())], indirect=True)
+    def test_generate_request_rate(self, fake_tgis_server: str) -> None:
+        """Sequential Generate requests against an instant server, measures the client cost per request"""
+        with TGISGRPCPlugin(host=fake_tgis_server, model_name=MODEL_NAME) as plugin:
+            start_time = time.perf_counter()
+            results = [plugin.make_grpc_request(query=query) for query in get_queries(num_queries=NUM_REQUESTS)]
+            duration = time.perf_counter() - start_time
+
+        assert all(result["output_tokens"] == DEFAULT_MAX_NEW_TOKENS for result in results)
+        LOGGER.info(
+            f"Generate: {NUM_REQUESTS / duration:.0f} requests/s, {duration / NUM_REQUESTS * 1000:.2f} ms/request"
+        )
+
+    @pytest.mark.parametrize(
+        "fake_tgis_server", [pytest.param(FakeTGISConfig(time_to_first_token=SERVER_LATENCY))], indirect=True
+    )
+    def test_generate_client_overhead(self, fake_tgis_server: str) -> None:
+        """Client overhead on top of a fixed server latency"""
+        latencies = []
+
+        with TGISGRPCPlugin(host=fake_tgis_server, model_name=MODEL_NAME) as plugin:
+            for query in get_queries(num_queries=NUM_REQUESTS // 4):
+                start_time = time.perf_counter()
+                plugin.make_grpc_request(query=query)
+                latencies.append(time.perf_counter() - start_time)
+
+        overhead = statistics.median(latencies) - SERVER_LATENCY
+        LOGGER.info(f"Generate: median client overhead {overhead * 1000:.2f} ms over {SERVER_LATENCY * 1000:.0f} ms")
+        assert overhead >= 0
+
+    @pytest.mark.parametrize("fake_tgis_server", [pytest.param(FakeTGISConfig(tokens_per_second=1000))], indirect=True)
+    def test_batch_request_speedup(self, fake_tgis_server: str) -> None:
+        """Prompts packed in batched Generate calls against one Generate call per prompt"""
+        queries = get_queries(num_queries=NUM_PROMPTS)
+
+        with TGISGRPCPlugin(host=fake_tgis_server, model_name=MODEL_NAME) as plugin:
+            start_time = time.perf_counter()
+            single_results = [plugin.make_grpc_request(query=query) for query in queries]
+            single_duration = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            batch_results = plugin.make_grpc_batch_request(queries=queries)
+            batch_duration = time.perf_counter() - start_time
+
+        assert batch_results == single_results
+        LOGGER.info(
+            f"{NUM_PROMPTS} prompts: {single_duration:.3f}s one call per prompt, {batch_duration:.3f}s batched "
+            f"({single_duration / batch_duration:.1f}x)"
+        )
+        assert batch_duration < single_duration
+
+    @pytest.mark.parametrize("fake_tgis_server", [pytest.param(FakeTGISConfig(tokens_per_second=500))], indirect=True)
+    def test_concurrent_streams(self, fake_tgis_server: str) -> None:
+        """Concurrent GenerateStream calls over one channel, measures time to first token and inter-token latency"""
+
+        async def _run_streams() -> list[StreamingResult]:
+            async with AsyncTGISGRPCPlugin(host=fake_tgis_server, model_name=MODEL_NAME) as plugin:
+                return await plugin.make_grpc_request_streams(queries=get_queries(num_queries=NUM_STREAMS))
+
+        start_time = time.perf_counter()
+        results = asyncio.run(_run_streams())
+        duration = time.perf_counter() - start_time
+
+        assert all(result.token_count == DEFAULT_MAX_NEW_TOKENS for result in results)
+        time_to_first_token = statistics.median(result.time_to_first_token for result in results)
+        inter_token_latencies = [latency for result in results for latency in result.inter_token_latencies]
+        LOGGER.info(
+            f"{NUM_STREAMS} concurrent streams in {duration:.3f}s: "
+            f"median time to first token {time_to_first_token * 1000:.2f} ms, "
+            f"median inter-token latency {statistics.median(inter_token_latencies) * 1000:.2f} ms"
+        )
@@ -24,8 +24,12 @@ from _pytest.terminal import TerminalReporter
 from typing import Optional, Any
 from pytest_testconfig import config as py_config
 
+from utilities.cassette import DEFAULT_CASSETTE_PATH, CassetteMode, remove_cassette_files
+from utilities.cluster_client import get_cluster_client
 from utilities.constants import KServeDeploymentType, MODEL_REGISTRY_CUSTOM_NAMESPACE
 from utilities.database import Database
+from utilities.http_engine import HttpVersion
+from utilities.inference_config_registry import get_inference_config_registry
 from utilities.logger import separator, setup_logging
 from utilities.must_gather_collector import (
     set_must_gather_collector_directory,
@@ -36,7 +40,6 @@ from utilities.must_gather_collector import (
 )
 from kubernetes.dynamic import DynamicClient
 from utilities.infra import get_operator_distribution, get_dsci_applications_namespace, get_data_science_cluster
-from ocp_resources.resource import get_client
 from ocp_resources.cluster_service_version import ClusterServiceVersion
 
 LOGGER = logging.getLogger(name=__name__)
@@ -55,6 +58,8 @@ def pytest_addoption(parser: Parser) -> None:
     model_validation_automation_group = parser.getgroup(name="Model Validation Automation")
     hf_group = parser.getgroup(name="Hugging Face")
     model_registry_group = parser.getgroup(name="Model Registry options")
+    cassette_group = parser.getgroup(name="Inference cassette")
+    inference_transport_group = parser.getgroup(name="Inference transport")
     # AWS config and credentials options
     aws_group.addoption(
         "--aws-secret-access-key",
@@ -199,9 +204,40 @@ def pytest_addoption(parser: Parser) -> None:
         help="Indicates if the model registry tests are to be run against custom namespace",
     )
 
+    # Inference cassette options
+    cassette_group.addoption(
+        "--cassette-mode",
+        default=os.environ.get("CASSETTE_MODE", CassetteMode.OFF),
+        choices=CassetteMode.ALL_MODES,
+        help="Record inference client responses to the cassette file, or replay them instead of sending requests",
+    )
+    cassette_group.addoption(
+        "--cassette-path",
+        default=os.environ.get("CASSETTE_PATH", DEFAULT_CASSETTE_PATH),
+        help="Inference cassette file path",
+    )
+
+    # Inference transport options
+    inference_transport_group.addoption(
+        "--inference-http-version",
+        default=os.environ.get("INFERENCE_HTTP_VERSION", HttpVersion.HTTP_1_1),
+        choices=HttpVersion.ALL_VERSIONS,
+        help="HTTP version of in-process REST inference requests; HTTP/2 multiplexes concurrent requests "
+        "over one TLS connection per host",
+    )
+
 
 def pytest_cmdline_main(config: Any) -> None:
+    # pytest-xdist workers get `<controller basetemp>/<worker id>` as basetemp, the controller basetemp is shared
+    # by all the processes of the run
+    run_tmp_base_dir = os.path.dirname(config.option.basetemp) if hasattr(config, "workerinput") else None
     config.option.basetemp = py_config["tmp_base_dir"] = f"{config.option.basetemp}-{shortuuid.uuid()}"
+    py_config["run_tmp_base_dir"] = run_tmp_base_dir or py_config["tmp_base_dir"]
+    py_config["cassette"] = {"mode": config.option.cassette_mode, "path": config.option.cassette_path}
+    # pytest-xdist workers record to their own cassette files, files of a previous recording are removed once
+    if config.option.cassette_mode == CassetteMode.RECORD and not hasattr(config, "workerinput"):
+        remove_cassette_files(path=config.option.cassette_path)
+    py_config["inference_http_version"] = config.option.inference_http_version
 
 
 def pytest_collection_modifyitems(session: Session, config: Config, items: list[Item]) -> None:
@@ -292,6 +328,8 @@ def pytest_sessionstart(session: Session) -> None:
         log_level=session.config.getoption("log_cli_level") or logging.INFO,
         thread_name=thread_name,
     )
+    # Compile the manifests inference configs, a broken config fails the session before any test runs
+    get_inference_config_registry()
     must_gather_dict = set_must_gather_collector_values()
     shutil.rmtree(
         path=must_gather_dict["must_gather_base_directory"],
@@ -301,7 +339,7 @@ def pytest_sessionstart(session: Session) -> None:
     if config.getoption("--collect-only") or config.getoption("--setup-plan"):
         LOGGER.info("Skipping global config update for collect-only or setup-plan")
         return
-    updated_global_config(admin_client=get_client(), config=config)
+    updated_global_config(admin_client=get_cluster_client(), config=config)
 
 
 def updated_global_config(admin_client: DynamicClient, config: Config) -> None:
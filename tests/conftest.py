@@ -2,6 +2,7 @@ import base64
 import os
 import shutil
 from ast import literal_eval
+from pathlib import Path
 from typing import Any, Callable, Generator
 
 import pytest
@@ -28,7 +29,6 @@ from pytest import FixtureRequest, Config
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.data_science_cluster import DataScienceCluster
 from ocp_resources.namespace import Namespace
-from ocp_resources.resource import get_client
 from pytest_testconfig import config as py_config
 from simple_logger.logger import get_logger
 import json
@@ -53,11 +53,17 @@ from utilities.constants import (
     Timeout,
     OPENSHIFT_OPERATORS,
 )
+from utilities.cassette import get_cassette
+from utilities.cluster_client import create_dynamic_client, get_cluster_client
 from utilities.infra import update_configmap_data
+from utilities.inference_resolver import get_inference_resolver_cache
 from utilities.logger import RedactedString
 from utilities.mariadb_utils import wait_for_mariadb_operator_deployments
+from utilities.pod_informer import get_pod_informer_manager
 from utilities.minio import create_minio_data_connection_secret
 from utilities.operator_utils import get_csv_related_images, get_cluster_service_version
+from utilities.plugins.kserve_v2_grpc_plugin import get_kserve_v2_grpc_plugin_manager
+from utilities.port_forward_utils import get_port_forward_manager
 
 LOGGER = get_logger(name=__name__)
 
@@ -66,7 +72,7 @@ pytest_plugins = ["tests.fixtures.inference", "tests.fixtures.guardrails", "test
 
 @pytest.fixture(scope="session")
 def admin_client() -> DynamicClient:
-    return get_client()
+    return get_cluster_client()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -80,6 +86,54 @@ def tests_tmp_dir(request: FixtureRequest, tmp_path_factory: TempPathFactory) ->
     shutil.rmtree(path=str(tests_tmp_path), ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def load_reports_dir(tmp_path_factory: TempPathFactory) -> Path:
+    """Directory for inference load JSON reports; kept under the pytest basetemp after the session ends"""
+    load_reports_path = tmp_path_factory.mktemp(basename="load-reports")
+    LOGGER.info(f"Inference load reports are written to {load_reports_path}")
+    return load_reports_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def port_forward_tunnels() -> Generator[None, None, None]:
+    """Close the port-forward tunnels opened during the session"""
+    yield
+
+    get_port_forward_manager().close_all()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def kserve_v2_grpc_channels() -> Generator[None, None, None]:
+    """Close the KServe v2 gRPC channels opened during the session"""
+    yield
+
+    get_kserve_v2_grpc_plugin_manager().close_all()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def inference_resolver_cache() -> Generator[None, None, None]:
+    """Stop the inference resolver cache watches started during the session"""
+    yield
+
+    get_inference_resolver_cache().close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def inference_cassette() -> Generator[None, None, None]:
+    """Write the inference cassette index at the end of the session, when responses are recorded"""
+    yield
+
+    get_cassette().close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pod_informers() -> Generator[None, None, None]:
+    """Stop the namespace pod informers at the end of the session"""
+    yield
+
+    get_pod_informer_manager().stop()
+
+
 @pytest.fixture(scope="session")
 def current_client_token(admin_client: DynamicClient) -> str:
     return RedactedString(value=get_openshift_token())
@@ -395,7 +449,7 @@ def unprivileged_client(
 
             unprivileged_context = kubeconfig_content["current-context"]
 
-            unprivileged_client = get_client(config_file=kubconfig_filepath, context=unprivileged_context)
+            unprivileged_client = create_dynamic_client(config_file=kubconfig_filepath, context=unprivileged_context)
 
             # Get back to admin account
             login_with_user_password(
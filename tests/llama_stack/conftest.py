@@ -1,7 +1,6 @@
 import os
 from typing import Generator, Any, Dict
 
-import portforward
 import pytest
 from _pytest.fixtures import FixtureRequest
 from kubernetes.dynamic import DynamicClient
@@ -13,6 +12,7 @@ from ocp_resources.llama_stack_distribution import LlamaStackDistribution
 from ocp_resources.namespace import Namespace
 from simple_logger.logger import get_logger
 from utilities.general import generate_random_name
+from utilities.port_forward_utils import get_port_forward_manager
 
 
 from tests.llama_stack.utils import create_llama_stack_distribution, wait_for_llama_stack_client_ready
@@ -205,23 +205,22 @@ def llama_stack_distribution_deployment(
 def _create_llama_stack_client(
     llama_stack_distribution_deployment: Deployment,
 ) -> Generator[LlamaStackClient, Any, Any]:
+    port_forward_manager = get_port_forward_manager()
+    namespace = llama_stack_distribution_deployment.namespace
+    service_name = f"{llama_stack_distribution_deployment.name}-service"
     try:
-        with portforward.forward(
-            pod_or_service=f"{llama_stack_distribution_deployment.name}-service",
-            namespace=llama_stack_distribution_deployment.namespace,
-            from_port=8321,
-            to_port=8321,
-            waiting=15,
-        ):
-            client = LlamaStackClient(
-                base_url="http://localhost:8321",
-                timeout=120.0,
-            )
-            wait_for_llama_stack_client_ready(client=client)
-            yield client
+        local_port = port_forward_manager.get_local_port(namespace=namespace, pod_or_service=service_name, port=8321)
+        client = LlamaStackClient(
+            base_url=f"http://localhost:{local_port}",
+            timeout=120.0,
+        )
+        wait_for_llama_stack_client_ready(client=client)
+        yield client
     except Exception as e:
         LOGGER.error(f"Failed to set up port forwarding: {e}")
         raise
+    finally:
+        port_forward_manager.close_tunnel(namespace=namespace, pod_or_service=service_name, port=8321)
 
 
 @pytest.fixture(scope="class")
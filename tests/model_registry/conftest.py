@@ -1,8 +1,6 @@
 from contextlib import ExitStack
 
 import pytest
-import shlex
-import subprocess
 import os
 from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from pytest import Config
@@ -34,7 +32,7 @@ from model_registry.types import RegisteredModel
 
 from tests.model_registry.rbac.utils import wait_for_oauth_openshift_deployment
 from tests.model_registry.utils import generate_namespace_name, get_rest_headers
-from utilities.general import generate_random_name, wait_for_pods_running
+from utilities.general import generate_random_name, wait_for_namespaces_pods_running, wait_for_pods_running
 
 from tests.model_registry.constants import (
     MR_OPERATOR_NAME,
@@ -54,10 +52,15 @@ from tests.model_registry.utils import (
 from utilities.constants import DscComponents
 from model_registry import ModelRegistry as ModelRegistryClient
 from utilities.general import wait_for_pods_by_labels
-from utilities.infra import get_data_science_cluster, wait_for_dsc_status_ready, login_with_user_password
+from utilities.infra import (
+    create_inference_token,
+    get_data_science_cluster,
+    login_with_user_password,
+    wait_for_dsc_status_ready,
+)
 from utilities.user_utils import UserTestSession, wait_for_user_creation, create_htpasswd_file
 
-DEFAULT_TOKEN_DURATION = "10m"
+DEFAULT_TOKEN_DURATION: int = 600
 LOGGER = get_logger(name=__name__)
 
 
@@ -213,14 +216,9 @@ def updated_dsc_component_state_scope_session(
             ):
                 namespace = Namespace(name=py_config["model_registry_namespace"], wait_for_resource=True)
                 namespace.wait_for_status(status=Namespace.Status.ACTIVE)
-                wait_for_pods_running(
-                    admin_client=admin_client,
-                    namespace_name=py_config["applications_namespace"],
-                    number_of_consecutive_checks=6,
-                )
-                wait_for_pods_running(
+                wait_for_namespaces_pods_running(
                     admin_client=admin_client,
-                    namespace_name=py_config["model_registry_namespace"],
+                    namespace_names=[py_config["applications_namespace"], py_config["model_registry_namespace"]],
                     number_of_consecutive_checks=6,
                 )
                 yield dsc_resource
@@ -353,45 +351,10 @@ def service_account(admin_client: DynamicClient, sa_namespace: Namespace) -> Gen
 @pytest.fixture(scope="class")
 def sa_token(service_account: ServiceAccount) -> str:
     """
-    Retrieves a short-lived token for the ServiceAccount using 'oc create token'.
+    Retrieves a short-lived token for the ServiceAccount using the TokenRequest API.
     """
-    sa_name = service_account.name
-    namespace = service_account.namespace
-    LOGGER.info(f"Retrieving token for ServiceAccount: {sa_name} in namespace {namespace}")
-    try:
-        cmd = f"oc create token {sa_name} -n {namespace} --duration={DEFAULT_TOKEN_DURATION}"
-        LOGGER.debug(f"Executing command: {cmd}")
-        res, out, err = run_command(command=shlex.split(cmd), verify_stderr=False, check=True, timeout=30)
-        token = out.strip()
-        if not token:
-            raise ValueError("Retrieved token is empty after successful command execution.")
-
-        LOGGER.info(f"Successfully retrieved token for SA '{sa_name}'")
-        return token
-
-    except Exception as e:  # Catch all exceptions from the try block
-        error_type = type(e).__name__
-        log_message = (
-            f"Failed during token retrieval for SA '{sa_name}' in namespace '{namespace}'. "
-            f"Error Type: {error_type}, Message: {str(e)}"
-        )
-        if isinstance(e, subprocess.CalledProcessError):
-            # Add specific details for CalledProcessError
-            # run_command already logs the error if log_errors=True and returncode !=0,
-            # but we can add context here.
-            stderr_from_exception = e.stderr.strip() if e.stderr else "N/A"
-            log_message += f". Exit Code: {e.returncode}. Stderr from exception: {stderr_from_exception}"
-        elif isinstance(e, subprocess.TimeoutExpired):
-            timeout_value = getattr(e, "timeout", "N/A")
-            log_message += f". Command timed out after {timeout_value} seconds."
-        elif isinstance(e, FileNotFoundError):
-            # This occurs if 'oc' is not found.
-            # e.filename usually holds the name of the file that was not found.
-            command_not_found = e.filename if hasattr(e, "filename") and e.filename else shlex.split(cmd)[0]
-            log_message += f". Command '{command_not_found}' not found. Is it installed and in PATH?"
-
-        LOGGER.error(log_message, exc_info=True)  # exc_info=True adds stack trace to the log
-        raise
+    LOGGER.info(f"Retrieving token for ServiceAccount: {service_account.name} in namespace {service_account.namespace}")
+    return create_inference_token(model_service_account=service_account, expiration_seconds=DEFAULT_TOKEN_DURATION)
 
 
 @pytest.fixture(scope="class")
@@ -41,7 +41,7 @@ from tests.model_serving.model_runtime.mlserver.utils import (
 LOGGER = get_logger(name=__name__)
 
 pytestmark = pytest.mark.usefixtures(
-    "root_dir", "valid_aws_config", "mlserver_rest_serving_runtime_template", "mlserver_grpc_serving_runtime_template"
+    "valid_aws_config", "mlserver_rest_serving_runtime_template", "mlserver_grpc_serving_runtime_template"
 )
 
 
@@ -576,7 +576,6 @@ class TestMLServerModels:
         mlserver_pod_resource: Pod,
         mlserver_response_snapshot: Any,
         protocol: str,
-        root_dir: str,
         model_format: str,
     ) -> None:
         """
@@ -590,7 +589,6 @@ class TestMLServerModels:
             mlserver_pod_resource (Pod): The Kubernetes pod running the MLServer.
             mlserver_response_snapshot (Any): The expected model response for snapshot-based validation.
             protocol (str): The communication protocol to use ("rest" or "grpc").
-            root_dir (str): Path to the test root directory containing snapshots or test data.
             model_format (str): Identifier for the model framework (e.g., "sklearn", "onnx").
         """
 
@@ -611,5 +609,4 @@ class TestMLServerModels:
             model_framework=model_format,
             model_output_type=model_format_config["output_type"],
             protocol=protocol,
-            root_dir=root_dir,
         )
@@ -43,7 +43,6 @@ NON_DETERMINISTIC_OUTPUT: str = "non_deterministic"
 
 MODEL_PATH_PREFIX: str = "mlserver/model_repository"
 
-PROTO_FILE_PATH: str = "utilities/manifests/common/grpc_predict_v2.proto"
 
 REST_PROTOCOL_TYPE_DICT: dict[str, str] = {"protocol_type": Protocols.REST}
 
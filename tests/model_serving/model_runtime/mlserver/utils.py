@@ -9,19 +9,15 @@ This module provides functions for:
 """
 
 import base64
-import json
-import os
-import subprocess
 from typing import Any, Dict
 
-import portforward
+import grpc
 import requests
 from ocp_resources.inference_service import InferenceService
 
 from tests.model_serving.model_runtime.mlserver.constant import (
     MLSERVER_GRPC_REMOTE_PORT,
     LOCAL_HOST_URL,
-    PROTO_FILE_PATH,
     MLSERVER_REST_PORT,
     MLSERVER_GRPC_PORT,
     DETERMINISTIC_OUTPUT,
@@ -43,6 +39,8 @@ from tests.model_serving.model_runtime.mlserver.constant import (
     RUNTIME_NAME_MAP,
 )
 from utilities.constants import KServeDeploymentType, Protocols
+from utilities.plugins.kserve_v2_grpc_plugin import get_kserve_v2_grpc_plugin_manager
+from utilities.port_forward_utils import get_port_forward_manager, get_port_forward_target_name
 
 
 def send_rest_request(url: str, input_data: dict[str, Any], verify: bool = False) -> Any:
@@ -64,48 +62,35 @@ def send_rest_request(url: str, input_data: dict[str, Any], verify: bool = False
     return response.json()
 
 
-def send_grpc_request(url: str, input_data: dict[str, Any], root_dir: str, insecure: bool = False) -> Any:
+def send_grpc_request(url: str, input_data: dict[str, Any], insecure: bool = False, target: str = "") -> Any:
     """
-    Sends a gRPC request to the specified URL using grpcurl with the given input data.
+    Sends a gRPC ModelInfer request to the specified URL using the KServe v2 gRPC client.
 
     Args:
         url (str): The gRPC server endpoint (host:port).
         input_data (dict[str, Any]): The input payload to send, as a dictionary.
-        root_dir (str): Root directory where the .proto file is located.
-        insecure (bool, optional): Whether to disable TLS verification.
+        insecure (bool, optional): Whether to use TLS without verifying the server certificate.
                                    Defaults to False (uses plaintext).
+        target (str, optional): The port-forward target reached through `url`, the gRPC channel is shared per target.
 
     Returns:
         Any: The parsed JSON response if successful, or an error message string if the request fails.
+
+    Raises:
+        grpc.RpcError: If the server is unavailable.
     """
-    grpc_proto_path = os.path.join(root_dir, PROTO_FILE_PATH)
-    proto_import_path = os.path.dirname(grpc_proto_path)
-    input_str = json.dumps(input_data)
-    grpc_method = "inference.GRPCInferenceService/ModelInfer"
-    tls_flag = "-insecure" if insecure else "-plaintext"
-
-    args = [
-        "grpcurl",
-        tls_flag,
-        "-import-path",
-        proto_import_path,
-        "-proto",
-        grpc_proto_path,
-        "-d",
-        input_str,
-        url,
-        grpc_method,
-    ]
+    grpc_plugin = get_kserve_v2_grpc_plugin_manager().get_plugin(host=url, use_tls=insecure, target=target)
 
     try:
-        result = subprocess.run(args=args, capture_output=True, text=True, check=True)
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        return f"gRPC request failed: {e.stderr or e.stdout}"
+        return grpc_plugin.model_infer(request=input_data)
+    except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.UNAVAILABLE:
+            raise
+        return f"gRPC request failed: {e.details()}"
 
 
 def run_mlserver_inference(
-    pod_name: str, isvc: InferenceService, input_data: dict[str, Any], model_version: str, protocol: str, root_dir: str
+    pod_name: str, isvc: InferenceService, input_data: dict[str, Any], model_version: str, protocol: str
 ) -> Any:
     """
     Run inference against an MLServer-hosted model using either REST or gRPC protocol.
@@ -117,15 +102,14 @@ def run_mlserver_inference(
         input_data (dict[str, Any]): The input data payload for inference.
         model_version (str): The version of the model to target, if applicable.
         protocol (str): Protocol to use for inference ('REST' or 'GRPC').
-        root_dir (str): Root directory containing the .proto file for gRPC requests.
 
     Returns:
         Any: The inference result from the model, or an error message string.
 
     Notes:
         - REST calls expect the model to support V2 REST inference APIs.
-        - gRPC calls use `grpcurl` and require the appropriate `.proto` files.
-        - RAW deployments use port-forwarding; SERVERLESS assumes accessible endpoints.
+        - gRPC calls use the KServe v2 gRPC client generated from the `grpc_predict_v2.proto` file.
+        - RAW deployments use a session port-forward tunnel; SERVERLESS assumes accessible endpoints.
     """
     deployment_mode = isvc.instance.metadata.annotations.get("serving.kserve.io/deploymentMode")
     model_name = isvc.instance.metadata.name
@@ -139,21 +123,34 @@ def run_mlserver_inference(
 
     if deployment_mode == KServeDeploymentType.RAW_DEPLOYMENT:
         port = MLSERVER_REST_PORT if is_rest else MLSERVER_GRPC_PORT
-        with portforward.forward(pod_or_service=pod_name, namespace=isvc.namespace, from_port=port, to_port=port):
-            host = f"{LOCAL_HOST_URL}:{port}" if is_rest else get_grpc_url(base_url=LOCAL_HOST_URL, port=port)
+        port_forward_manager = get_port_forward_manager()
+        local_port = port_forward_manager.get_local_port(namespace=isvc.namespace, pod_or_service=pod_name, port=port)
+        host = f"{LOCAL_HOST_URL}:{local_port}" if is_rest else get_grpc_url(base_url=LOCAL_HOST_URL, port=local_port)
+        target = get_port_forward_target_name(namespace=isvc.namespace, pod_or_service=pod_name, port=port)
+        try:
             return (
                 send_rest_request(url=f"{host}{rest_endpoint}", input_data=input_data, verify=False)
                 if is_rest
-                else send_grpc_request(url=host, input_data=input_data, root_dir=root_dir, insecure=False)
+                else send_grpc_request(url=host, input_data=input_data, insecure=False, target=target)
             )
 
+        except requests.exceptions.ConnectionError:
+            port_forward_manager.close_tunnel(namespace=isvc.namespace, pod_or_service=pod_name, port=port)
+            raise
+
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:
+                port_forward_manager.close_tunnel(namespace=isvc.namespace, pod_or_service=pod_name, port=port)
+                get_kserve_v2_grpc_plugin_manager().close_plugin(target=target)
+            raise
+
     elif deployment_mode == KServeDeploymentType.SERVERLESS:
         base_url = isvc.instance.status.url.rstrip("/")
         if is_rest:
             return send_rest_request(url=f"{base_url}{rest_endpoint}", input_data=input_data, verify=False)
         else:
             grpc_url = get_grpc_url(base_url=base_url, port=MLSERVER_GRPC_REMOTE_PORT)
-            return send_grpc_request(url=grpc_url, input_data=input_data, root_dir=root_dir, insecure=True)
+            return send_grpc_request(url=grpc_url, input_data=input_data, insecure=True)
 
     return f"Invalid deployment_mode {deployment_mode}"
 
@@ -181,7 +178,6 @@ def validate_inference_request(
     model_framework: str,
     model_output_type: str,
     protocol: str,
-    root_dir: str,
 ) -> None:
     """
     Runs an inference request against an MLServer model and validates
@@ -194,7 +190,6 @@ def validate_inference_request(
         input_query (Any): The input data to send to the model.
         model_version (str): The version of the model to target.
         protocol (str): The protocol to use for inference ('REST' or 'GRPC').
-        root_dir (str): The root directory containing protobuf files for gRPC.
 
     Raises:
         AssertionError: If the actual response does not match the snapshot.
@@ -206,7 +201,6 @@ def validate_inference_request(
         input_data=input_query,
         model_version=model_version,
         protocol=protocol,
-        root_dir=root_dir,
     )
 
     if model_output_type == DETERMINISTIC_OUTPUT:
@@ -38,17 +38,21 @@ def fetch_tgis_response(  # type: ignore
     url: str,
     model_name: str,
     completion_query=COMPLETION_QUERY,
+    batch: bool = False,
 ) -> tuple[Any, list[Any], list[Any]]:
     completion_responses = []
     stream_completion_responses = []
-    inference_client = TGISGRPCPlugin(host=url, model_name=model_name, streaming=True)
-    model_info = inference_client.get_model_info()
-    if completion_query:
-        for query in completion_query:
-            completion_response = inference_client.make_grpc_request(query=query)
-            completion_responses.append(completion_response)
-            stream_response = inference_client.make_grpc_request_stream(query=query)
-            stream_completion_responses.append(stream_response)
+    with TGISGRPCPlugin(host=url, model_name=model_name, streaming=True) as inference_client:
+        model_info = inference_client.get_model_info()
+        if completion_query:
+            if batch:
+                completion_responses = inference_client.make_grpc_batch_request(queries=completion_query)
+            for query in completion_query:
+                if not batch:
+                    completion_response = inference_client.make_grpc_request(query=query)
+                    completion_responses.append(completion_response)
+                stream_response = inference_client.make_grpc_request_stream(query=query)
+                stream_completion_responses.append(stream_response)
     return model_info, completion_responses, stream_completion_responses
 
 
@@ -102,13 +106,13 @@ def run_audio_inference(
 
     if url is not None:
         LOGGER.info("Using provided URL for inference: %s", url)
-        inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
         completion_responses = []
-        completion_response = inference_client.request_audio(
-            endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION,
-            audio_file_path=audio_file_path,
-            model_name=model_name,
-        )
+        with OpenAIClient(host=url, model_name=model_name, streaming=True) as inference_client:
+            completion_response = inference_client.request_audio(
+                endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION,
+                audio_file_path=audio_file_path,
+                model_name=model_name,
+            )
         completion_responses.append(completion_response)
         model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
         return model_info, completion_responses
@@ -125,10 +129,14 @@ def run_audio_inference(
         ):
             if endpoint == "openai":
                 completion_responses = []
-                inference_client = OpenAIClient(host=f"http://localhost:{port}", model_name=model_name, streaming=True)
-                completion_response = inference_client.request_audio(
-                    endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION, audio_file_path=audio_file_path, model_name=model_name
-                )
+                with OpenAIClient(
+                    host=f"http://localhost:{port}", model_name=model_name, streaming=True
+                ) as inference_client:
+                    completion_response = inference_client.request_audio(
+                        endpoint=OpenAIEnpoints.AUDIO_TRANSCRIPTION,
+                        audio_file_path=audio_file_path,
+                        model_name=model_name,
+                    )
                 completion_responses.append(completion_response)
                 model_info = OpenAIClient.get_request_http(
                     host=f"http://localhost:{port}", endpoint=OpenAIEnpoints.MODELS_INFO
@@ -208,13 +216,13 @@ def fetch_openai_response(
     if completion_query is None:
         completion_query = COMPLETION_QUERY
     completion_responses = []
-    inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
-    if completion_query:
-        for query in completion_query:
-            completion_response = inference_client.request_http(
-                endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
-            )
-            completion_responses.append(completion_response)
+    with OpenAIClient(host=url, model_name=model_name, streaming=True) as inference_client:
+        if completion_query:
+            for query in completion_query:
+                completion_response = inference_client.request_http(
+                    endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
+                )
+                completion_responses.append(completion_response)
 
     model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
     return model_info, completion_responses
@@ -62,19 +62,19 @@ def fetch_openai_response(  # type: ignore
 ) -> tuple[Any, list[Any], list[Any]]:
     completion_responses = []
     chat_responses = []
-    inference_client = OpenAIClient(host=url, model_name=model_name, streaming=True)
-    if chat_query:
-        for query in chat_query:
-            chat_response = inference_client.request_http(
-                endpoint=OpenAIEnpoints.CHAT_COMPLETIONS, query=query, extra_param=tool_calling
-            )
-            chat_responses.append(chat_response)
-    if completion_query:
-        for query in COMPLETION_QUERY:
-            completion_response = inference_client.request_http(
-                endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
-            )
-            completion_responses.append(completion_response)
+    with OpenAIClient(host=url, model_name=model_name, streaming=True) as inference_client:
+        if chat_query:
+            for query in chat_query:
+                chat_response = inference_client.request_http(
+                    endpoint=OpenAIEnpoints.CHAT_COMPLETIONS, query=query, extra_param=tool_calling
+                )
+                chat_responses.append(chat_response)
+        if completion_query:
+            for query in COMPLETION_QUERY:
+                completion_response = inference_client.request_http(
+                    endpoint=OpenAIEnpoints.COMPLETIONS, query=query, extra_param={"max_tokens": 100}
+                )
+                completion_responses.append(completion_response)
 
     model_info = OpenAIClient.get_request_http(host=url, endpoint=OpenAIEnpoints.MODELS_INFO)
     return model_info, chat_responses, completion_responses
@@ -87,15 +87,15 @@ def fetch_tgis_response(  # type: ignore
 ) -> tuple[Any, list[Any], list[Any]]:
     completion_responses = []
     stream_completion_responses = []
-    inference_client = TGISGRPCPlugin(host=url, model_name=model_name, streaming=True)
-    model_info = inference_client.get_model_info()
-    if completion_query:
-        for query in COMPLETION_QUERY:
-            completion_response = inference_client.make_grpc_request(query=query)
-            completion_responses.append(completion_response)
-            stream_response = inference_client.make_grpc_request_stream(query=query)
-            completion_responses.append(completion_response)
-            stream_completion_responses.append(stream_response)
+    with TGISGRPCPlugin(host=url, model_name=model_name, streaming=True) as inference_client:
+        model_info = inference_client.get_model_info()
+        if completion_query:
+            for query in COMPLETION_QUERY:
+                completion_response = inference_client.make_grpc_request(query=query)
+                completion_responses.append(completion_response)
+                stream_response = inference_client.make_grpc_request_stream(query=query)
+                completion_responses.append(completion_response)
+                stream_completion_responses.append(stream_response)
     return model_info, completion_responses, stream_completion_responses
 
 
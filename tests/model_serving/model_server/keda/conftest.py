@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any, Generator
 
 import pytest
@@ -103,6 +104,7 @@ def stressed_keda_vllm_inference_service(
     supported_accelerator_type: str,
     s3_models_storage_uri: str,
     model_service_account: ServiceAccount,
+    load_reports_dir: Path,
 ) -> Generator[InferenceService, Any, Any]:
     isvc_kwargs = {
         "client": admin_client,
@@ -153,11 +155,11 @@ def stressed_keda_vllm_inference_service(
 
     with create_isvc(**isvc_kwargs) as isvc:
         isvc.wait_for_condition(condition=isvc.Condition.READY, status="True")
-        run_concurrent_load_for_keda_scaling(
+        load_report = run_concurrent_load_for_keda_scaling(
             isvc=isvc,
             inference_config=VLLM_INFERENCE_CONFIG,
-            response_snapshot=response_snapshot,
         )
+        load_report.write_json(path=load_reports_dir / f"{request.node.name}-{isvc.name}.json")
         yield isvc
 
 
@@ -43,3 +43,14 @@ class TestONNXServerless:
             protocol=Protocols.HTTPS,
             use_default_query=True,
         )
+
+    @pytest.mark.jira("RHOAIENG-9045")
+    def test_serverless_onnx_rest_binary_inference(self, ovms_kserve_inference_service):
+        """Verify that kserve Serverless ONNX model can be queried using REST with binary tensor data"""
+        verify_inference_response(
+            inference_service=ovms_kserve_inference_service,
+            inference_config=ONNX_INFERENCE_CONFIG,
+            inference_type=Inference.INFER_BINARY,
+            protocol=Protocols.HTTPS,
+            use_default_query=True,
+        )
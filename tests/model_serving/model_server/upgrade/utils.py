@@ -5,6 +5,8 @@ from pytest_testconfig import config as py_config
 
 from utilities.exceptions import PodContainersRestartError, ResourceMismatchError
 from utilities.infra import get_inference_serving_runtime
+from utilities.pod_health import classify_pods_health
+from utilities.resource_watch import get_resource_api
 
 
 def verify_pod_containers_not_restarted(client: DynamicClient, component_name: str) -> None:
@@ -19,17 +21,16 @@ def verify_pod_containers_not_restarted(client: DynamicClient, component_name: s
         AssertionError: If pod containers are restarted
 
     """
-    restarted_containers = {}
-
-    for pod in Pod.get(
-        dyn_client=client,
+    pods = get_resource_api(client=client, resource_class=Pod).get(
         namespace=py_config["applications_namespace"],
         label_selector=f"{Pod.ApiGroup.APP_KUBERNETES_IO}/part-of={component_name}",
-    ):
-        if _restarted_containers := [
-            container.name for container in pod.instance.status.containerStatuses if container.restartCount > 0
-        ]:
-            restarted_containers[pod.name] = _restarted_containers
+    )
+
+    restarted_containers = {
+        pod_health.name: pod_health.restarted_containers
+        for pod_health in classify_pods_health(pods=pods.items)
+        if pod_health.restarted_containers
+    }
 
     if restarted_containers:
         raise PodContainersRestartError(f"Containers {restarted_containers} restarted")
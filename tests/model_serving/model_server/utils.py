@@ -1,7 +1,5 @@
 import json
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed, wait
-from string import Template
 from typing import Any, Optional
 from kubernetes.dynamic import DynamicClient
 
@@ -14,11 +12,13 @@ from utilities.exceptions import (
     InferenceResponseError,
 )
 from utilities.constants import Timeout
+from utilities.inference_config_registry import get_inference_config_registry
 from utilities.inference_utils import UserInference
 from utilities.infra import get_pods_by_isvc_label
+from utilities.load_generator import LoadMode, LoadReport, constant_load, run_inference_load
 from tests.model_serving.model_server.keda.utils import get_isvc_keda_scaledobject
 from utilities.constants import Protocols
-from timeout_sampler import TimeoutWatch, TimeoutSampler
+from timeout_sampler import TimeoutSampler
 
 LOGGER = get_logger(name=__name__)
 
@@ -74,6 +74,49 @@ def verify_inference_response(
         insecure=insecure,
     )
 
+    verify_inference_output(
+        inference=inference,
+        res=res,
+        inference_type=inference_type,
+        model_name=model_name,
+        use_default_query=use_default_query,
+        expected_response_text=expected_response_text,
+        token=token,
+        authorized_user=authorized_user,
+    )
+
+
+def verify_inference_output(
+    inference: UserInference,
+    res: dict[str, Any],
+    inference_type: str,
+    model_name: str,
+    use_default_query: bool = False,
+    expected_response_text: Optional[str] = None,
+    token: Optional[str] = None,
+    authorized_user: Optional[bool] = None,
+) -> None:
+    """
+    Verify the output of an inference request.
+
+    Args:
+        inference (UserInference): Inference object used to send the request.
+        res (dict[str, Any]): Inference response dict.
+        inference_type (str): Inference type.
+        model_name (str): Model name.
+        use_default_query (bool): Use default query or not.
+        expected_response_text (str): Expected response text.
+        token (str): Token.
+        authorized_user (bool): Authorized user.
+
+    Raises:
+        InvalidInferenceResponseError: If inference response is invalid.
+        ValidationError: If inference response is invalid.
+
+    """
+    inference_service = inference.inference_service
+    inference_config = inference.inference_config
+
     if authorized_user is False:
         auth_header = "x-ext-auth-reason"
 
@@ -100,41 +143,21 @@ def verify_inference_response(
             raise ValueError(f"Auth header {auth_header} not found in response. Response: {res['output']}")
 
     else:
-        use_regex = False
+        expected_response_pattern: Optional[re.Pattern[str]] = None
 
         if use_default_query:
-            expected_response_text_config: dict[str, Any] = inference.inference_config.get("default_query_model", {})
-            use_regex = expected_response_text_config.get("use_regex", False)
-
-            if not expected_response_text_config:
-                raise ValueError(
-                    f"Missing default_query_model config for inference {inference_config}. "
-                    f"Config: {expected_response_text_config}"
-                )
-
-            if inference.inference_config.get("support_multi_default_queries"):
-                query_config = expected_response_text_config.get(inference_type)
-                if not query_config:
-                    raise ValueError(
-                        f"Missing default_query_model config for inference {inference_config}. "
-                        f"Config: {expected_response_text_config}"
-                    )
-                expected_response_text = query_config.get("query_output", "")
-                use_regex = query_config.get("use_regex", False)
-
-            else:
-                expected_response_text = expected_response_text_config.get("query_output")
+            default_query = (
+                get_inference_config_registry()
+                .get(inference_config=inference_config)
+                .get_default_query(inference_type=inference_type)
+            )
+            expected_response_text = default_query.get_expected_output(model_name=model_name)
 
             if not expected_response_text:
                 raise ValueError(f"Missing response text key for inference {inference_config}")
 
-            if isinstance(expected_response_text, str):
-                expected_response_text = Template(expected_response_text).safe_substitute(model_name=model_name)
-
-            elif isinstance(expected_response_text, dict):
-                expected_response_text = Template(expected_response_text.get("response_output")).safe_substitute(
-                    model_name=model_name
-                )
+            if default_query.use_regex:
+                expected_response_pattern = default_query.get_expected_output_pattern(model_name=model_name)
 
         if inference.inference_response_text_key_name:
             if inference_type == inference.STREAMING:
@@ -147,10 +170,10 @@ def verify_inference_response(
                         f"Expected: {expected_response_text} does not match response: {output}"
                     )
 
-            elif inference_type == inference.INFER or use_regex:
+            elif inference_type == inference.INFER or expected_response_pattern:
                 formatted_res = json.dumps(res[inference.inference_response_text_key_name]).replace(" ", "")
-                if use_regex:
-                    assert re.search(expected_response_text, formatted_res), (  # type: ignore[arg-type]  # noqa: E501
+                if expected_response_pattern:
+                    assert expected_response_pattern.search(formatted_res), (
                         f"Expected: {expected_response_text} not found in: {formatted_res}"
                     )
 
@@ -203,32 +226,49 @@ def run_inference_multiple_times(
         run_in_parallel (bool, optional): Run inference in parallel.
 
     """
-    futures = []
-
-    with ThreadPoolExecutor() as executor:
-        for iteration in range(iterations):
-            infer_kwargs = {
-                "inference_service": isvc,
-                "inference_config": inference_config,
-                "inference_type": inference_type,
-                "protocol": protocol,
-                "model_name": model_name,
-                "use_default_query": True,
-            }
-
-            if run_in_parallel:
-                futures.append(executor.submit(verify_inference_response, **infer_kwargs))
-            else:
-                verify_inference_response(**infer_kwargs)
+    model_name = model_name or isvc.name
 
-        if futures:
-            exceptions = []
-            for result in as_completed(futures):
-                if _exception := result.exception():
-                    exceptions.append(_exception)
+    inference = UserInference(
+        inference_service=isvc,
+        inference_config=inference_config,
+        inference_type=inference_type,
+        protocol=protocol,
+    )
 
-            if exceptions:
-                raise InferenceResponseError(f"Failed to run inference. Error: {exceptions}")
+    if run_in_parallel:
+        exceptions = []
+        for result in inference.run_inference_many(
+            model_name=model_name,
+            inference_inputs=[None] * iterations,
+            use_default_query=True,
+        ):
+            try:
+                if result.error:
+                    raise result.error
+
+                verify_inference_output(
+                    inference=inference,
+                    res=result.response,
+                    inference_type=inference_type,
+                    model_name=model_name,
+                    use_default_query=True,
+                )
+
+            except Exception as ex:
+                exceptions.append(ex)
+
+        if exceptions:
+            raise InferenceResponseError(f"Failed to run inference. Error: {exceptions}")
+
+    else:
+        for _ in range(iterations):
+            verify_inference_output(
+                inference=inference,
+                res=inference.run_inference_flow(model_name=model_name, use_default_query=True),
+                inference_type=inference_type,
+                model_name=model_name,
+                use_default_query=True,
+            )
 
 
 def verify_keda_scaledobject(
@@ -268,7 +308,7 @@ def run_concurrent_load_for_keda_scaling(
     inference_config: dict[str, Any],
     num_concurrent: int = 5,
     duration: int = 120,
-) -> None:
+) -> LoadReport:
     """
     Run a concurrent load to test the keda scaling functionality.
 
@@ -277,23 +317,25 @@ def run_concurrent_load_for_keda_scaling(
         inference_config: Inference config
         num_concurrent: Number of concurrent requests
         duration: Duration in seconds to run the load test
+
+    Returns:
+        LoadReport: load report with latency percentiles, error rate and throughput
     """
+    inference = UserInference(
+        inference_service=isvc,
+        inference_config=inference_config,
+        inference_type="completions",
+        protocol=Protocols.HTTPS,
+    )
 
-    def _make_request() -> None:
-        verify_inference_response(
-            inference_service=isvc,
-            inference_config=inference_config,
-            inference_type="completions",
-            protocol=Protocols.HTTPS,
-            use_default_query=True,
+    with inference.inference_request_sender(model_name=isvc.name, use_default_query=True) as send_request:
+        return run_inference_load(
+            send_request=send_request,
+            stages=constant_load(target=num_concurrent, duration=duration),
+            mode=LoadMode.CONCURRENCY,
+            name=f"{isvc.name}-keda-scaling",
         )
 
-    timeout_watch = TimeoutWatch(timeout=duration)
-    with ThreadPoolExecutor(max_workers=num_concurrent) as executor:
-        while timeout_watch.remaining_time() > 0:
-            futures = [executor.submit(_make_request) for _ in range(num_concurrent)]
-            wait(fs=futures)
-
 
 def inference_service_pods_sampler(
     client: DynamicClient, isvc: InferenceService, timeout: int, sleep: int = 1
@@ -301,6 +343,8 @@ def inference_service_pods_sampler(
     """
     Returns TimeoutSampler for inference service.
 
+    Pods are served from the namespace pod informer cache, so sampling does not LIST pods on every iteration.
+
     Args:
         client (DynamicClient): DynamicClient object
         isvc (InferenceService): InferenceService object
@@ -0,0 +1,177 @@
+from typing import Any, Optional
+
+import pytest
+from kubernetes.dynamic.resource import ResourceInstance
+
+from utilities.exceptions import FailedPodsError
+from utilities.pod_health import PodHealthClass, are_pods_ready, classify_pod_health
+
+
+def get_pod_snapshot(
+    name: str = "pod",
+    phase: str = "Running",
+    ready: bool = False,
+    container_state: Optional[dict[str, Any]] = None,
+    restart_count: int = 0,
+    deleted: bool = False,
+    reason: str = "",
+) -> ResourceInstance:
+    """Pod snapshot as returned by a pods LIST, with a single container"""
+    metadata: dict[str, Any] = {"name": name}
+    if deleted:
+        metadata["deletionTimestamp"] = "2025-01-01T00:00:00Z"
+
+    status: dict[str, Any] = {
+        "phase": phase,
+        "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+        "containerStatuses": [
+            {"name": "main", "restartCount": restart_count, "state": container_state or {"running": {}}}
+        ],
+    }
+    if reason:
+        status["reason"] = reason
+
+    return ResourceInstance(client=None, instance={"kind": "Pod", "metadata": metadata, "status": status})
+
+
+def waiting(reason: str) -> dict[str, Any]:
+    return {"waiting": {"reason": reason}}
+
+
+def terminated(reason: str) -> dict[str, Any]:
+    return {"terminated": {"reason": reason}}
+
+
+@pytest.mark.parametrize(
+    "pod, health_class, reason",
+    [
+        pytest.param(get_pod_snapshot(ready=True), PodHealthClass.READY, "Running", id="ready"),
+        pytest.param(get_pod_snapshot(), PodHealthClass.NOT_READY, "Running", id="not-ready"),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state=waiting(reason="ContainerCreating")),
+            PodHealthClass.PULLING,
+            "ContainerCreating",
+            id="pulling-container-creating",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state={}),
+            PodHealthClass.PULLING,
+            "Pending",
+            id="pulling-pending",
+        ),
+        pytest.param(
+            get_pod_snapshot(container_state=waiting(reason="CrashLoopBackOff"), restart_count=3),
+            PodHealthClass.CRASHLOOP,
+            "CrashLoopBackOff",
+            id="crashloop-waiting",
+        ),
+        pytest.param(
+            get_pod_snapshot(container_state=terminated(reason="CrashLoopBackOff"), restart_count=3),
+            PodHealthClass.CRASHLOOP,
+            "CrashLoopBackOff",
+            id="crashloop-terminated",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state=waiting(reason="InvalidImageName")),
+            PodHealthClass.IMAGE_ERROR,
+            "InvalidImageName",
+            id="image-error-invalid-image-name",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state=waiting(reason="ErrImageNeverPull")),
+            PodHealthClass.IMAGE_ERROR,
+            "ErrImageNeverPull",
+            id="image-error-never-pull",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state=waiting(reason="ImagePullBackOff")),
+            PodHealthClass.IMAGE_PULL_BACKOFF,
+            "ImagePullBackOff",
+            id="image-pull-backoff",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Pending", container_state=waiting(reason="ErrImagePull")),
+            PodHealthClass.IMAGE_PULL_BACKOFF,
+            "ErrImagePull",
+            id="image-pull-backoff-err-image-pull",
+        ),
+        pytest.param(
+            get_pod_snapshot(container_state=terminated(reason="Error")),
+            PodHealthClass.TERMINATED,
+            "Error",
+            id="terminated-container-error",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Failed", reason="Evicted"),
+            PodHealthClass.TERMINATED,
+            "Evicted",
+            id="terminated-pod-failed",
+        ),
+        pytest.param(
+            get_pod_snapshot(ready=True, deleted=True),
+            PodHealthClass.TERMINATING,
+            "Running",
+            id="terminating",
+        ),
+        pytest.param(
+            get_pod_snapshot(phase="Succeeded", container_state=terminated(reason="Completed")),
+            PodHealthClass.COMPLETED,
+            "Succeeded",
+            id="completed",
+        ),
+    ],
+)
+def test_classify_pod_health(pod: ResourceInstance, health_class: str, reason: str) -> None:
+    pod_health = classify_pod_health(pod=pod)
+
+    assert pod_health.name == "pod"
+    assert pod_health.health_class == health_class
+    assert pod_health.reason == reason
+
+
+def test_classify_pod_health_restarted_containers() -> None:
+    assert classify_pod_health(pod=get_pod_snapshot(ready=True, restart_count=1)).restarted_containers == ["main"]
+    assert not classify_pod_health(pod=get_pod_snapshot(ready=True)).restarted_containers
+
+
+class TestArePodsReady:
+    def test_all_pods_ready(self) -> None:
+        assert are_pods_ready(pods=[get_pod_snapshot(name="a", ready=True), get_pod_snapshot(name="b", ready=True)])
+
+    def test_no_pods(self) -> None:
+        assert not are_pods_ready(pods=[])
+
+    def test_pod_not_ready(self) -> None:
+        assert not are_pods_ready(
+            pods=[
+                get_pod_snapshot(name="a", ready=True),
+                get_pod_snapshot(name="b", phase="Pending", container_state=waiting(reason="ContainerCreating")),
+            ]
+        )
+
+    def test_failed_pod(self) -> None:
+        with pytest.raises(FailedPodsError) as exc_info:
+            are_pods_ready(
+                pods=[
+                    get_pod_snapshot(name="a", ready=True),
+                    get_pod_snapshot(name="b", container_state=waiting(reason="CrashLoopBackOff")),
+                ]
+            )
+
+        assert exc_info.value.pods == {"b": "CrashLoopBackOff"}
+
+    def test_image_pull_backoff_not_failed_by_default(self) -> None:
+        assert not are_pods_ready(pods=[get_pod_snapshot(container_state=waiting(reason="ImagePullBackOff"))])
+
+    def test_failed_classes_override(self) -> None:
+        image_pull_backoff_pod = get_pod_snapshot(container_state=waiting(reason="ImagePullBackOff"))
+        crashloop_pod = get_pod_snapshot(name="crashloop", container_state=waiting(reason="CrashLoopBackOff"))
+
+        with pytest.raises(FailedPodsError) as exc_info:
+            are_pods_ready(
+                pods=[image_pull_backoff_pod],
+                failed_classes=PodHealthClass.FAILED_CLASSES + (PodHealthClass.IMAGE_PULL_BACKOFF,),
+            )
+
+        assert exc_info.value.pods == {"pod": "ImagePullBackOff"}
+        assert not are_pods_ready(pods=[crashloop_pod], failed_classes=(PodHealthClass.IMAGE_ERROR,))
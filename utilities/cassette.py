@@ -0,0 +1,226 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from collections import defaultdict
+from functools import cache
+from typing import Any, Callable
+
+from pytest_testconfig import config as py_config
+from simple_logger.logger import get_logger
+
+from utilities.exceptions import CassetteEntryNotFoundError
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_CASSETTE_PATH: str = "inference-cassette.zip"
+
+
+class CassetteMode:
+    OFF: str = "off"
+    RECORD: str = "record"
+    REPLAY: str = "replay"
+    ALL_MODES: tuple[str, ...] = (OFF, RECORD, REPLAY)
+
+
+class CassetteKind:
+    OPENAI: str = "openai"
+    TGIS_GRPC: str = "tgis-grpc"
+    INFERENCE: str = "inference"
+
+
+def get_worker_cassette_path(path: str) -> str:
+    """
+    Get the cassette file recorded by the current process.
+
+    Each pytest-xdist worker records to its own file, suffixed with the worker id, so workers never write
+    to the same zip file.
+
+    Args:
+        path (str): cassette file path
+
+    Returns:
+        str: cassette file path of the current process
+
+    """
+    if worker_id := os.environ.get("PYTEST_XDIST_WORKER"):
+        root, ext = os.path.splitext(path)
+        return f"{root}-{worker_id}{ext}"
+
+    return path
+
+
+def get_cassette_files(path: str) -> list[str]:
+    """
+    Get the existing cassette files of a cassette, recorded by a single process or by pytest-xdist workers.
+
+    Args:
+        path (str): cassette file path
+
+    Returns:
+        list[str]: cassette file paths
+
+    """
+    root, ext = os.path.splitext(path)
+    worker_files = sorted(glob.glob(f"{glob.escape(root)}-gw*{ext}"))
+
+    return ([path] if os.path.exists(path) else []) + worker_files
+
+
+def remove_cassette_files(path: str) -> None:
+    """
+    Remove the cassette files of a previous recording, so they are not replayed with the new one.
+
+    Args:
+        path (str): cassette file path
+
+    """
+    for cassette_file in get_cassette_files(path=path):
+        LOGGER.info(f"Removing cassette file {cassette_file}")
+        os.remove(cassette_file)
+
+
+class Cassette:
+    """
+    Records inference client responses to a cassette file and replays them without sending any request.
+
+    The cassette is a zip file with one deflated JSON member per response, so responses are read lazily
+    through the zip central directory. A member is named by the digest of the request (client kind, target and
+    request payload) and the occurrence of the request, so identical requests replay their own responses
+    in the recorded order.
+    Under pytest-xdist each worker records to its own file (see `get_worker_cassette_path`); a response is
+    replayed from the first cassette file which has it, so the run can be replayed with any number of workers.
+    Occurrences are counted per process, requests sent more than once should be sent from the same test.
+    Recorded responses are the values returned by the clients, streaming responses keep every received
+    chunk with its arrival time so stream timings are replayed as recorded.
+    """
+
+    def __init__(self, mode: str = CassetteMode.OFF, path: str = DEFAULT_CASSETTE_PATH) -> None:
+        """
+        Args:
+            mode (str): cassette mode, one of `CassetteMode`
+            path (str): cassette file path
+
+        Raises:
+            ValueError: If the mode is not supported
+        """
+        if mode not in CassetteMode.ALL_MODES:
+            raise ValueError(f"Cassette mode {mode} is not supported, supported modes: {CassetteMode.ALL_MODES}")
+
+        self.mode = mode
+        self.path = path
+        self._zip_files: list[zipfile.ZipFile] = []
+        self._occurrences: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_digest(kind: str, target: str, request: Any) -> str:
+        """
+        Get the digest of a request, used to name its cassette members.
+
+        Args:
+            kind (str): client kind, one of `CassetteKind`
+            target (str): request target which does not change between runs, e.g. endpoint or model name
+            request (Any): JSON serializable request payload
+
+        Returns:
+            str: request digest
+
+        """
+        request_json = json.dumps([kind, target, request], sort_keys=True, default=str)
+        return hashlib.sha256(request_json.encode()).hexdigest()[:32]
+
+    def _open(self) -> list[zipfile.ZipFile]:
+        if not self._zip_files:
+            if self.mode == CassetteMode.RECORD:
+                cassette_file = get_worker_cassette_path(path=self.path)
+                LOGGER.info(f"Recording inference responses to cassette {cassette_file}")
+                self._zip_files = [zipfile.ZipFile(file=cassette_file, mode="w", compression=zipfile.ZIP_DEFLATED)]
+
+            else:
+                if not (cassette_files := get_cassette_files(path=self.path)):
+                    raise FileNotFoundError(f"Cassette {self.path} not found")
+
+                LOGGER.info(f"Replaying inference responses from cassette files {cassette_files}")
+                self._zip_files = [zipfile.ZipFile(file=cassette_file, mode="r") for cassette_file in cassette_files]
+
+        return self._zip_files
+
+    def play(self, kind: str, target: str, request: Any, send: Callable[[], Any]) -> Any:
+        """
+        Get the response of a request; the request is sent unless the cassette is replayed.
+
+        Args:
+            kind (str): client kind, one of `CassetteKind`
+            target (str): request target which does not change between runs, e.g. endpoint or model name
+            request (Any): JSON serializable request payload
+            send (Callable): sends the request and returns its JSON serializable response
+
+        Returns:
+            Any: response, recorded if the cassette is recorded
+
+        Raises:
+            CassetteEntryNotFoundError: If the cassette is replayed and the response was not recorded
+
+        """
+        if self.mode == CassetteMode.OFF:
+            return send()
+
+        digest = self.request_digest(kind=kind, target=target, request=request)
+
+        if self.mode == CassetteMode.REPLAY:
+            with self._lock:
+                member_name = f"{digest}-{self._occurrences[digest]}.json"
+                self._occurrences[digest] += 1
+
+                for zip_file in self._open():
+                    try:
+                        return json.loads(zip_file.read(name=member_name))["response"]
+
+                    except KeyError:
+                        continue
+
+                raise CassetteEntryNotFoundError(
+                    f"{kind} request to {target} not recorded in cassette {self.path}: {member_name}"
+                )
+
+        response = send()
+
+        with self._lock:
+            member_name = f"{digest}-{self._occurrences[digest]}.json"
+            self._occurrences[digest] += 1
+            self._open()[0].writestr(
+                zinfo_or_arcname=member_name,
+                data=json.dumps(
+                    {"kind": kind, "target": target, "request": request, "response": response}, default=str
+                ),
+            )
+
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            for zip_file in self._zip_files:
+                zip_file.close()
+
+            self._zip_files.clear()
+
+            self._occurrences.clear()
+
+
+@cache
+def get_cassette() -> Cassette:
+    """
+    Get the process-wide inference cassette, set with the `--cassette-mode` and `--cassette-path` options.
+
+    Returns:
+        Cassette: inference cassette
+
+    """
+    cassette_config = py_config.get("cassette", {})
+    return Cassette(
+        mode=cassette_config.get("mode", CassetteMode.OFF),
+        path=cassette_config.get("path", DEFAULT_CASSETTE_PATH),
+    )
@@ -1,5 +1,6 @@
 import base64
 import os
+import ssl
 from functools import cache
 
 from kubernetes.dynamic import DynamicClient
@@ -19,6 +20,25 @@ from utilities.infra import is_managed_cluster, is_self_managed_operator
 LOGGER = get_logger(name=__name__)
 
 
+@cache
+def get_server_certificate(host: str, port: int) -> str:
+    """
+    Get the certificate a server presents, fetched once per host and port for the whole process
+
+    Used to trust a server certificate as is, like `grpcurl -insecure`.
+
+    Args:
+        host (str): server host
+        port (int): server port
+
+    Returns:
+        str: PEM-encoded server certificate
+
+    """
+    LOGGER.info(f"Fetching server certificate of {host}:{port}")
+    return ssl.get_server_certificate(addr=(host, port))
+
+
 def create_ca_bundle_file(client: DynamicClient, ca_type: str) -> str:
     """
     Creates a ca bundle file from a secret
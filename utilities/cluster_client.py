@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from functools import cache
+from typing import Any
+
+from kubernetes.client import ApiClient, VersionApi
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.discovery import DISCOVERY_PREFIX, CacheEncoder, LazyDiscoverer
+from ocp_resources.resource import get_client
+from pytest_testconfig import config as py_config
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+DISCOVERY_CACHE_DIR_NAME: str = "discovery-cache"
+
+
+def get_discovery_cache_file(api_client: ApiClient) -> str:
+    """
+    Get the API discovery cache file of a cluster, under the pytest base temp dir of the run, which is shared by
+    all pytest-xdist workers.
+
+    The file is keyed by the cluster URL and the server version, so a cache is never used after a cluster upgrade.
+
+    Args:
+        api_client (ApiClient): cluster API client
+
+    Returns:
+        str: API discovery cache file path
+
+    """
+    server_version = VersionApi(api_client=api_client).get_code().git_version
+    cache_id = hashlib.sha256(f"{api_client.configuration.host}|{server_version}".encode()).hexdigest()[:16]
+    cache_dir = os.path.join(py_config.get("run_tmp_base_dir") or tempfile.gettempdir(), DISCOVERY_CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return os.path.join(cache_dir, f"discovery-{cache_id}.json")
+
+
+class PersistentLazyDiscoverer(LazyDiscoverer):
+    """
+    Lazy API discoverer with a cache file shared by all the processes of a run, e.g. pytest-xdist workers.
+
+    API groups resources are discovered on first use and written to the cache file. A lookup of an unknown
+    resource kind refreshes the API groups list and the resources of the looked up group only, instead of
+    discovering the whole cluster again. The cache file is replaced atomically, so concurrent writers never
+    leave a partial file.
+    """
+
+    def __init__(self, client: DynamicClient, cache_file: str) -> None:
+        """
+        Args:
+            client (DynamicClient): DynamicClient object
+            cache_file (str): API discovery cache file path
+        """
+        self.cache_file = cache_file
+        self._missed_search: dict[str, Any] | None = None
+        self._lock = threading.RLock()
+        super().__init__(client, cache_file)
+
+    def _write_cache(self) -> None:
+        temp_file = f"{self.cache_file}.{os.getpid()}.{threading.get_ident()}"
+
+        try:
+            with open(temp_file, "w") as fd:
+                json.dump(self._cache, fd, cls=CacheEncoder)
+
+            os.replace(temp_file, self.cache_file)
+
+        except (OSError, TypeError, ValueError) as ex:
+            LOGGER.warning(f"Failed to write API discovery cache {self.cache_file}: {ex}")
+
+    def search(self, **kwargs: Any) -> list[Any]:
+        with self._lock:
+            self._missed_search = kwargs
+            try:
+                return super().search(**kwargs)
+
+            finally:
+                self._missed_search = None
+
+    def invalidate_cache(self) -> None:
+        # Called by the lazy discoverer on a search miss, and when the cache file cannot be used
+        if self._missed_search is None:
+            super().invalidate_cache()
+            return
+
+        group = self._missed_search.get("group")
+        if not group and "/" in (api_version := self._missed_search.get("api_version") or ""):
+            group = api_version.split("/")[0]
+
+        LOGGER.info(f"API discovery cache miss for {self._missed_search}, refreshing API group {group or 'list'}")
+        if group:
+            self._cache.get("resources", {}).get(DISCOVERY_PREFIX, {}).pop(group, None)
+
+        self.parse_api_groups(request_resources=False, update=True)
+
+
+def create_dynamic_client(**kwargs: Any) -> DynamicClient:
+    """
+    Create a client with a persistent API discovery cache.
+
+    Args:
+        **kwargs: `ocp_resources.resource.get_client` arguments, e.g. `config_file` and `context`
+
+    Returns:
+        DynamicClient: DynamicClient object
+
+    """
+    client = get_client(**kwargs)
+
+    if not isinstance(client, DynamicClient):
+        return client
+
+    cache_file = get_discovery_cache_file(api_client=client.client)
+    LOGGER.info(f"Using API discovery cache {cache_file}")
+
+    return DynamicClient(client=client.client, cache_file=cache_file, discoverer=PersistentLazyDiscoverer)
+
+
+@cache
+def get_cluster_client() -> DynamicClient:
+    """
+    Get the process-wide client of the current kubeconfig context, created on first use.
+
+    Returns:
+        DynamicClient: DynamicClient object
+
+    """
+    return create_dynamic_client()
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.pod import Pod
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+
+from utilities.pod_health import classify_pod_health
+from utilities.resource_watch import WATCH_TRANSIENT_EXCEPTIONS, get_resource_api
+
+LOGGER = get_logger(name=__name__)
+
+# Completed pods are always healthy, they are filtered out by the API server.
+# Running pods are still listed: a Running pod may be in CrashLoopBackOff or marked for deletion.
+HEALTH_SCAN_FIELD_SELECTOR: str = f"status.phase!={Pod.Status.SUCCEEDED}"
+HEALTH_SCAN_TIMEOUT: int = 180
+HEALTH_SCAN_SLEEP: int = 5
+
+
+def get_not_running_pods(pods: Iterable[ResourceInstance]) -> list[dict[str, str]]:
+    """
+    Get the pods of a pods snapshot that are not running.
+
+    Pods marked for deletion are not running, so a pod that replaces a deleted pod is not ignored.
+
+    Args:
+        pods (Iterable[ResourceInstance]): pod snapshots, e.g. the items of a pods LIST
+
+    Returns:
+        list[dict[str, str]]: pod name to not running reason, for each not running pod
+
+    """
+    return [
+        {pod_health.name: pod_health.reason}
+        for pod_health in map(classify_pod_health, pods)
+        if not pod_health.is_running
+    ]
+
+
+class ClusterHealthScanner:
+    """
+    Scans the pods of namespaces for pods that are not running.
+
+    Every scan lists each namespace once, so pods created since the previous scan, e.g. replacements of
+    deleted pods, are always evaluated. Namespaces are listed concurrently.
+    """
+
+    def __init__(
+        self,
+        client: DynamicClient,
+        namespaces: list[str],
+        field_selector: str = HEALTH_SCAN_FIELD_SELECTOR,
+    ) -> None:
+        """
+        Args:
+            client (DynamicClient): DynamicClient object
+            namespaces (list[str]): scanned namespaces
+            field_selector (str): field selector of the listed pods
+        """
+        self.client = client
+        self.namespaces = namespaces
+        self.field_selector = field_selector
+        self._pod_api = get_resource_api(client=client, resource_class=Pod)
+
+    def scan_namespace(self, namespace: str) -> list[dict[str, str]]:
+        """
+        Scan the pods of a namespace.
+
+        Args:
+            namespace (str): namespace
+
+        Returns:
+            list[dict[str, str]]: pod name to not running reason, for each not running pod
+
+        """
+        return get_not_running_pods(
+            pods=self._pod_api.get(namespace=namespace, field_selector=self.field_selector or None).items
+        )
+
+    def scan(self) -> dict[str, list[dict[str, str]]]:
+        """
+        Scan the pods of all the namespaces.
+
+        Returns:
+            dict[str, list[dict[str, str]]]: namespace to its not running pods, for namespaces with not running pods
+
+        """
+        if len(self.namespaces) == 1:
+            results = [self.scan_namespace(namespace=self.namespaces[0])]
+
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.namespaces)) as executor:
+                results = list(executor.map(self.scan_namespace, self.namespaces))
+
+        return {namespace: pods for namespace, pods in zip(self.namespaces, results) if pods}
+
+    def wait_for_pods_running(
+        self,
+        number_of_consecutive_checks: int = 1,
+        timeout: int = HEALTH_SCAN_TIMEOUT,
+        sleep: int = HEALTH_SCAN_SLEEP,
+    ) -> bool | None:
+        """
+        Wait for all pods of the namespaces to reach Running/Completed state.
+
+        Args:
+            number_of_consecutive_checks (int): number of consecutive scans without not running pods
+            timeout (int): time to wait in seconds
+            sleep (int): seconds between scans
+
+        Returns:
+            bool | None: True if all pods are running, None if the wait timed out between consecutive checks
+
+        Raises:
+            TimeoutExpiredError: If pods are not running when the wait times out
+
+        """
+        samples = TimeoutSampler(
+            wait_timeout=timeout,
+            sleep=sleep,
+            func=self.scan,
+            exceptions_dict={exception: [] for exception in WATCH_TRANSIENT_EXCEPTIONS},
+        )
+        sample = None
+        try:
+            current_check = 0
+            for sample in samples:
+                if not sample:
+                    current_check += 1
+                    if current_check >= number_of_consecutive_checks:
+                        return True
+                else:
+                    current_check = 0
+        except TimeoutExpiredError:
+            if sample:
+                LOGGER.error(
+                    f"timeout waiting for all pods in namespaces {self.namespaces} to reach "
+                    f"running state, following pods are in not running state: {sample}"
+                )
+                raise
+        return None
@@ -136,3 +136,7 @@ class MissingParameter(Exception):
 
 class ExceptionUserLogin(Exception):
     pass
+
+
+class CassetteEntryNotFoundError(Exception):
+    """Response not recorded in the inference cassette"""
@@ -1,6 +1,6 @@
 import base64
 import re
-from typing import List, Tuple, Any
+from typing import List, Tuple
 import uuid
 
 from kubernetes.dynamic import DynamicClient
@@ -13,9 +13,10 @@ from simple_logger.logger import get_logger
 import utilities.infra
 from utilities.constants import Annotations, KServeDeploymentType, MODELMESH_SERVING, Timeout
 from utilities.exceptions import UnexpectedResourceCountError, ResourceValueMismatch
+from utilities.cluster_health import ClusterHealthScanner
+from utilities.pod_informer import get_pod_informer_manager
 from ocp_resources.resource import Resource
 from timeout_sampler import retry
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 # Constants for image validation
 SHA256_DIGEST_PATTERN = r"@sha256:[a-f0-9]{64}$"
@@ -246,13 +247,7 @@ def wait_for_pods_by_labels(
     Raises:
         ResourceNotFoundError: If no pods are found
     """
-    pods = list(
-        Pod.get(
-            dyn_client=admin_client,
-            namespace=namespace,
-            label_selector=label_selector,
-        )
-    )
+    pods = get_pod_informer_manager().get_pods(client=admin_client, namespace=namespace, label_selector=label_selector)
     if not pods:
         raise ResourceNotFoundError(f"No pods found with label selector {label_selector} in namespace {namespace}")
     if len(pods) != expected_num_pods:
@@ -387,38 +382,6 @@ def wait_for_container_status(pod: Pod, container_name: str, expected_status: st
     raise ResourceValueMismatch(f"Container {container_name} is not in the expected status {container_status.state}")
 
 
-def get_pod_container_error_status(pod: Pod) -> str | None:
-    """
-    Check container error status for a given pod and if any containers is in waiting state, return that information
-    """
-    pod_instance_status = pod.instance.status
-    for container_status in pod_instance_status.get("containerStatuses", []):
-        if waiting_container := container_status.get("state", {}).get("waiting"):
-            return waiting_container["reason"] if waiting_container.get("reason") else waiting_container
-    return ""
-
-
-def get_not_running_pods(pods: list[Pod]) -> list[dict[str, Any]]:
-    # Gets all the non-running pods from a given namespace.
-    # Note: We need to keep track of pods marked for deletion as not running. This would ensure any
-    # pod that was spun up in place of pod marked for deletion, are not ignored
-    pods_not_running = []
-    try:
-        for pod in pods:
-            pod_instance = pod.instance
-            if container_status_error := get_pod_container_error_status(pod=pod):
-                pods_not_running.append({pod.name: container_status_error})
-
-            if pod_instance.metadata.get("deletionTimestamp") or pod_instance.status.phase not in (
-                pod.Status.RUNNING,
-                pod.Status.SUCCEEDED,
-            ):
-                pods_not_running.append({pod.name: pod.status})
-    except (ResourceNotFoundError, NotFoundError) as exc:
-        LOGGER.warning("Ignoring pod that disappeared during cluster sanity check: %s", exc)
-    return pods_not_running
-
-
 def wait_for_pods_running(
     admin_client: DynamicClient,
     namespace_name: str,
@@ -428,28 +391,33 @@ def wait_for_pods_running(
     Waits for all pods in a given namespace to reach Running/Completed state. To avoid catching all pods in running
     state too soon, use number_of_consecutive_checks with appropriate values.
     """
-    samples = TimeoutSampler(
-        wait_timeout=180,
-        sleep=5,
-        func=get_not_running_pods,
-        pods=list(Pod.get(dyn_client=admin_client, namespace=namespace_name)),
-        exceptions_dict={NotFoundError: [], ResourceNotFoundError: []},
+    return wait_for_namespaces_pods_running(
+        admin_client=admin_client,
+        namespace_names=[namespace_name],
+        number_of_consecutive_checks=number_of_consecutive_checks,
+    )
+
+
+def wait_for_namespaces_pods_running(
+    admin_client: DynamicClient,
+    namespace_names: list[str],
+    number_of_consecutive_checks: int = 1,
+) -> bool | None:
+    """
+    Waits for all pods in the given namespaces to reach Running/Completed state, namespaces are scanned concurrently.
+
+    Args:
+        admin_client (DynamicClient): DynamicClient object
+        namespace_names (list[str]): namespaces names
+        number_of_consecutive_checks (int): number of consecutive checks without not running pods
+
+    Returns:
+        bool | None: True if all pods are running, None if the wait timed out between consecutive checks
+
+    Raises:
+        TimeoutExpiredError: If pods are not running when the wait times out
+
+    """
+    return ClusterHealthScanner(client=admin_client, namespaces=namespace_names).wait_for_pods_running(
+        number_of_consecutive_checks=number_of_consecutive_checks
     )
-    sample = None
-    try:
-        current_check = 0
-        for sample in samples:
-            if not sample:
-                current_check += 1
-                if current_check >= number_of_consecutive_checks:
-                    return True
-            else:
-                current_check = 0
-    except TimeoutExpiredError:
-        if sample:
-            LOGGER.error(
-                f"timeout waiting for all pods in namespace {namespace_name} to reach "
-                f"running state, following pods are in not running state: {sample}"
-            )
-            raise
-    return None
@@ -0,0 +1,451 @@
+import ssl
+import threading
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+import httpx
+import urllib3
+from pytest_testconfig import config as py_config
+from simple_logger.logger import get_logger
+from urllib3.exceptions import InsecureRequestWarning
+
+from utilities.constants import Timeout
+
+urllib3.disable_warnings(category=InsecureRequestWarning)
+
+LOGGER = get_logger(name=__name__)
+
+CONNECT_TIMEOUT: int = 10
+POOL_MAX_SIZE: int = 32
+NUM_POOLS: int = 64
+
+
+class HttpVersion:
+    HTTP_1_1: str = "1.1"
+    # Concurrent requests are multiplexed over one TLS connection per host; requires the `h2` package
+    HTTP_2: str = "2"
+    ALL_VERSIONS: tuple[str, ...] = (HTTP_1_1, HTTP_2)
+
+
+def is_http2_enabled() -> bool:
+    """
+    Check if in-process inference requests are sent over HTTP/2, set with the `--inference-http-version` option.
+
+    Returns:
+        bool: True if HTTP/2 is enabled
+
+    """
+    return py_config.get("inference_http_version", HttpVersion.HTTP_1_1) == HttpVersion.HTTP_2
+
+
+@dataclass
+class HttpResponse:
+    """Response returned by the in-process HTTP engine."""
+
+    status: int
+    reason: str
+    http_version: str
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+
+    @property
+    def status_line(self) -> str:
+        return f"{self.http_version} {self.status} {self.reason}".rstrip()
+
+    @property
+    def content_type(self) -> str:
+        for header_name, header_value in self.headers:
+            if header_name == "content-type":
+                return header_value.lower()
+
+        return ""
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(errors="replace")
+
+    def to_curl_output(self) -> str:
+        """
+        Render the response the same way `curl -i` prints it, status line and headers followed by the body.
+
+        Returns:
+            str: raw response text
+
+        """
+        lines = [self.status_line]
+        lines.extend(f"{header_name}: {header_value}" for header_name, header_value in self.headers)
+        return "\r\n".join(lines) + "\r\n\r\n" + self.text
+
+
+class HttpResponseParser:
+    """
+    Incremental parser of raw HTTP responses, as printed by `curl -i`.
+
+    Status line, headers and body are separated in a single pass over the fed data; every line is scanned once,
+    and the body is kept as is. Interim (1xx) responses and proxy `CONNECT` responses printed before
+    the final response are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+        self._in_body = False
+        self._response: HttpResponse | None = None
+
+    def feed(self, data: bytes) -> None:
+        """
+        Parse the next chunk of the raw response.
+
+        Args:
+            data (bytes): raw response chunk
+
+        Raises:
+            ValueError: If the status line is not valid
+
+        """
+        self._buffer += data
+        if self._in_body:
+            return
+
+        position = self._position
+        while (line_end := self._buffer.find(b"\n", position)) != -1:
+            line = self._buffer[position:line_end].rstrip(b"\r").decode(errors="replace")
+            position = line_end + 1
+
+            if self._response is None:
+                if line:
+                    self._response = self._parse_status_line(line=line)
+
+            elif line:
+                header_name, _, header_value = line.partition(":")
+                self._response.headers.append((header_name.strip().lower(), header_value.strip()))
+
+            elif self._is_interim_response(response=self._response):
+                self._response = None
+
+            else:
+                self._in_body = True
+                del self._buffer[:position]
+                position = 0
+                break
+
+        self._position = position
+
+    @staticmethod
+    def _parse_status_line(line: str) -> HttpResponse:
+        http_version, _, status_reason = line.partition(" ")
+        status, _, reason = status_reason.strip().partition(" ")
+
+        if not http_version.startswith("HTTP/") or not status.isdigit():
+            raise ValueError(f"Invalid HTTP status line: {line}")
+
+        return HttpResponse(status=int(status), reason=reason.strip(), http_version=http_version)
+
+    @staticmethod
+    def _is_interim_response(response: HttpResponse) -> bool:
+        return response.status < 200 or (response.status == 200 and response.reason == "Connection established")
+
+    def close(self) -> HttpResponse:
+        """
+        Finish parsing the raw response.
+
+        Returns:
+            HttpResponse: response, its body is empty if no header section end was received
+
+        Raises:
+            ValueError: If no status line was received
+
+        """
+        if self._response is None:
+            raise ValueError("No HTTP status line found in response")
+
+        if self._in_body:
+            self._response.body = bytes(self._buffer)
+
+        return self._response
+
+
+def parse_http_response(raw_response: str) -> HttpResponse:
+    """
+    Parse a raw HTTP response, as printed by `curl -i`.
+
+    Args:
+        raw_response (str): raw response text
+
+    Returns:
+        HttpResponse: response object
+
+    Raises:
+        ValueError: If the raw response has no valid status line
+
+    """
+    parser = HttpResponseParser()
+    parser.feed(data=raw_response.encode())
+    return parser.close()
+
+
+def get_httpx_verify(ca_bundle: str, insecure: bool) -> ssl.SSLContext | bool:
+    """
+    Get the httpx server certificate verification setting of a TLS configuration.
+
+    Args:
+        ca_bundle (str): path to CA bundle used to verify the server
+        insecure (bool): skip server certificate verification
+
+    Returns:
+        ssl.SSLContext | bool: httpx `verify` argument
+
+    """
+    if insecure:
+        return False
+
+    if ca_bundle:
+        return ssl.create_default_context(cafile=ca_bundle)
+
+    return True
+
+
+def to_http_response(response: httpx.Response) -> HttpResponse:
+    """
+    Convert an httpx response to an engine response.
+
+    Args:
+        response (httpx.Response): httpx response, already read
+
+    Returns:
+        HttpResponse: response object
+
+    """
+    return HttpResponse(
+        status=response.status_code,
+        reason=response.reason_phrase,
+        http_version=response.http_version,
+        headers=[(header_name.lower(), header_value) for header_name, header_value in response.headers.multi_items()],
+        body=response.content,
+    )
+
+
+class HttpEngine:
+    """
+    In-process HTTP client with per-host keep-alive connection pools.
+
+    A connection pool manager is kept per TLS configuration (CA bundle / insecure); each manager keeps
+    a pool of reusable connections per host, so repeated requests skip TCP connect and TLS handshake.
+    With HTTP/2, an `httpx.Client` is kept per TLS configuration instead, and concurrent requests
+    from all threads are multiplexed over one connection per host.
+    """
+
+    def __init__(self, num_pools: int = NUM_POOLS, pool_maxsize: int = POOL_MAX_SIZE, http2: bool = False) -> None:
+        """
+        Args:
+            num_pools (int): number of per-host pools kept by each pool manager
+            pool_maxsize (int): number of reusable connections kept per host
+            http2 (bool): send requests over HTTP/2 if the server supports it; requires the `h2` package
+        """
+        self.num_pools = num_pools
+        self.pool_maxsize = pool_maxsize
+        self.http2 = http2
+        self._pool_managers: dict[tuple[str, bool], urllib3.PoolManager] = {}
+        self._http2_clients: dict[tuple[str, bool], httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool_manager(self, ca_bundle: str, insecure: bool) -> urllib3.PoolManager:
+        key = (ca_bundle, insecure)
+
+        with self._lock:
+            if not (pool_manager := self._pool_managers.get(key)):
+                pool_kwargs: dict[str, Any] = {"num_pools": self.num_pools, "maxsize": self.pool_maxsize}
+                if insecure:
+                    pool_kwargs.update({"cert_reqs": "CERT_NONE", "assert_hostname": False})
+
+                elif ca_bundle:
+                    pool_kwargs.update({"cert_reqs": "CERT_REQUIRED", "ca_certs": ca_bundle})
+
+                pool_manager = self._pool_managers[key] = urllib3.PoolManager(**pool_kwargs)
+
+        return pool_manager
+
+    def _get_http2_client(self, ca_bundle: str, insecure: bool) -> httpx.Client:
+        key = (ca_bundle, insecure)
+
+        with self._lock:
+            if not (client := self._http2_clients.get(key)):
+                client = self._http2_clients[key] = httpx.Client(
+                    verify=get_httpx_verify(ca_bundle=ca_bundle, insecure=insecure),
+                    http2=True,
+                    limits=httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize),
+                    follow_redirects=False,
+                    trust_env=False,
+                )
+
+        return client
+
+    def request(
+        self,
+        url: str,
+        method: str = "POST",
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        ca_bundle: str = "",
+        insecure: bool = False,
+        timeout: int = Timeout.TIMEOUT_5MIN,
+    ) -> HttpResponse:
+        """
+        Send a request over a pooled connection.
+
+        Redirects are not followed and errors are not retried, matching `curl -i -s` behavior.
+
+        Args:
+            url (str): request url
+            method (str): HTTP method
+            body (bytes): request body
+            headers (dict[str, str]): request headers
+            ca_bundle (str): path to CA bundle used to verify the server
+            insecure (bool): skip server certificate verification
+            timeout (int): read timeout in seconds
+
+        Returns:
+            HttpResponse: response object
+
+        Raises:
+            urllib3.exceptions.HTTPError: If the request could not be sent or the response could not be read
+            httpx.HTTPError: If the request could not be sent or the response could not be read over HTTP/2
+
+        """
+        if self.http2:
+            client = self._get_http2_client(ca_bundle=ca_bundle, insecure=insecure)
+            return to_http_response(
+                response=client.request(
+                    method=method,
+                    url=url,
+                    content=body,
+                    headers=headers,
+                    timeout=httpx.Timeout(timeout=timeout, connect=CONNECT_TIMEOUT),
+                )
+            )
+
+        pool_manager = self._get_pool_manager(ca_bundle=ca_bundle, insecure=insecure)
+        response = pool_manager.request(
+            method=method,
+            url=url,
+            body=body,
+            headers=headers,
+            redirect=False,
+            retries=False,
+            timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=timeout),
+        )
+
+        return HttpResponse(
+            status=response.status,
+            reason=response.reason or "",
+            http_version=f"HTTP/{response.version // 10}.{response.version % 10}",
+            headers=[(header_name.lower(), header_value) for header_name, header_value in response.headers.items()],
+            body=response.data,
+        )
+
+
+class AsyncHttpEngine:
+    """
+    In-process asyncio HTTP client, used to send many concurrent requests from a single thread.
+
+    An `httpx.AsyncClient` is kept per TLS configuration (CA bundle / insecure); connections are
+    re-used by all requests sent through the engine. The clients are bound to the running event loop,
+    so an engine should be created and closed within the same loop (`async with AsyncHttpEngine() as engine`).
+    """
+
+    def __init__(self, max_connections: int = POOL_MAX_SIZE, http2: bool | None = None) -> None:
+        """
+        Args:
+            max_connections (int): number of connections kept per TLS configuration
+            http2 (bool): send requests over HTTP/2 if the server supports it, concurrent requests are multiplexed
+                over one connection per host; requires the `h2` package. Defaults to the `--inference-http-version`
+                option
+        """
+        self.max_connections = max_connections
+        self.http2 = is_http2_enabled() if http2 is None else http2
+        self._clients: dict[tuple[str, bool], httpx.AsyncClient] = {}
+
+    async def __aenter__(self) -> "AsyncHttpEngine":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _get_client(self, ca_bundle: str, insecure: bool) -> httpx.AsyncClient:
+        key = (ca_bundle, insecure)
+
+        if not (client := self._clients.get(key)):
+            client = self._clients[key] = httpx.AsyncClient(
+                verify=get_httpx_verify(ca_bundle=ca_bundle, insecure=insecure),
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+                follow_redirects=False,
+                trust_env=False,
+            )
+
+        return client
+
+    async def request(
+        self,
+        url: str,
+        method: str = "POST",
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        ca_bundle: str = "",
+        insecure: bool = False,
+        timeout: int = Timeout.TIMEOUT_5MIN,
+    ) -> HttpResponse:
+        """
+        Send a request over a pooled connection.
+
+        Redirects are not followed and errors are not retried, matching `curl -i -s` behavior.
+
+        Args:
+            url (str): request url
+            method (str): HTTP method
+            body (bytes): request body
+            headers (dict[str, str]): request headers
+            ca_bundle (str): path to CA bundle used to verify the server
+            insecure (bool): skip server certificate verification
+            timeout (int): read timeout in seconds
+
+        Returns:
+            HttpResponse: response object
+
+        Raises:
+            httpx.HTTPError: If the request could not be sent or the response could not be read
+
+        """
+        client = self._get_client(ca_bundle=ca_bundle, insecure=insecure)
+        response = await client.request(
+            method=method,
+            url=url,
+            content=body,
+            headers=headers,
+            timeout=httpx.Timeout(timeout=timeout, connect=CONNECT_TIMEOUT),
+        )
+
+        return to_http_response(response=response)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+
+        self._clients.clear()
+
+
+@cache
+def get_http_engine() -> HttpEngine:
+    """
+    Get the process-wide HTTP engine, so all inference calls in a worker share the same connection pools.
+
+    The engine uses HTTP/2 if set with the `--inference-http-version` option.
+
+    Returns:
+        HttpEngine: HTTP engine
+
+    """
+    return HttpEngine(http2=is_http2_enabled())
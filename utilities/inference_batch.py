@@ -0,0 +1,124 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+from simple_logger.logger import get_logger
+
+from utilities.exceptions import InferenceResponseError
+from utilities.http_engine import AsyncHttpEngine
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_CONCURRENCY: int = 32
+DEFAULT_RETRY_SLEEP: int = 5
+# Route not ready yet and connection errors, e.g. while the model server is still starting
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (InferenceResponseError, httpx.TransportError)
+
+# Coroutine function sending a single inference request for an inference input, returns the inference response dict
+SendRequest = Callable[[AsyncHttpEngine, Any], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class InferenceResult:
+    """Result of a single request sent as part of an inference batch."""
+
+    index: int
+    inference_input: Any
+    response: Optional[dict[str, Any]] = None
+    error: Optional[Exception] = None
+    start_time: float = 0.0
+    latency: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+async def _run_inference_batch(
+    inference_inputs: list[Any],
+    send_request: SendRequest,
+    concurrency: int,
+    retry_timeout: int,
+    retry_sleep: int,
+) -> list[InferenceResult]:
+    semaphore = asyncio.Semaphore(value=concurrency)
+    batch_start = time.perf_counter()
+
+    async with AsyncHttpEngine(max_connections=concurrency) as engine:
+
+        async def _send(index: int, inference_input: Any) -> InferenceResult:
+            result = InferenceResult(index=index, inference_input=inference_input)
+
+            async with semaphore:
+                request_start = time.perf_counter()
+                result.start_time = request_start - batch_start
+
+                while True:
+                    try:
+                        result.response = await send_request(engine, inference_input)
+
+                    except RETRY_EXCEPTIONS as ex:
+                        if time.perf_counter() - request_start + retry_sleep > retry_timeout:
+                            result.error = ex
+                            break
+
+                        LOGGER.warning(f"Inference request {index} failed, retrying in {retry_sleep} seconds: {ex}")
+                        await asyncio.sleep(retry_sleep)
+                        continue
+
+                    except Exception as ex:
+                        result.error = ex
+
+                    break
+
+                result.latency = time.perf_counter() - request_start
+
+            return result
+
+        return await asyncio.gather(*[
+            _send(index=index, inference_input=inference_input)
+            for index, inference_input in enumerate(inference_inputs)
+        ])
+
+
+def run_inference_batch(
+    inference_inputs: list[Any],
+    send_request: SendRequest,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retry_timeout: int = 0,
+    retry_sleep: int = DEFAULT_RETRY_SLEEP,
+) -> list[InferenceResult]:
+    """
+    Send a batch of inference requests from a single thread, with at most `concurrency` requests in flight.
+
+    All requests share the connections of one `AsyncHttpEngine`. A failed request does not stop the batch,
+    the error is kept in the request result. Requests failing with a `RETRY_EXCEPTIONS` error are sent again
+    until `retry_timeout` expires; the request latency includes the retries.
+
+    Args:
+        inference_inputs (list[Any]): inference inputs, one request is sent per input
+        send_request (SendRequest): coroutine function which sends a single request and returns the response dict
+        concurrency (int): maximum number of requests in flight
+        retry_timeout (int): time in seconds to retry a failed request, failed requests are not retried if 0
+        retry_sleep (int): seconds between retries of a failed request
+
+    Returns:
+        list[InferenceResult]: request results, in the same order as `inference_inputs`
+
+    """
+    results = asyncio.run(
+        _run_inference_batch(
+            inference_inputs=inference_inputs,
+            send_request=send_request,
+            concurrency=concurrency,
+            retry_timeout=retry_timeout,
+            retry_sleep=retry_sleep,
+        )
+    )
+
+    if failed := [result for result in results if not result.succeeded]:
+        LOGGER.warning(f"{len(failed)}/{len(results)} inference requests failed. First error: {failed[0].error}")
+
+    return results
@@ -0,0 +1,333 @@
+import importlib
+import pkgutil
+import re
+import threading
+from functools import cache
+from string import Template
+from typing import Any, Optional
+
+from simple_logger.logger import get_logger
+
+import utilities.manifests
+from utilities.constants import Protocols
+
+LOGGER = get_logger(name=__name__)
+
+INFERENCE_CONFIG_SUFFIX: str = "_INFERENCE_CONFIG"
+DEFAULT_QUERY_MODEL: str = "default_query_model"
+SUPPORT_MULTI_DEFAULT_QUERIES: str = "support_multi_default_queries"
+RUNTIME_CONFIG_TEMPLATE_KEYS: tuple[str, ...] = ("endpoint", "header", "body")
+
+
+def compile_template(name: str, template: Any) -> Template:
+    """
+    Compile an inference config template.
+
+    Args:
+        name (str): template name, used in errors
+        template (Any): template string
+
+    Returns:
+        Template: template
+
+    Raises:
+        ValueError: If the template is not a string or has invalid placeholders
+
+    """
+    if not isinstance(template, str):
+        raise ValueError(f"{name} must be a string, got {type(template).__name__}")
+
+    compiled_template = Template(template=template)
+    if not compiled_template.is_valid():
+        raise ValueError(f"{name} has invalid placeholders: {template}")
+
+    return compiled_template
+
+
+class CompiledRuntimeConfig:
+    """
+    Runtime config of an inference type and protocol, with its templates compiled.
+    """
+
+    def __init__(self, name: str, runtime_config: dict[str, Any]) -> None:
+        """
+        Args:
+            name (str): runtime config name, used in errors
+            runtime_config (dict[str, Any]): runtime config
+
+        Raises:
+            ValueError: If the runtime config is not valid
+        """
+        if not isinstance(runtime_config, dict):
+            raise ValueError(f"{name} must be a dict, got {type(runtime_config).__name__}")
+
+        if not isinstance(runtime_config.get("response_fields_map"), dict):
+            raise ValueError(f"{name} is missing the response_fields_map dict")
+
+        self.runtime_config = runtime_config
+        self.endpoint, self.header, self.body = (
+            compile_template(name=f"{name} {key}", template=runtime_config.get(key))
+            for key in RUNTIME_CONFIG_TEMPLATE_KEYS
+        )
+
+
+class CompiledDefaultQuery:
+    """
+    Default query of an inference config, with its expected output template compiled.
+
+    Expected output regexes are compiled once per model name.
+    """
+
+    def __init__(self, name: str, query_config: dict[str, Any]) -> None:
+        """
+        Args:
+            name (str): default query name, used in errors
+            query_config (dict[str, Any]): default query config
+
+        Raises:
+            ValueError: If the default query config is not valid
+        """
+        if not isinstance(query_config, dict):
+            raise ValueError(f"{name} must be a dict, got {type(query_config).__name__}")
+
+        self.query_input = query_config.get("query_input")
+        self.use_regex: bool = query_config.get("use_regex", False)
+
+        query_output = query_config.get("query_output")
+        if isinstance(query_output, dict):
+            query_output = query_output.get("response_output")
+
+        self.query_output: Optional[Template] = (
+            compile_template(name=f"{name} query_output", template=query_output) if query_output else None
+        )
+        self._patterns: dict[str, re.Pattern[str]] = {}
+        self._lock = threading.Lock()
+
+        if self.use_regex:
+            if not self.query_output:
+                raise ValueError(f"{name} uses a regex but has no query_output")
+
+            try:
+                self.get_expected_output_pattern(model_name="model")
+
+            except re.error as ex:
+                raise ValueError(f"{name} query_output is not a valid regex: {ex}") from ex
+
+    def get_expected_output(self, model_name: str) -> Optional[str]:
+        """
+        Get the expected output of the default query.
+
+        Args:
+            model_name (str): inference model name
+
+        Returns:
+            Optional[str]: expected output, None if the default query has no expected output
+
+        """
+        return self.query_output.safe_substitute(model_name=model_name) if self.query_output else None
+
+    def get_expected_output_pattern(self, model_name: str) -> re.Pattern[str]:
+        """
+        Get the compiled expected output regex of the default query.
+
+        Args:
+            model_name (str): inference model name
+
+        Returns:
+            re.Pattern[str]: expected output regex
+
+        """
+        with self._lock:
+            if model_name not in self._patterns:
+                self._patterns[model_name] = re.compile(self.get_expected_output(model_name=model_name) or "")
+
+            return self._patterns[model_name]
+
+
+class CompiledInferenceConfig:
+    """
+    Inference config validated once, with its runtime configs indexed by (inference type, protocol).
+    """
+
+    def __init__(self, name: str, inference_config: dict[str, Any]) -> None:
+        """
+        Args:
+            name (str): inference config name, used in errors
+            inference_config (dict[str, Any]): inference config
+
+        Raises:
+            ValueError: If the inference config is not valid
+        """
+        self.name = name
+        self.inference_config = inference_config
+        self.runtime_configs: dict[tuple[str, str], CompiledRuntimeConfig] = {}
+        self.default_queries: dict[Optional[str], CompiledDefaultQuery] = {}
+
+        for inference_type, protocols in inference_config.items():
+            if inference_type in (DEFAULT_QUERY_MODEL, SUPPORT_MULTI_DEFAULT_QUERIES) or not isinstance(
+                protocols, dict
+            ):
+                continue
+
+            for protocol, runtime_config in protocols.items():
+                self.runtime_configs[inference_type, protocol] = CompiledRuntimeConfig(
+                    name=f"{name} {inference_type}/{protocol}", runtime_config=runtime_config
+                )
+
+        if default_query_config := inference_config.get(DEFAULT_QUERY_MODEL):
+            if inference_config.get(SUPPORT_MULTI_DEFAULT_QUERIES):
+                for inference_type, query_config in default_query_config.items():
+                    if not any(_inference_type == inference_type for _inference_type, _ in self.runtime_configs):
+                        raise ValueError(f"{name} has a default query for unknown inference type {inference_type}")
+
+                    self.default_queries[inference_type] = CompiledDefaultQuery(
+                        name=f"{name} {DEFAULT_QUERY_MODEL} {inference_type}", query_config=query_config
+                    )
+
+            else:
+                self.default_queries[None] = CompiledDefaultQuery(
+                    name=f"{name} {DEFAULT_QUERY_MODEL}", query_config=default_query_config
+                )
+
+    def get_runtime_config(self, inference_type: str, protocol: str) -> CompiledRuntimeConfig:
+        """
+        Get the runtime config of an inference type and protocol.
+
+        Args:
+            inference_type (str): inference type
+            protocol (str): protocol, HTTP and HTTPS use the `http` runtime config
+
+        Returns:
+            CompiledRuntimeConfig: runtime config
+
+        Raises:
+            ValueError: If the inference type or protocol is not supported
+
+        """
+        protocol = Protocols.HTTP if protocol in Protocols.TCP_PROTOCOLS else protocol
+
+        if runtime_config := self.runtime_configs.get((inference_type, protocol)):
+            return runtime_config
+
+        supported_protocols = [
+            _protocol for _inference_type, _protocol in self.runtime_configs if _inference_type == inference_type
+        ]
+        if supported_protocols:
+            raise ValueError(f"Protocol {protocol} not supported.\nSupported protocols are {supported_protocols}")
+
+        raise ValueError(
+            f"Inference type {inference_type} not supported.\n"
+            f"Supported inference types are {sorted({_inference_type for _inference_type, _ in self.runtime_configs})}"
+        )
+
+    def get_default_query(self, inference_type: str) -> CompiledDefaultQuery:
+        """
+        Get the default query of an inference type.
+
+        Args:
+            inference_type (str): inference type
+
+        Returns:
+            CompiledDefaultQuery: default query
+
+        Raises:
+            ValueError: If the inference config has no default query for the inference type
+
+        """
+        if self.inference_config.get(SUPPORT_MULTI_DEFAULT_QUERIES):
+            default_query = self.default_queries.get(inference_type)
+        else:
+            default_query = self.default_queries.get(None)
+
+        if not default_query:
+            raise ValueError(f"Missing {DEFAULT_QUERY_MODEL} config for inference type {inference_type} in {self.name}")
+
+        return default_query
+
+
+class InferenceConfigRegistry:
+    """
+    Process-wide registry of compiled inference configs.
+
+    The `*_INFERENCE_CONFIG` dicts of the manifests modules are compiled when the registry is created, so a
+    broken config fails test collection; other inference configs are compiled on first use.
+    Configs are looked up by identity, as inference configs are module constants.
+    """
+
+    def __init__(self) -> None:
+        # id(inference config) -> compiled inference config, which keeps a reference to the inference config
+        self._configs: dict[int, CompiledInferenceConfig] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, inference_config: dict[str, Any]) -> CompiledInferenceConfig:
+        """
+        Compile and register an inference config.
+
+        Args:
+            name (str): inference config name, used in errors
+            inference_config (dict[str, Any]): inference config
+
+        Returns:
+            CompiledInferenceConfig: compiled inference config
+
+        Raises:
+            ValueError: If the inference config is not valid
+
+        """
+        with self._lock:
+            if id(inference_config) not in self._configs:
+                self._configs[id(inference_config)] = CompiledInferenceConfig(
+                    name=name, inference_config=inference_config
+                )
+
+            return self._configs[id(inference_config)]
+
+    def register_manifests(self) -> None:
+        """
+        Compile and register the `*_INFERENCE_CONFIG` dicts of the manifests modules.
+
+        Raises:
+            ValueError: If an inference config is not valid
+
+        """
+        for module_info in pkgutil.iter_modules(utilities.manifests.__path__):
+            module = importlib.import_module(f"{utilities.manifests.__name__}.{module_info.name}")
+
+            for name, value in vars(module).items():
+                if name.endswith(INFERENCE_CONFIG_SUFFIX) and isinstance(value, dict):
+                    self.register(name=f"{module_info.name}.{name}", inference_config=value)
+
+        LOGGER.debug(f"Registered {len(self._configs)} manifests inference configs")
+
+    def get(self, inference_config: dict[str, Any]) -> CompiledInferenceConfig:
+        """
+        Get a compiled inference config, compiled on first use if it is not registered.
+
+        Args:
+            inference_config (dict[str, Any]): inference config
+
+        Returns:
+            CompiledInferenceConfig: compiled inference config
+
+        Raises:
+            ValueError: If the inference config is not valid
+
+        """
+        if compiled_config := self._configs.get(id(inference_config)):
+            return compiled_config
+
+        return self.register(name="inference config", inference_config=inference_config)
+
+
+@cache
+def get_inference_config_registry() -> InferenceConfigRegistry:
+    """
+    Get the process-wide inference config registry, with the manifests inference configs registered.
+
+    Returns:
+        InferenceConfigRegistry: inference config registry
+
+    """
+    registry = InferenceConfigRegistry()
+    registry.register_manifests()
+    return registry
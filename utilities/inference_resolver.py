@@ -0,0 +1,291 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cache
+from http import HTTPStatus
+from typing import Any, Callable, TypeVar
+
+from kubernetes import watch
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ApiException
+from ocp_resources.inference_graph import InferenceGraph
+from ocp_resources.inference_service import InferenceService
+from ocp_resources.resource import Resource
+from ocp_resources.route import Route
+from ocp_resources.service import Service
+from ocp_resources.serving_runtime import ServingRuntime
+from simple_logger.logger import get_logger
+
+from utilities.resource_watch import WATCH_RETRY_SLEEP, WATCH_TRANSIENT_EXCEPTIONS, get_resource_api
+
+LOGGER = get_logger(name=__name__)
+
+WATCH_TIMEOUT: int = 60
+# Changes to these kinds in a namespace drop every resolver entry in the namespace; ModelMesh inference URLs
+# are resolved from Routes
+DEPENDENT_RESOURCES: tuple[type[Resource], ...] = (ServingRuntime, Service, Route)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ResolverEntry:
+    """Values resolved for one InferenceService / InferenceGraph resourceVersion."""
+
+    resource_version: str
+    values: dict[str, Any] = field(default_factory=dict)
+
+
+class NamespaceWatcher:
+    """
+    Watches one resource kind in a namespace and reports every event to the resolver cache.
+
+    The watch starts from the resourceVersion of an initial LIST and resumes from the last seen resourceVersion;
+    if the resourceVersion is too old to resume from or the watch failed with a transient error, the namespace
+    entries are dropped and the watch restarts from a new LIST. Any other error stops the watcher and is reported
+    with a `STOPPED` event.
+    """
+
+    def __init__(
+        self,
+        client: DynamicClient,
+        resource: type[Resource],
+        namespace: str | None,
+        on_event: Callable[[str, str | None, dict[str, Any]], None],
+    ) -> None:
+        """
+        Args:
+            client (DynamicClient): DynamicClient object
+            resource (type[Resource]): resource class to watch
+            namespace (str | None): namespace to watch
+            on_event (Callable): called with the resource kind, namespace and watch event
+        """
+        self.resource = resource
+        self.namespace = namespace
+        self.on_event = on_event
+        self._api_resource = get_resource_api(client=client, resource_class=resource)
+        self._resource_version = self._list_resource_version()
+        self._watcher = watch.Watch()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"resolver-watch-{resource.kind}-{namespace}", daemon=True
+        )
+
+    def _list_resource_version(self) -> str:
+        return self._api_resource.get(namespace=self.namespace).metadata.resourceVersion
+
+    def start(self) -> None:
+        LOGGER.info(f"Watching {self.resource.kind} in namespace {self.namespace}")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._watcher.stop()
+
+    def _run(self) -> None:
+        try:
+            self._watch()
+
+        except Exception as ex:
+            if not self._stopped.is_set():
+                LOGGER.warning(f"{self.resource.kind} watch in namespace {self.namespace} stopped: {ex}")
+                self.on_event(self.resource.kind, self.namespace, {"type": "STOPPED"})
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if not self._resource_version:
+                    self._resource_version = self._list_resource_version()
+
+                for event in self._api_resource.watch(
+                    namespace=self.namespace,
+                    resource_version=self._resource_version,
+                    timeout=WATCH_TIMEOUT,
+                    watcher=self._watcher,
+                ):
+                    self._resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                    self.on_event(self.resource.kind, self.namespace, event)
+
+            except (ApiException, *WATCH_TRANSIENT_EXCEPTIONS) as ex:
+                if self._stopped.is_set():
+                    return
+
+                if not isinstance(ex, WATCH_TRANSIENT_EXCEPTIONS) and getattr(ex, "status", None) != HTTPStatus.GONE:
+                    raise
+
+                # Events since the last seen resourceVersion may be lost, resume from a fresh LIST
+                LOGGER.warning(f"{self.resource.kind} watch in namespace {self.namespace} restarted: {ex}")
+                self.on_event(self.resource.kind, self.namespace, {"type": "RESYNC"})
+                self._resource_version = ""
+
+                if isinstance(ex, WATCH_TRANSIENT_EXCEPTIONS):
+                    time.sleep(WATCH_RETRY_SLEEP)
+
+
+class InferenceResolverCache:
+    """
+    Session-wide cache of the values resolved from the cluster to send inference requests
+    (deployment mode, serving runtime, exposure, URL, port forward target).
+
+    Entries are keyed by (kind, namespace, name) of the InferenceService / InferenceGraph and hold the values
+    resolved for one resourceVersion. A watch per namespace drops an entry once its resource gets a new
+    resourceVersion, and drops all namespace entries when a ServingRuntime, a Service or a Route in the namespace
+    changes. The namespace watches are stopped once an InferenceService / InferenceGraph in the namespace is
+    deleted, e.g. when the namespace is deleted, and started again on the next lookup in the namespace.
+    Values are not cached in namespaces that cannot be watched, they are resolved on every call.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str | None, str | None], ResolverEntry] = {}
+        self._watchers: dict[tuple[str, str | None], NamespaceWatcher] = {}
+        # Last resourceVersion seen by the watch, per (kind, namespace, name)
+        self._resource_versions: dict[tuple[str, str | None, str | None], str] = {}
+        self._uncacheable_namespaces: set[str | None] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        inference_service: InferenceService | InferenceGraph,
+        key: str,
+        resolve: Callable[[], T],
+    ) -> T:
+        """
+        Get a value resolved for the current resourceVersion of an InferenceService / InferenceGraph.
+
+        Args:
+            inference_service (InferenceService | InferenceGraph): InferenceService or InferenceGraph object
+            key (str): value key
+            resolve (Callable): called to resolve the value if it is not cached
+
+        Returns:
+            Any: resolved value
+
+        """
+        entry_key = (inference_service.kind, inference_service.namespace, inference_service.name)
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+
+        if not entry:
+            # Watch before reading the resourceVersion, so no change after the read is missed
+            if not self._watch_namespace(inference_service=inference_service):
+                return resolve()
+
+            entry = ResolverEntry(resource_version=inference_service.instance.metadata.resourceVersion)
+
+            with self._lock:
+                # The watch already saw another version, the values may be stale by the time they are resolved
+                if self._resource_versions.get(entry_key, entry.resource_version) != entry.resource_version:
+                    return resolve()
+
+                entry = self._entries.setdefault(entry_key, entry)
+
+        if key not in entry.values:
+            entry.values[key] = resolve()
+
+        return entry.values[key]
+
+    def _watch_namespace(self, inference_service: InferenceService | InferenceGraph) -> bool:
+        namespace = inference_service.namespace
+
+        with self._lock:
+            if namespace in self._uncacheable_namespaces:
+                return False
+
+            for resource in (type(inference_service), *DEPENDENT_RESOURCES):
+                watcher_key = (resource.kind, namespace)
+
+                if watcher_key not in self._watchers:
+                    try:
+                        watcher = NamespaceWatcher(
+                            client=inference_service.client,
+                            resource=resource,
+                            namespace=namespace,
+                            on_event=self._on_event,
+                        )
+
+                    except WATCH_TRANSIENT_EXCEPTIONS as ex:
+                        LOGGER.warning(f"Failed to watch {resource.kind} in namespace {namespace}: {ex}")
+                        return False
+
+                    except ApiException as ex:
+                        LOGGER.warning(
+                            f"Cannot watch {resource.kind} in namespace {namespace}, "
+                            f"resolved values are not cached: {ex}"
+                        )
+                        self._stop_namespace(namespace=namespace)
+                        return False
+
+                    watcher.start()
+                    self._watchers[watcher_key] = watcher
+
+        return True
+
+    def _stop_watchers(self, namespace: str | None) -> None:
+        for watcher_key in [watcher_key for watcher_key in self._watchers if watcher_key[1] == namespace]:
+            self._watchers.pop(watcher_key).stop()
+
+        self._invalidate_namespace(namespace=namespace)
+
+    def _stop_namespace(self, namespace: str | None) -> None:
+        self._stop_watchers(namespace=namespace)
+        self._uncacheable_namespaces.add(namespace)
+
+    def _on_event(self, kind: str, namespace: str | None, event: dict[str, Any]) -> None:
+        is_dependent_resource = kind in {resource.kind for resource in DEPENDENT_RESOURCES}
+        is_inference_deleted = event["type"] == "DELETED" and not is_dependent_resource
+
+        with self._lock:
+            if event["type"] == "STOPPED":
+                self._stop_namespace(namespace=namespace)
+
+            elif is_inference_deleted:
+                LOGGER.info(f"{kind} {namespace}/{event['raw_object']['metadata']['name']} deleted, stopping watches")
+                self._stop_watchers(namespace=namespace)
+
+            if event["type"] in ("RESYNC", "STOPPED") or is_inference_deleted:
+                self._invalidate_namespace(namespace=namespace)
+                self._resource_versions = {
+                    entry_key: resource_version
+                    for entry_key, resource_version in self._resource_versions.items()
+                    if entry_key[1] != namespace
+                }
+                return
+
+            if is_dependent_resource:
+                self._invalidate_namespace(namespace=namespace)
+                return
+
+            metadata = event["raw_object"]["metadata"]
+            entry_key = (kind, namespace, metadata["name"])
+            self._resource_versions[entry_key] = metadata["resourceVersion"]
+            entry = self._entries.get(entry_key)
+
+            if entry and entry.resource_version != metadata["resourceVersion"]:
+                LOGGER.debug(f"{kind} {namespace}/{metadata['name']} changed, dropping resolved values")
+                del self._entries[entry_key]
+
+    def _invalidate_namespace(self, namespace: str | None) -> None:
+        self._entries = {entry_key: entry for entry_key, entry in self._entries.items() if entry_key[1] != namespace}
+
+    def close(self) -> None:
+        with self._lock:
+            for watcher in self._watchers.values():
+                watcher.stop()
+
+            self._watchers.clear()
+            self._uncacheable_namespaces.clear()
+            self._entries.clear()
+            self._resource_versions.clear()
+
+
+@cache
+def get_inference_resolver_cache() -> InferenceResolverCache:
+    """
+    Get the process-wide inference resolver cache.
+
+    Returns:
+        InferenceResolverCache: inference resolver cache
+
+    """
+    return InferenceResolverCache()
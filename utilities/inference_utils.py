@@ -1,17 +1,21 @@
+import asyncio
 import json
 import re
 import shlex
 from contextlib import contextmanager
+from functools import partial
 from http import HTTPStatus
 from json import JSONDecodeError
-from string import Template
 from typing import Any, Optional, Generator
 from urllib.parse import urlparse
 
+import grpc
+import httpx
+import urllib3
 from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from ocp_resources.inference_graph import InferenceGraph
 from ocp_resources.inference_service import InferenceService
-from ocp_resources.resource import get_client
 from ocp_resources.service import Service
 from pyhelper_utils.shell import run_command
 from simple_logger.logger import get_logger
@@ -27,7 +31,21 @@ from utilities.infra import (
     verify_no_failed_pods,
     get_pods_by_ig_label,
 )
+from utilities.cassette import CassetteKind, get_cassette
 from utilities.certificates_utils import get_ca_bundle
+from utilities.cluster_client import get_cluster_client
+from utilities.http_engine import AsyncHttpEngine, HttpResponse, get_http_engine, parse_http_response
+from utilities.inference_batch import DEFAULT_CONCURRENCY, InferenceResult, SendRequest, run_inference_batch
+from utilities.inference_config_registry import CompiledRuntimeConfig, get_inference_config_registry
+from utilities.inference_resolver import get_inference_resolver_cache
+from utilities.plugins.kserve_v2_binary import (
+    BINARY_DATA_CONTENT_TYPE,
+    INFERENCE_HEADER_CONTENT_LENGTH,
+    encode_binary_inference_request,
+)
+from utilities.plugins.kserve_v2_grpc_plugin import GRPC_INFERENCE_SERVICE, get_kserve_v2_grpc_plugin_manager
+from utilities.payload_store import PAYLOAD_FILE_PREFIX, get_payload_store
+from utilities.port_forward_utils import get_port_forward_manager, get_port_forward_target_name
 from utilities.constants import (
     KServeDeploymentType,
     Labels,
@@ -37,7 +55,6 @@ from utilities.constants import (
     Annotations,
     Timeout,
 )
-import portforward
 
 LOGGER = get_logger(name=__name__)
 
@@ -46,6 +63,8 @@ class Inference:
     ALL_TOKENS: str = "all-tokens"
     STREAMING: str = "streaming"
     INFER: str = "infer"
+    # KServe v2 HTTP inference with the binary tensor data extension
+    INFER_BINARY: str = "infer-binary"
     MNIST: str = f"infer-{ModelName.MNIST}"
     GRAPH: str = "graph"
 
@@ -55,10 +74,20 @@ class Inference:
             inference_service: InferenceService object
         """
         self.inference_service = inference_service
-        self.deployment_mode = self.get_deployment_type()
+        # Values resolved from the cluster are cached per InferenceService resourceVersion
+        self.resolver_cache = get_inference_resolver_cache()
+        self.deployment_mode = self.resolver_cache.get(
+            inference_service=self.inference_service, key="deployment_mode", resolve=self.get_deployment_type
+        )
         if isinstance(self.inference_service, InferenceService):
-            self.runtime = get_inference_serving_runtime(isvc=self.inference_service)
-        self.visibility_exposed = self.is_service_exposed()
+            self.runtime = self.resolver_cache.get(
+                inference_service=self.inference_service,
+                key="runtime",
+                resolve=partial(get_inference_serving_runtime, isvc=self.inference_service),
+            )
+        self.visibility_exposed = self.resolver_cache.get(
+            inference_service=self.inference_service, key="visibility_exposed", resolve=self.is_service_exposed
+        )
 
     def get_deployment_type(self) -> str:
         """
@@ -94,18 +123,33 @@ class Inference:
 
         """
         if self.visibility_exposed:
-            if self.deployment_mode == KServeDeploymentType.MODEL_MESH:
-                route = get_model_route(client=self.inference_service.client, isvc=self.inference_service)
-                return route.instance.spec.host
+            return self.resolver_cache.get(
+                inference_service=self.inference_service, key="inference_url", resolve=self.get_exposed_inference_url
+            )
+
+        else:
+            return "localhost"
 
-            elif url := self.inference_service.instance.status.url:
-                return urlparse(url=url).netloc
+    def get_exposed_inference_url(self) -> str:
+        """
+        Get inference url of an exposed service from its route or status url
 
-            else:
-                raise ValueError(f"{self.inference_service.name}: No url found for inference")
+        Returns:
+            inference url
+
+        Raises:
+            ValueError: If the inference url is not found
+
+        """
+        if self.deployment_mode == KServeDeploymentType.MODEL_MESH:
+            route = get_model_route(client=self.inference_service.client, isvc=self.inference_service)
+            return route.instance.spec.host
+
+        elif url := self.inference_service.instance.status.url:
+            return urlparse(url=url).netloc
 
         else:
-            return "localhost"
+            raise ValueError(f"{self.inference_service.name}: No url found for inference")
 
     def is_service_exposed(self) -> bool:
         """
@@ -144,6 +188,7 @@ class UserInference(Inference):
         protocol: str,
         inference_type: str,
         inference_config: dict[str, Any],
+        use_curl: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -153,6 +198,7 @@ class UserInference(Inference):
             protocol (str): inference protocol
             inference_type (str): inference type
             inference_config (dict[str, Any]): inference config
+            use_curl (bool): send inference requests with curl / grpcurl instead of the in-process HTTP and gRPC clients
             **kwargs ():
         """
         super().__init__(**kwargs)
@@ -160,31 +206,42 @@ class UserInference(Inference):
         self.protocol = protocol
         self.inference_type = inference_type
         self.inference_config = inference_config
-        self.runtime_config = self.get_runtime_config()
+        self.use_curl = use_curl
+        self.compiled_runtime_config = self.get_runtime_config()
+        self.runtime_config = self.compiled_runtime_config.runtime_config
+
+        if self.use_curl:
+            self.verify_curl_supported()
+
+    def verify_curl_supported(self) -> None:
+        """
+        Verify that the inference requests of the runtime config can be sent with curl / grpcurl
 
-    def get_runtime_config(self) -> dict[str, Any]:
+        Raises:
+            ValueError: If the requests are sent with binary tensor data, which curl cannot send
+
+        """
+        if self.protocol in Protocols.TCP_PROTOCOLS and self.runtime_config.get("binary_data"):
+            raise ValueError(
+                f"Inference type {self.inference_type} sends binary tensor data, which is not supported with curl"
+            )
+
+    def get_runtime_config(self) -> CompiledRuntimeConfig:
         """
-        Get runtime config from inference config based on inference type and protocol
+        Get the compiled runtime config from the inference config registry based on inference type and protocol
 
         Returns:
-            dict[str, Any]: runtime config
+            CompiledRuntimeConfig: runtime config, with its templates compiled
 
         Raises:
             ValueError: If the runtime config is not found
 
         """
-        if inference_type := self.inference_config.get(self.inference_type):
-            protocol = Protocols.HTTP if self.protocol in Protocols.TCP_PROTOCOLS else self.protocol
-            if data := inference_type.get(protocol):
-                return data
-
-            else:
-                raise ValueError(f"Protocol {protocol} not supported.\nSupported protocols are {self.inference_type}")
-
-        else:
-            raise ValueError(
-                f"Inference type {inference_type} not supported.\nSupported inference types are {self.inference_config}"
-            )
+        return (
+            get_inference_config_registry()
+            .get(inference_config=self.inference_config)
+            .get_runtime_config(inference_type=self.inference_type, protocol=self.protocol)
+        )
 
     @property
     def inference_response_text_key_name(self) -> Optional[str]:
@@ -217,6 +274,8 @@ class UserInference(Inference):
         """
         Get inference body from runtime config
 
+        Default query bodies are rendered once per (inference config, model, inference type, protocol).
+
         Args:
             model_name (str): inference model name
             inference_input (Any): inference input
@@ -233,24 +292,32 @@ class UserInference(Inference):
             raise ValueError("Either pass `inference_input` or set `use_default_query` to True")
 
         if use_default_query:
-            default_query_config = self.inference_config.get("default_query_model")
-            if not default_query_config:
-                raise ValueError(f"Missing default query config for {model_name}")
-
-            if self.inference_config.get("support_multi_default_queries"):
-                inference_input = default_query_config.get(self.inference_type).get("query_input")
-            else:
-                inference_input = default_query_config.get("query_input")
+            inference_input = (
+                get_inference_config_registry()
+                .get(inference_config=self.inference_config)
+                .get_default_query(inference_type=self.inference_type)
+                .query_input
+            )
 
             if not inference_input:
                 raise ValueError(f"Missing default query dict for {model_name}")
 
-        if isinstance(inference_input, list):
-            inference_input = json.dumps(inference_input)
+        def _render_body() -> str:
+            query_input = inference_input
+            if isinstance(query_input, list):
+                query_input = get_payload_store().dumps(payload=query_input)
 
-        return Template(self.runtime_config["body"]).safe_substitute(
-            model_name=model_name,
-            query_input=inference_input,
+            return self.compiled_runtime_config.body.safe_substitute(
+                model_name=model_name,
+                query_input=query_input,
+            )
+
+        if not use_default_query:
+            return _render_body()
+
+        return get_payload_store().get_body(
+            key=(id(self.inference_config), model_name, self.inference_type, self.protocol, "body"),
+            render=_render_body,
         )
 
     def get_inference_endpoint_url(self) -> str:
@@ -264,7 +331,7 @@ class UserInference(Inference):
             ValueError: If the protocol is not supported
 
         """
-        endpoint = Template(self.runtime_config["endpoint"]).safe_substitute(model_name=self.inference_service.name)
+        endpoint = self.compiled_runtime_config.endpoint.safe_substitute(model_name=self.inference_service.name)
 
         if self.protocol in Protocols.TCP_PROTOCOLS:
             return f"{self.protocol}://{self.get_inference_url()}/{endpoint}"
@@ -297,15 +364,23 @@ class UserInference(Inference):
             str: inference command
 
         Raises:
-                ValueError: If the protocol is not supported
+                ValueError: If the protocol is not supported, or for binary tensor data requests which curl
+                    cannot send
 
         """
+        self.verify_curl_supported()
+
         body = self.get_inference_body(
             model_name=model_name,
             inference_input=inference_input,
             use_default_query=use_default_query,
         )
-        header = f"'{Template(self.runtime_config['header']).safe_substitute(model_name=model_name)}'"
+        if body.startswith(PAYLOAD_FILE_PREFIX):
+            # curl reads the body from file, payload files referencing tensor files are rendered to a copy
+            body_file = get_payload_store().get_body_file(path=body.removeprefix(PAYLOAD_FILE_PREFIX))
+            body = f"{PAYLOAD_FILE_PREFIX}{body_file}"
+
+        header = f"'{self.compiled_runtime_config.header.safe_substitute(model_name=model_name)}'"
         url = self.get_inference_endpoint_url()
 
         if self.protocol in Protocols.TCP_PROTOCOLS:
@@ -324,18 +399,11 @@ class UserInference(Inference):
         if token:
             cmd += f" {HTTPRequest.AUTH_HEADER.format(token=token)}"
 
-        if insecure:
-            cmd += " --insecure"
+        if ca := self.get_ca_bundle_path(insecure=insecure):
+            cmd += f" --cacert {ca} "
 
         else:
-            # admin client is needed to check if cluster is managed
-            _client = get_client()
-            if ca := get_ca_bundle(client=_client, deployment_mode=self.deployment_mode):
-                cmd += f" --cacert {ca} "
-
-            else:
-                LOGGER.warning("No CA bundle found, using insecure access")
-                cmd += " --insecure"
+            cmd += " --insecure"
 
         if cmd_args := self.runtime_config.get("args"):
             cmd += f" {cmd_args} "
@@ -344,6 +412,136 @@ class UserInference(Inference):
 
         return cmd
 
+    def get_ca_bundle_path(self, insecure: bool = False) -> str:
+        """
+        Get the CA bundle used to verify the inference endpoint
+
+        Args:
+            insecure (bool): Use insecure connection
+
+        Returns:
+            str: path to CA bundle file, empty string if insecure access should be used
+
+        """
+        if insecure:
+            return ""
+
+        # admin client is needed to check if cluster is managed
+        if ca := get_ca_bundle(client=get_cluster_client(), deployment_mode=self.deployment_mode):
+            return ca
+
+        LOGGER.warning("No CA bundle found, using insecure access")
+        return ""
+
+    def get_inference_headers(
+        self,
+        model_name: str,
+        token: Optional[str] = None,
+        content_headers: Optional[dict[str, str]] = None,
+    ) -> dict[str, str]:
+        """
+        Get HTTP inference request headers from runtime config
+
+        Headers without a value separator are ignored and the content type defaults to
+        `application/x-www-form-urlencoded`, same as curl does for `-d` requests.
+
+        Args:
+            model_name (str): inference model name
+            token (str): Token to use for authentication
+            content_headers (dict[str, str]): headers of the encoded request body, replacing the runtime config
+                content type
+
+        Returns:
+            dict[str, str]: request headers
+
+        """
+        headers = {"Accept": "*/*"}
+
+        header = self.compiled_runtime_config.header.safe_substitute(model_name=model_name)
+        header_name, separator, header_value = header.partition(":")
+        if separator:
+            headers[header_name.strip()] = header_value.strip()
+
+        if content_headers:
+            headers = {
+                header_name: header_value
+                for header_name, header_value in headers.items()
+                if header_name.lower() != "content-type"
+            }
+            headers.update(content_headers)
+
+        if not any(header_name.lower() == "content-type" for header_name in headers):
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        return headers
+
+    def encode_http_request_body(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """
+        Encode HTTP inference request body as set in runtime config
+
+        With `binary_data` set in runtime config, the tensors of the KServe v2 JSON body are sent with the
+        binary tensor data extension. Such requests cannot be sent with curl, see `generate_command`.
+
+        Args:
+            body (bytes): JSON request body
+
+        Returns:
+            tuple[bytes, dict[str, str]]: request body and the content headers to send it with,
+                overriding the runtime config content type
+
+        """
+        if not self.runtime_config.get("binary_data"):
+            return body, {}
+
+        binary_body, json_header_length = encode_binary_inference_request(request=json.loads(body))
+        return binary_body, {
+            "Content-Type": BINARY_DATA_CONTENT_TYPE,
+            INFERENCE_HEADER_CONTENT_LENGTH: str(json_header_length),
+        }
+
+    def get_http_request_body(
+        self,
+        model_name: str,
+        inference_input: Optional[Any] = None,
+        use_default_query: bool = False,
+    ) -> tuple[bytes, dict[str, str]]:
+        """
+        Get HTTP inference request body, encoded as set in runtime config
+
+        Default query bodies are serialized once per (inference config, model, inference type, protocol).
+
+        Args:
+            model_name (str): inference model name
+            inference_input (Any): inference input
+            use_default_query (bool): use default query from inference config
+
+        Returns:
+            tuple[bytes, dict[str, str]]: request body and its content headers
+
+        """
+
+        def _encode_body() -> tuple[bytes, dict[str, str]]:
+            return self.encode_http_request_body(
+                body=get_inference_request_body(
+                    body=self.get_inference_body(
+                        model_name=model_name,
+                        inference_input=inference_input,
+                        use_default_query=use_default_query,
+                    )
+                )
+            )
+
+        if not use_default_query:
+            return _encode_body()
+
+        return get_payload_store().get_body(
+            key=(id(self.inference_config), model_name, self.inference_type, self.protocol, "http-body"),
+            render=_encode_body,
+        )
+
     def run_inference_flow(
         self,
         model_name: str,
@@ -355,6 +553,52 @@ class UserInference(Inference):
         """
         Run inference full flow - generate command and run it
 
+        Responses are recorded to or replayed from the inference cassette if it is enabled.
+
+        Args:
+            model_name (str): inference model name
+            inference_input (str): inference input
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+
+        Returns:
+            dict: inference response dict with response headers and response output
+
+        """
+        return get_cassette().play(
+            kind=CassetteKind.INFERENCE,
+            target=f"{self.inference_service.kind}/{self.inference_service.namespace}/{self.inference_service.name}/"
+            f"{self.protocol}/{self.inference_type}",
+            # Tokens are minted again on every run, only whether the request is authenticated is part of the request
+            request={
+                "model_name": model_name,
+                "inference_input": inference_input,
+                "use_default_query": use_default_query,
+                "insecure": insecure,
+                "authenticated": token is not None,
+            },
+            send=partial(
+                self.send_inference_flow,
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+                insecure=insecure,
+                token=token,
+            ),
+        )
+
+    def send_inference_flow(
+        self,
+        model_name: str,
+        inference_input: Optional[str] = None,
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Send the inference request of `run_inference_flow` and parse its response, bypassing the inference cassette
+
         Args:
             model_name (str): inference model name
             inference_input (str): inference input
@@ -366,6 +610,26 @@ class UserInference(Inference):
             dict: inference response dict with response headers and response output
 
         """
+        if self.is_kserve_v2_grpc_endpoint() and not self.use_curl:
+            return self.run_grpc_inference(
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+                insecure=insecure,
+                token=token,
+            )
+
+        if self.is_http_engine_inference():
+            return self.get_response_dict(
+                response=self.run_http_inference(
+                    model_name=model_name,
+                    inference_input=inference_input,
+                    use_default_query=use_default_query,
+                    insecure=insecure,
+                    token=token,
+                )
+            )
+
         out = self.run_inference(
             model_name=model_name,
             inference_input=inference_input,
@@ -374,31 +638,21 @@ class UserInference(Inference):
             token=token,
         )
 
-        try:
-            if self.protocol in Protocols.TCP_PROTOCOLS:
-                # with curl response headers are also returned
-                response_dict: dict[str, Any] = {}
-                response_headers: list[str] = []
-
-                if "content-type: application/json" in out.lower():
-                    if response_re := re.match(r"(.*)\n\{", out, re.MULTILINE | re.DOTALL):
-                        response_headers = response_re.group(1).splitlines()
-                        if output_re := re.search(r"(\{.*)(?s:.*)(\})", out, re.MULTILINE | re.DOTALL):
-                            output = re.sub(r"\n\s*", "", output_re.group())
-                            response_dict["output"] = json.loads(output)
+        if self.protocol in Protocols.TCP_PROTOCOLS:
+            # with curl response headers are also returned
+            try:
+                response = parse_http_response(raw_response=out)
 
-                else:
-                    response_headers = out.splitlines()[:-2]
-                    response_dict["output"] = json.loads(response_headers[-1])
+            except ValueError:
+                return {"output": out}
 
-                for line in response_headers:
-                    if line:
-                        header_name, header_value = re.split(": | ", line.strip(), maxsplit=1)
-                        response_dict[header_name] = header_value
+            if "application/json" in response.content_type:
+                return self.get_response_dict(response=response)
 
-                return response_dict
-            else:
-                return json.loads(out)
+            return {"output": out}
+
+        try:
+            return json.loads(out)
 
         except JSONDecodeError:
             return {"output": out}
@@ -438,54 +692,443 @@ class UserInference(Inference):
             token=token,
         )
 
-        # For internal inference, we need to use port forwarding to the service
-        if not self.visibility_exposed:
-            if isinstance(self.inference_service, InferenceService):
-                svc = get_services_by_isvc_label(
-                    client=self.inference_service.client,
-                    isvc=self.inference_service,
-                    runtime_name=self.runtime.name,
-                )[0]
-                port = self.get_target_port(svc=svc)
-            else:
-                svc = get_pods_by_ig_label(
-                    client=self.inference_service.client,
-                    ig=self.inference_service,
-                )[0]
-                port = 8080
-
-            cmd = cmd.replace("localhost", f"localhost:{port}")
-
-            with portforward.forward(
-                pod_or_service=svc.name,
-                namespace=svc.namespace,
-                from_port=port,
-                to_port=port,
-            ):
-                res, out, err = run_command(
-                    command=shlex.split(cmd), verify_stderr=False, check=False, hide_log_command=True
-                )
+        with self.port_forward_to_inference_service() as port:
+            if port:
+                cmd = cmd.replace("localhost", f"localhost:{port}")
 
-        else:
             res, out, err = run_command(
                 command=shlex.split(cmd), verify_stderr=False, check=False, hide_log_command=True
             )
 
-        if res:
-            if f"http/1.0 {HTTPStatus.SERVICE_UNAVAILABLE}" in out.lower():
-                raise InferenceResponseError(
-                    f"The Route for {self.get_inference_url()} is not ready yet. "
-                    f"Got {HTTPStatus.SERVICE_UNAVAILABLE} error."
-                )
+            if not res:
+                sanitized_cmd = re.sub(r"('Authorization: Bearer ).*?(')", r"\1***REDACTED***2", cmd)
+                raise ValueError(f"Inference failed with error: {err}\nOutput: {out}\nCommand: {sanitized_cmd}")
 
-        else:
-            sanitized_cmd = re.sub(r"('Authorization: Bearer ).*?(')", r"\1***REDACTED***2", cmd)
-            raise ValueError(f"Inference failed with error: {err}\nOutput: {out}\nCommand: {sanitized_cmd}")
+        if f"http/1.0 {HTTPStatus.SERVICE_UNAVAILABLE}" in out.lower():
+            raise InferenceResponseError(
+                f"The Route for {self.get_inference_url()} is not ready yet. "
+                f"Got {HTTPStatus.SERVICE_UNAVAILABLE} error."
+            )
 
         LOGGER.info(f"Inference output:\n{out}")
 
         return out
 
+    @retry(wait_timeout=Timeout.TIMEOUT_30SEC, sleep=5)
+    def run_http_inference(
+        self,
+        model_name: str,
+        inference_input: Optional[str] = None,
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+    ) -> HttpResponse:
+        """
+        Run HTTP inference request using the in-process HTTP engine
+
+        Args:
+            model_name (str): inference model name
+            inference_input (str): inference input
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+
+        Returns:
+            HttpResponse: inference response
+
+        Raises:
+            ValueError: If inference request fails
+
+        """
+        body, content_headers = self.get_http_request_body(
+            model_name=model_name,
+            inference_input=inference_input,
+            use_default_query=use_default_query,
+        )
+        headers = self.get_inference_headers(model_name=model_name, token=token, content_headers=content_headers)
+        ca_bundle = self.get_ca_bundle_path(insecure=insecure)
+        url = self.get_inference_endpoint_url()
+
+        with self.port_forward_to_inference_service() as port:
+            if port:
+                url = url.replace("localhost", f"localhost:{port}", 1)
+
+            try:
+                response = get_http_engine().request(
+                    url=url,
+                    body=body,
+                    headers=headers,
+                    ca_bundle=ca_bundle,
+                    insecure=not ca_bundle,
+                )
+
+            except (urllib3.exceptions.HTTPError, httpx.HTTPError) as err:
+                raise ValueError(f"Inference failed with error: {err}\nUrl: {url}") from err
+
+        self.verify_route_ready(response=response)
+        LOGGER.info(f"Inference output:\n{response.to_curl_output()}")
+
+        return response
+
+    def verify_route_ready(self, response: HttpResponse) -> None:
+        """
+        Verify that the response was not returned by a Route which is not ready yet
+
+        Args:
+            response (HttpResponse): inference response
+
+        Raises:
+            InferenceResponseError: If the Route is not ready
+
+        """
+        if response.http_version == "HTTP/1.0" and response.status == HTTPStatus.SERVICE_UNAVAILABLE:
+            raise InferenceResponseError(
+                f"The Route for {self.get_inference_url()} is not ready yet. "
+                f"Got {HTTPStatus.SERVICE_UNAVAILABLE} error."
+            )
+
+    def run_inference_many(
+        self,
+        model_name: str,
+        inference_inputs: list[Any],
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[InferenceResult]:
+        """
+        Run a batch of inference requests concurrently
+
+        HTTP requests are sent from a single thread with asyncio, over connections shared by the whole batch.
+        Requests failing because the Route is not ready yet or with a connection error are retried, like
+        `run_inference_flow`; the error of a request still failing after the retries is kept in the request result.
+        gRPC and curl requests are sent with `run_inference_flow`, which already retries them, so they are not
+        retried again by the batch and their latency includes the `run_inference_flow` retries.
+
+        Args:
+            model_name (str): inference model name
+            inference_inputs (list[Any]): inference inputs, one request is sent per input;
+                `None` inputs use the default query if `use_default_query` is set
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+            concurrency (int): maximum number of requests in flight
+
+        Returns:
+            list[InferenceResult]: request results with the inference response dict, in the same order as
+                `inference_inputs`
+
+        """
+        with self.inference_request_sender(
+            model_name=model_name,
+            use_default_query=use_default_query,
+            insecure=insecure,
+            token=token,
+        ) as send_request:
+            return run_inference_batch(
+                inference_inputs=inference_inputs,
+                send_request=send_request,
+                concurrency=concurrency,
+                retry_timeout=Timeout.TIMEOUT_30SEC if self.is_http_engine_inference() else 0,
+            )
+
+    @contextmanager
+    def inference_request_sender(
+        self,
+        model_name: str,
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+    ) -> Generator[SendRequest, Any, Any]:
+        """
+        Get a coroutine function which sends a single inference request, used by batch and load runs
+
+        Default query bodies, CA bundle and url are resolved once, and the port forward (for internal services)
+        is kept open until the context exits.
+        HTTP requests are sent with the asyncio HTTP engine passed to the coroutine function.
+        gRPC and curl requests are sent with `run_inference_flow` from the default asyncio thread pool,
+        and are retried by it.
+
+        Args:
+            model_name (str): inference model name
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+
+        Yields:
+            SendRequest: coroutine function which sends a request for an inference input and returns the
+                inference response dict
+
+        """
+        if not self.is_http_engine_inference():
+
+            async def _run_inference_flow(engine: AsyncHttpEngine, inference_input: Any) -> dict[str, Any]:
+                return await asyncio.to_thread(
+                    self.run_inference_flow,
+                    model_name=model_name,
+                    inference_input=inference_input,
+                    use_default_query=use_default_query,
+                    insecure=insecure,
+                    token=token,
+                )
+
+            yield _run_inference_flow
+            return
+
+        ca_bundle = self.get_ca_bundle_path(insecure=insecure)
+        url = self.get_inference_endpoint_url()
+
+        async def _send_http_request(engine: AsyncHttpEngine, inference_input: Any) -> dict[str, Any]:
+            body, content_headers = self.get_http_request_body(
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+            )
+            response = await engine.request(
+                url=url,
+                body=body,
+                headers=self.get_inference_headers(model_name=model_name, token=token, content_headers=content_headers),
+                ca_bundle=ca_bundle,
+                insecure=not ca_bundle,
+            )
+            self.verify_route_ready(response=response)
+            return self.get_response_dict(response=response)
+
+        with self.port_forward_to_inference_service() as port:
+            if port:
+                url = url.replace("localhost", f"localhost:{port}", 1)
+
+            yield _send_http_request
+
+    def is_http_engine_inference(self) -> bool:
+        """
+        Check if inference requests are sent with the in-process HTTP engine
+
+        Returns:
+            bool: True for HTTP inference not sent with curl, False otherwise
+
+        """
+        return self.protocol in Protocols.TCP_PROTOCOLS and not self.use_curl
+
+    def is_kserve_v2_grpc_endpoint(self) -> bool:
+        """
+        Check if the inference endpoint is a KServe v2 gRPC inference service method
+
+        Returns:
+            bool: True if the inference can be sent with the native KServe v2 gRPC client, False otherwise
+
+        """
+        return self.protocol == Protocols.GRPC and self.runtime_config["endpoint"].startswith(
+            f"{GRPC_INFERENCE_SERVICE}/"
+        )
+
+    def get_grpc_metadata(self, model_name: str, token: Optional[str] = None) -> list[tuple[str, str]]:
+        """
+        Get gRPC inference request metadata from runtime config
+
+        Args:
+            model_name (str): inference model name
+            token (str): Token to use for authentication
+
+        Returns:
+            list[tuple[str, str]]: request metadata
+
+        """
+        metadata = []
+
+        header = self.compiled_runtime_config.header.safe_substitute(model_name=model_name)
+        header_name, separator, header_value = header.partition(":")
+        if separator:
+            metadata.append((header_name.strip().lower(), header_value.strip()))
+
+        if token:
+            metadata.append(("authorization", f"Bearer {token}"))
+
+        return metadata
+
+    @retry(wait_timeout=Timeout.TIMEOUT_30SEC, sleep=5)
+    def run_grpc_inference(
+        self,
+        model_name: str,
+        inference_input: Optional[str] = None,
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Run KServe v2 gRPC inference request using the native gRPC client
+
+        Args:
+            model_name (str): inference model name
+            inference_input (str): inference input
+            use_default_query (bool): use default query from inference config
+            insecure (bool): Use insecure connection
+            token (str): Token to use for authentication
+
+        Returns:
+            dict: inference response, in the same format as returned by grpcurl
+
+        Raises:
+            ValueError: If inference request fails
+
+        """
+        body = json.loads(
+            self.get_inference_body(
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+            )
+        )
+        metadata = self.get_grpc_metadata(model_name=model_name, token=token)
+        host, _, endpoint = self.get_inference_endpoint_url().partition(" ")
+        grpc_method = endpoint.rpartition("/")[2]
+
+        with self.port_forward_to_inference_service() as port:
+            target = host
+            if port:
+                host = f"localhost:{port}"
+                namespace, pod_or_service, target_port = self.get_port_forward_target()
+                target = get_port_forward_target_name(
+                    namespace=namespace, pod_or_service=pod_or_service, port=target_port
+                )
+
+            grpc_plugin = get_kserve_v2_grpc_plugin_manager().get_plugin(
+                host=host,
+                use_tls=self.deployment_mode != KServeDeploymentType.RAW_DEPLOYMENT,
+                ca_bundle=self.get_ca_bundle_path(insecure=insecure),
+                target=target,
+            )
+
+            try:
+                if grpc_method == "ModelInfer":
+                    output = grpc_plugin.model_infer(
+                        request=body,
+                        raw_contents=self.runtime_config.get("raw_contents", False),
+                        metadata=metadata,
+                    )
+
+                elif grpc_method == "ModelMetadata":
+                    output = grpc_plugin.model_metadata(
+                        model_name=body.get("name", model_name),
+                        model_version=body.get("version", ""),
+                        metadata=metadata,
+                    )
+
+                elif grpc_method == "ServerReady":
+                    output = {"ready": grpc_plugin.server_ready(metadata=metadata)}
+
+                else:
+                    raise ValueError(f"gRPC method {endpoint} not supported")
+
+            except grpc.RpcError as err:
+                raise ValueError(f"Inference failed with error: {err}\nHost: {host}\nMethod: {endpoint}") from err
+
+        LOGGER.info(f"Inference output:\n{output}")
+
+        return output
+
+    @staticmethod
+    def get_response_dict(response: HttpResponse) -> dict[str, Any]:
+        """
+        Get inference response dict from HTTP response, in the same format as parsed from curl output
+
+        Args:
+            response (HttpResponse): inference response
+
+        Returns:
+            dict: inference response dict with response headers and response output.
+                If the response is not JSON, the output is the raw response including headers.
+
+        """
+        if "application/json" in response.content_type:
+            try:
+                response_dict: dict[str, Any] = {response.http_version: f"{response.status} {response.reason}"}
+                response_dict.update(response.headers)
+                response_dict["output"] = json.loads(response.body)
+                return response_dict
+
+            except JSONDecodeError:
+                LOGGER.warning("Failed to decode JSON inference response, returning raw response")
+
+        return {"output": response.to_curl_output()}
+
+    def get_port_forward_target(self) -> tuple[str, str, int]:
+        """
+        Get the pod or service and port to port forward to for internal inference
+
+        The service and port of an InferenceService are cached per resourceVersion;
+        InferenceGraph pods are looked up on every call, as they are replaced on restart.
+
+        Returns:
+            tuple[str, str, int]: namespace, pod or service name and target port
+
+        """
+        if isinstance(self.inference_service, InferenceService):
+            return self.resolver_cache.get(
+                inference_service=self.inference_service,
+                key=f"port_forward_target-{self.protocol}",
+                resolve=partial(self.get_service_port_forward_target, isvc=self.inference_service),
+            )
+
+        pod = get_pods_by_ig_label(
+            client=self.inference_service.client,
+            ig=self.inference_service,
+        )[0]
+        if not pod.namespace or not pod.name:
+            raise ResourceNotFoundError(f"{self.inference_service.name} pod has no namespace or name")
+
+        return pod.namespace, pod.name, 8080
+
+    def get_service_port_forward_target(self, isvc: InferenceService) -> tuple[str, str, int]:
+        """
+        Get the InferenceService service and port to port forward to for internal inference
+
+        Args:
+            isvc (InferenceService): InferenceService object
+
+        Returns:
+            tuple[str, str, int]: namespace, service name and target port
+
+        """
+        svc = get_services_by_isvc_label(
+            client=isvc.client,
+            isvc=isvc,
+            runtime_name=self.runtime.name,
+        )[0]
+        if not svc.namespace or not svc.name:
+            raise ResourceNotFoundError(f"{isvc.name} service has no namespace or name")
+
+        return svc.namespace, svc.name, self.get_target_port(svc=svc)
+
+    @contextmanager
+    def port_forward_to_inference_service(self) -> Generator[int | None, Any, Any]:
+        """
+        Get a local port forwarded to the inference service if it is not exposed
+
+        The tunnel is kept open by the session port-forward manager and re-used by later requests;
+        it is closed if the request fails, with the gRPC channel to the target, so the next retry opens new ones.
+
+        Yields:
+            int | None: local port to send requests to, None if the service is exposed
+
+        """
+        if self.visibility_exposed:
+            yield None
+            return
+
+        namespace, pod_or_service, port = self.get_port_forward_target()
+        port_forward_manager = get_port_forward_manager()
+
+        try:
+            yield port_forward_manager.get_local_port(namespace=namespace, pod_or_service=pod_or_service, port=port)
+
+        except Exception:
+            port_forward_manager.close_tunnel(namespace=namespace, pod_or_service=pod_or_service, port=port)
+            get_kserve_v2_grpc_plugin_manager().close_plugin(
+                target=get_port_forward_target_name(namespace=namespace, pod_or_service=pod_or_service, port=port)
+            )
+            raise
+
     def get_target_port(self, svc: Service) -> int:
         """
         Get target port for inference when using port forwarding
@@ -766,6 +1409,26 @@ def create_isvc(
         yield inference_service
 
 
+def get_inference_request_body(body: str) -> bytes:
+    """
+    Get inference request body bytes.
+
+    Body starting with `@` is read from file, same as curl `-d @file` (carriage returns and newlines are stripped);
+    files are read once per process by the payload store.
+
+    Args:
+        body (str): inference body
+
+    Returns:
+        bytes: request body
+
+    """
+    if body.startswith(PAYLOAD_FILE_PREFIX):
+        return get_payload_store().read_file_body(path=body.removeprefix(PAYLOAD_FILE_PREFIX))
+
+    return body.encode()
+
+
 def _check_storage_arguments(
     storage_uri: Optional[str],
     storage_key: Optional[str],
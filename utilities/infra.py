@@ -4,9 +4,10 @@ import re
 import shlex
 import stat
 import tarfile
+import time
 import zipfile
 from contextlib import contextmanager
-from functools import cache
+from functools import cache, partial
 from typing import Any, Generator, Optional, Set, Callable
 
 import kubernetes
@@ -21,6 +22,7 @@ from kubernetes.dynamic.exceptions import (
     NotFoundError,
     ResourceNotFoundError,
 )
+from kubernetes.dynamic.resource import ResourceInstance
 from ocp_resources.catalog_source import CatalogSource
 from ocp_resources.cluster_service_version import ClusterServiceVersion
 from ocp_resources.config_map import ConfigMap
@@ -38,7 +40,7 @@ from ocp_resources.node_config_openshift_io import Node
 from ocp_resources.pod import Pod
 from ocp_resources.project_project_openshift_io import Project
 from ocp_resources.project_request import ProjectRequest
-from ocp_resources.resource import Resource, ResourceEditor, get_client
+from ocp_resources.resource import ResourceEditor
 from ocp_resources.role import Role
 from ocp_resources.route import Route
 from ocp_resources.secret import Secret
@@ -59,14 +61,21 @@ from ocp_resources.subscription import Subscription
 from utilities.constants import ApiGroups, Labels, Timeout, RHOAI_OPERATOR_NAMESPACE
 from utilities.constants import KServeDeploymentType
 from utilities.constants import Annotations
-from utilities.exceptions import ClusterLoginError, FailedPodsError, ResourceNotReadyError, UnexpectedResourceCountError
+from utilities.exceptions import ClusterLoginError, ResourceNotReadyError, UnexpectedResourceCountError
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler, TimeoutWatch, retry
 import utilities.general
-from ocp_resources.utils.constants import DEFAULT_CLUSTER_RETRY_EXCEPTIONS
 from utilities.general import generate_random_name
+from utilities.resource_watch import wait_for_resources
+from utilities.cluster_client import get_cluster_client
+from utilities.pod_health import PodHealthClass, are_pods_ready
+from utilities.pod_informer import get_pod_informer_manager
+from utilities.token_service import DEFAULT_TOKEN_EXPIRATION_SECONDS, get_token_service
 
 LOGGER = get_logger(name=__name__)
 
+# Seconds for the router to apply a route timeout annotation
+ROUTE_TIMEOUT_APPLY_DELAY: int = 10
+
 
 @contextmanager
 def create_ns(
@@ -188,14 +197,23 @@ def wait_for_replicas_in_deployment(deployment: Deployment, replicas: int, timeo
     """
     _replicas: int | None = None
 
+    def _replicas_updated(deployments: list[ResourceInstance]) -> bool:
+        nonlocal _replicas
+        for _deployment in deployments:
+            if (_replicas := _deployment.spec.replicas) == replicas:
+                return True
+
+        return False
+
     try:
-        for sample in TimeoutSampler(
-            wait_timeout=timeout,
-            sleep=5,
-            func=lambda: deployment.instance,
-        ):
-            if sample and (_replicas := sample.spec.replicas) == replicas:
-                return
+        wait_for_resources(
+            client=deployment.client,
+            resource_class=Deployment,
+            namespace=deployment.namespace,
+            name=deployment.name,
+            condition=_replicas_updated,
+            timeout=timeout,
+        )
 
     except TimeoutExpiredError:
         LOGGER.error(
@@ -204,6 +222,57 @@ def wait_for_replicas_in_deployment(deployment: Deployment, replicas: int, timeo
         raise
 
 
+def is_deployment_replicas_deployed(deployment: ResourceInstance, deployed: bool = True) -> bool:
+    """
+    Check if all replicas of a deployment are updated, available and ready, or if it has no replicas.
+
+    Args:
+        deployment (ResourceInstance): Deployment instance
+        deployed (bool): True for replicas deployed, False for no replicas.
+
+    Returns:
+        bool: True if the deployment replicas are in the expected state
+
+    """
+    status = deployment.status
+    spec_replicas = deployment.spec.replicas
+
+    if deployed:
+        return bool(spec_replicas) and spec_replicas == (status.updatedReplicas or 0) == (
+            status.availableReplicas or 0
+        ) == (status.readyReplicas or 0)
+
+    return not (spec_replicas or status.replicas)
+
+
+def wait_for_deployment_replicas(
+    deployment: Deployment, deployed: bool = True, timeout: int = Timeout.TIMEOUT_4MIN
+) -> None:
+    """
+    Wait until all replicas of a deployment are updated, or until it has no replicas.
+
+    Args:
+        deployment (Deployment): Deployment object
+        deployed (bool): True for replicas deployed, False for no replicas.
+        timeout (int): Time to wait for the deployment.
+
+    Raises:
+        TimeoutExpiredError: If the deployment replicas are not in the expected state before timeout.
+
+    """
+    LOGGER.info(f"Wait for deployment {deployment.name} to be deployed: {deployed}")
+    wait_for_resources(
+        client=deployment.client,
+        resource_class=Deployment,
+        namespace=deployment.namespace,
+        name=deployment.name,
+        condition=lambda deployments: any(
+            is_deployment_replicas_deployed(deployment=_deployment, deployed=deployed) for _deployment in deployments
+        ),
+        timeout=timeout,
+    )
+
+
 def wait_for_inference_deployment_replicas(
     client: DynamicClient,
     isvc: InferenceService,
@@ -242,20 +311,22 @@ def wait_for_inference_deployment_replicas(
     if labels:
         label_selector += f",{labels}"
 
-    deployment_list = []
+    deployment_list: list[ResourceInstance] = []
+
+    def _expected_deployments_found(deployments: list[ResourceInstance]) -> bool:
+        nonlocal deployment_list
+        deployment_list = deployments
+        return len(deployments) == expected_num_deployments
+
     try:
-        for deployments in TimeoutSampler(
-            wait_timeout=timeout_watcher.remaining_time(),
-            sleep=5,
-            exceptions_dict=DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
-            func=Deployment.get,
-            label_selector=label_selector,
-            dyn_client=client,
+        wait_for_resources(
+            client=client,
+            resource_class=Deployment,
             namespace=ns,
-        ):
-            deployment_list = list(deployments)
-            if len(deployment_list) == expected_num_deployments:
-                break
+            label_selector=label_selector,
+            condition=_expected_deployments_found,
+            timeout=timeout_watcher.remaining_time(),
+        )
     except TimeoutExpiredError as e:
         # If the last exception raised prior to the timeout expiring is None, this means that
         # the deployments were successfully retrieved, but the expected number was not found.
@@ -267,25 +338,32 @@ def wait_for_inference_deployment_replicas(
         raise
 
     LOGGER.info("Waiting for inference deployment replicas to complete")
-    for deployment in deployment_list:
+    deployments = [
+        Deployment(client=client, name=deployment.metadata.name, namespace=ns) for deployment in deployment_list
+    ]
+    isvc_instance = isvc.instance
+
+    for deployment in deployments:
         if deployment.exists:
             # Raw deployment: if min replicas is more than 1, wait for min replicas
             # to be set in deployment spec by HPA
             if (
-                isvc.instance.metadata.annotations.get("serving.kserve.io/deploymentMode")
+                isvc_instance.metadata.annotations.get("serving.kserve.io/deploymentMode")
                 == KServeDeploymentType.RAW_DEPLOYMENT
             ):
                 wait_for_replicas_in_deployment(
                     deployment=deployment,
-                    replicas=isvc.instance.spec.predictor.get("minReplicas", 1),
+                    replicas=isvc_instance.spec.predictor.get("minReplicas", 1),
                     timeout=timeout_watcher.remaining_time(),
                 )
 
-            deployment.wait_for_replicas(deployed=deployed, timeout=timeout_watcher.remaining_time())
+            wait_for_deployment_replicas(
+                deployment=deployment, deployed=deployed, timeout=timeout_watcher.remaining_time()
+            )
         else:
             raise ResourceNotFoundError(f"Predictor deployment {deployment.name} does not exist on the server.")
 
-    return deployment_list
+    return deployments
 
 
 @contextmanager
@@ -557,14 +635,9 @@ def get_pods_by_ig_label(client: DynamicClient, ig: InferenceGraph) -> list[Pod]
     """
     label_selector = utilities.general.create_ig_pod_label_selector_str(ig=ig)
 
-    if pods := [
-        pod
-        for pod in Pod.get(
-            dyn_client=client,
-            namespace=ig.namespace,
-            label_selector=label_selector,
-        )
-    ]:
+    if pods := get_pod_informer_manager().get_pods(
+        client=client, namespace=ig.namespace, label_selector=label_selector
+    ):
         return pods
 
     raise ResourceNotFoundError(f"{ig.name} has no pods")
@@ -587,14 +660,9 @@ def get_pods_by_isvc_label(client: DynamicClient, isvc: InferenceService, runtim
         isvc=isvc, resource_type="pod", runtime_name=runtime_name
     )
 
-    if pods := [
-        pod
-        for pod in Pod.get(
-            dyn_client=client,
-            namespace=isvc.namespace,
-            label_selector=label_selector,
-        )
-    ]:
+    if pods := get_pod_informer_manager().get_pods(
+        client=client, namespace=isvc.namespace, label_selector=label_selector
+    ):
         return pods
 
     raise ResourceNotFoundError(f"{isvc.name} has no pods")
@@ -602,13 +670,24 @@ def get_pods_by_isvc_label(client: DynamicClient, isvc: InferenceService, runtim
 
 def get_openshift_token() -> str:
     """
-    Get the OpenShift token.
+    Get the OpenShift token of the current kubeconfig context, same as `oc whoami -t`.
+
+    The kubeconfig is read on every call, so the token follows `oc login` to another user.
 
     Returns:
         str: The OpenShift token.
 
+    Raises:
+        ValueError: If the current context does not use a token.
+
     """
-    return run_command(command=shlex.split("oc whoami -t"))[1].strip()
+    configuration = kubernetes.client.Configuration()
+    kubernetes.config.load_kube_config(client_configuration=configuration)
+
+    if not (authorization := configuration.api_key.get("authorization")):
+        raise ValueError("No token is used by the current kubeconfig context")
+
+    return authorization.removeprefix("Bearer ").strip()
 
 
 def get_kserve_storage_initialize_image(client: DynamicClient) -> str:
@@ -689,20 +768,35 @@ def get_model_route(client: DynamicClient, isvc: InferenceService) -> Route:
     raise ResourceNotFoundError(f"{isvc.name} has no routes")
 
 
-def create_inference_token(model_service_account: ServiceAccount) -> str:
+def create_inference_token(
+    model_service_account: ServiceAccount,
+    audience: Optional[str] = None,
+    expiration_seconds: int = DEFAULT_TOKEN_EXPIRATION_SECONDS,
+    cache: bool = False,
+) -> str:
     """
     Generates an inference token for the given model service account.
 
+    Tokens are minted with the TokenRequest API. A new token is minted on every call unless `cache` is set,
+    e.g. so that a proxy authorization cache does not hold a decision made with a previous token.
+
     Args:
         model_service_account (ServiceAccount): An object containing the namespace and name
                                of the service account.
+        audience (str, optional): token audience, the API server audience if not set.
+        expiration_seconds (int): requested token lifetime.
+        cache (bool): reuse a token minted by a previous call until it is close to expiry,
+            for load and benchmark callers that request tokens repeatedly.
 
     Returns:
         str: The generated inference token.
     """
-    return run_command(
-        shlex.split(f"oc create token -n {model_service_account.namespace} {model_service_account.name}")
-    )[1].strip()
+    return get_token_service().get_token(
+        service_account=model_service_account,
+        audience=audience,
+        expiration_seconds=expiration_seconds,
+        refresh=not cache,
+    )
 
 
 @contextmanager
@@ -756,63 +850,28 @@ def verify_no_failed_pods(
     """
     wait_for_isvc_pods(client=client, isvc=isvc, runtime_name=runtime_name)
 
-    LOGGER.info("Verifying no failed pods")
-    for pods in TimeoutSampler(
-        wait_timeout=timeout,
-        sleep=10,
-        func=get_pods_by_isvc_label,
-        client=client,
-        isvc=isvc,
-        runtime_name=runtime_name,
-    ):
-        ready_pods = 0
-        failed_pods: dict[str, Any] = {}
-
-        container_wait_base_errors = ["InvalidImageName"]
-        container_terminated_base_errors = [Resource.Status.ERROR]
-
-        # For Model Mesh, if image pulling takes longer, pod may be in CrashLoopBackOff state but recover with retries.
-        if (
-            deployment_mode := isvc.instance.metadata.annotations.get("serving.kserve.io/deploymentMode")
-        ) and deployment_mode != KServeDeploymentType.MODEL_MESH:
-            container_wait_base_errors.append(Resource.Status.CRASH_LOOPBACK_OFF)
-            container_terminated_base_errors.append(Resource.Status.CRASH_LOOPBACK_OFF)
-
-        if pods:
-            for pod in pods:
-                for condition in pod.instance.status.conditions:
-                    if condition.type == pod.Status.READY and condition.status == pod.Condition.Status.TRUE:
-                        ready_pods += 1
+    failed_classes = PodHealthClass.FAILED_CLASSES
 
-            if ready_pods == len(pods):
-                return
-
-            for pod in pods:
-                pod_status = pod.instance.status
-
-                if pod_status.containerStatuses:
-                    for container_status in pod_status.get("containerStatuses", []) + pod_status.get(
-                        "initContainerStatuses", []
-                    ):
-                        is_waiting_pull_back_off = (
-                            wait_state := container_status.state.waiting
-                        ) and wait_state.reason in container_wait_base_errors
-
-                        is_terminated_error = (
-                            terminate_state := container_status.state.terminated
-                        ) and terminate_state.reason in container_terminated_base_errors
-
-                        if is_waiting_pull_back_off or is_terminated_error:
-                            failed_pods[pod.name] = pod_status
-
-                elif pod_status.phase in (
-                    pod.Status.CRASH_LOOPBACK_OFF,
-                    pod.Status.FAILED,
-                ):
-                    failed_pods[pod.name] = pod_status
+    # For Model Mesh, if image pulling takes longer, pod may be in CrashLoopBackOff state but recover with retries.
+    if (
+        not (deployment_mode := isvc.instance.metadata.annotations.get("serving.kserve.io/deploymentMode"))
+        or deployment_mode == KServeDeploymentType.MODEL_MESH
+    ):
+        failed_classes = tuple(
+            health_class for health_class in failed_classes if health_class != PodHealthClass.CRASHLOOP
+        )
 
-            if failed_pods:
-                raise FailedPodsError(pods=failed_pods)
+    LOGGER.info("Verifying no failed pods")
+    wait_for_resources(
+        client=client,
+        resource_class=Pod,
+        namespace=isvc.namespace,
+        label_selector=utilities.general.create_isvc_label_selector_str(
+            isvc=isvc, resource_type="pod", runtime_name=runtime_name
+        ),
+        condition=partial(are_pods_ready, failed_classes=failed_classes),
+        timeout=timeout,
+    )
 
 
 def check_pod_status_in_time(pod: Pod, status: Set[str], duration: int = Timeout.TIMEOUT_2MIN, wait: int = 1) -> None:
@@ -928,9 +987,8 @@ def wait_for_route_timeout(name: str, namespace: str, route_timeout: str) -> Non
     """
     Wait for route to be annotated with timeout value.
     Given that there is a delay between the openshift route timeout annotation being set
-    and the timeout being applied to the route, a counter is instituted to wait until the
-    annotation is found in the route twice. This allows for the TimeoutSampler sleep time
-    to be executed and the route timeout to be successfully applied.
+    and the timeout being applied to the route, once the annotation is found the router is
+    given `ROUTE_TIMEOUT_APPLY_DELAY` seconds to apply the timeout.
 
     Args:
         name (str): Name of the route.
@@ -940,24 +998,18 @@ def wait_for_route_timeout(name: str, namespace: str, route_timeout: str) -> Non
     Raises:
         TimeoutExpiredError: If route annotation is not set to the expected value before timeout expires.
     """
-    annotation_found_count = 0
-    for route in TimeoutSampler(
-        wait_timeout=Timeout.TIMEOUT_30SEC,
-        sleep=10,
-        exceptions_dict={ResourceNotFoundError: []},
-        func=Route,
-        name=name,
+    wait_for_resources(
+        client=get_cluster_client(),
+        resource_class=Route,
         namespace=namespace,
-        ensure_exists=True,
-    ):
-        if (
-            route.instance.metadata.get("annotations", {}).get(Annotations.HaproxyRouterOpenshiftIo.TIMEOUT)
-            != route_timeout
-        ):
-            continue
-        annotation_found_count += 1
-        if annotation_found_count == 2:
-            return
+        name=name,
+        condition=lambda routes: any(
+            route.metadata.get("annotations", {}).get(Annotations.HaproxyRouterOpenshiftIo.TIMEOUT) == route_timeout
+            for route in routes
+        ),
+        timeout=Timeout.TIMEOUT_30SEC,
+    )
+    time.sleep(ROUTE_TIMEOUT_APPLY_DELAY)
 
 
 def wait_for_serverless_pods_deletion(resource: Project | Namespace, admin_client: DynamicClient | None) -> None:
@@ -972,7 +1024,7 @@ def wait_for_serverless_pods_deletion(resource: Project | Namespace, admin_clien
         bool: True if we should wait for namespace deletion else False
 
     """
-    client = admin_client or get_client()
+    client = admin_client or get_cluster_client()
     for pod in Pod.get(dyn_client=client, namespace=resource.name):
         try:
             if (
@@ -987,11 +1039,6 @@ def wait_for_serverless_pods_deletion(resource: Project | Namespace, admin_clien
             LOGGER.info(f"Pod {pod.name} is deleted")
 
 
-@retry(
-    wait_timeout=Timeout.TIMEOUT_30SEC,
-    sleep=1,
-    exceptions_dict={ResourceNotFoundError: []},
-)
 def wait_for_isvc_pods(client: DynamicClient, isvc: InferenceService, runtime_name: str | None = None) -> list[Pod]:
     """
     Wait for ISVC pods.
@@ -1008,11 +1055,21 @@ def wait_for_isvc_pods(client: DynamicClient, isvc: InferenceService, runtime_na
         TimeoutExpiredError: If pods do not exist
     """
     LOGGER.info("Waiting for pods to be created")
-    return get_pods_by_isvc_label(client=client, isvc=isvc, runtime_name=runtime_name)
+    pods = wait_for_resources(
+        client=client,
+        resource_class=Pod,
+        namespace=isvc.namespace,
+        label_selector=utilities.general.create_isvc_label_selector_str(
+            isvc=isvc, resource_type="pod", runtime_name=runtime_name
+        ),
+        condition=bool,
+        timeout=Timeout.TIMEOUT_30SEC,
+    )
+    return [Pod(client=client, name=pod.metadata.name, namespace=isvc.namespace) for pod in pods]
 
 
 def get_rhods_subscription() -> Subscription | None:
-    subscriptions = Subscription.get(dyn_client=get_client(), namespace=RHOAI_OPERATOR_NAMESPACE)
+    subscriptions = Subscription.get(dyn_client=get_cluster_client(), namespace=RHOAI_OPERATOR_NAMESPACE)
     if subscriptions:
         for subscription in subscriptions:
             LOGGER.info(f"Checking subscription {subscription.name}")
@@ -15,8 +15,11 @@ from simple_logger.logger import get_logger
 from timeout_sampler import retry, TimeoutWatch
 
 from utilities.certificates_utils import get_ca_bundle
+from utilities.cluster_client import get_cluster_client
 from utilities.constants import HTTPRequest, Timeout
 from utilities.exceptions import InferenceResponseError
+from utilities.http_engine import AsyncHttpEngine
+from utilities.inference_batch import DEFAULT_CONCURRENCY, InferenceResult, run_inference_batch
 from utilities.infra import get_services_by_isvc_label
 from utilities.llmd_constants import (
     LLMDGateway,
@@ -400,6 +403,7 @@ def verify_inference_response_llmd(
     insecure: bool = False,
     token: Optional[str] = None,
     authorized_user: Optional[bool] = None,
+    num_requests: int = 1,
 ) -> None:
     """
     Verify the LLM inference response following the pattern of verify_inference_response.
@@ -416,13 +420,14 @@ def verify_inference_response_llmd(
         insecure: Whether to use insecure connections
         token: Authentication token (optional)
         authorized_user: Whether user should be authorized (optional)
+        num_requests: Number of concurrent requests to send; every response is verified
 
     Raises:
         InferenceResponseError: If inference response is invalid
         ValueError: If inference response validation fails
     """
 
-    model_name = model_name or llm_service.name
+    model_name = model_name or llm_service.name or ""
     inference = LLMUserInference(
         llm_service=llm_service,
         inference_config=inference_config,
@@ -430,26 +435,43 @@ def verify_inference_response_llmd(
         protocol=protocol,
     )
 
-    res = inference.run_inference_flow(
-        model_name=model_name,
-        inference_input=inference_input,
-        use_default_query=use_default_query,
-        token=token,
-        insecure=insecure,
-    )
-
-    if authorized_user is False:
-        _validate_unauthorized_response(res=res, token=token, inference=inference)
-    else:
-        _validate_authorized_response(
-            res=res,
-            inference=inference,
-            inference_config=inference_config,
-            inference_type=inference_type,
-            expected_response_text=expected_response_text,
-            use_default_query=use_default_query,
+    if num_requests > 1:
+        results = inference.run_inference_many(
             model_name=model_name,
+            inference_inputs=[inference_input] * num_requests,
+            use_default_query=use_default_query,
+            token=token,
+            insecure=insecure,
         )
+        if errors := [result.error for result in results if result.error]:
+            raise InferenceResponseError(f"Failed to run inference. Error: {errors}")
+
+        responses = [result.response for result in results if result.response]
+
+    else:
+        responses = [
+            inference.run_inference_flow(
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+                token=token,
+                insecure=insecure,
+            )
+        ]
+
+    for res in responses:
+        if authorized_user is False:
+            _validate_unauthorized_response(res=res, token=token, inference=inference)
+        else:
+            _validate_authorized_response(
+                res=res,
+                inference=inference,
+                inference_config=inference_config,
+                inference_type=inference_type,
+                expected_response_text=expected_response_text,
+                use_default_query=use_default_query,
+                model_name=model_name,
+            )
 
 
 class LLMUserInference:
@@ -566,24 +588,25 @@ class LLMUserInference:
         if token:
             cmd += f" {HTTPRequest.AUTH_HEADER.format(token=token)}"
 
-        if insecure:
-            cmd += " --insecure"
+        if ca_bundle := self.get_ca_bundle_path(insecure=insecure):
+            cmd += f" --cacert {ca_bundle}"
         else:
-            try:
-                from ocp_resources.resource import get_client
-
-                client = get_client()
-                ca_bundle = get_ca_bundle(client=client, deployment_mode="raw")
-                if ca_bundle:
-                    cmd += f" --cacert {ca_bundle}"
-                else:
-                    cmd += " --insecure"
-            except Exception:
-                cmd += " --insecure"
+            cmd += " --insecure"
 
         cmd += f" --max-time {LLMEndpoint.DEFAULT_TIMEOUT} {endpoint_url}"
         return cmd
 
+    def get_ca_bundle_path(self, insecure: bool = False) -> str:
+        """Get the CA bundle used to verify the LLM endpoint, empty string if insecure access should be used."""
+        if insecure:
+            return ""
+
+        try:
+            client = get_cluster_client()
+            return get_ca_bundle(client=client, deployment_mode="raw") or ""
+        except Exception:
+            return ""
+
     @retry(wait_timeout=Timeout.TIMEOUT_30SEC, sleep=5)
     def run_inference(
         self,
@@ -625,6 +648,52 @@ class LLMUserInference:
         )
         return {"output": out}
 
+    def run_inference_many(
+        self,
+        model_name: str,
+        inference_inputs: list[Any],
+        use_default_query: bool = False,
+        insecure: bool = False,
+        token: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[InferenceResult]:
+        """
+        Run a batch of LLM inference requests concurrently, over connections shared by the whole batch.
+
+        Each response dict has the same format as returned by `run_inference_flow`.
+        Requests failing with a connection error are retried, like `run_inference_flow`; the error of a request
+        still failing after the retries is kept in the request result.
+        """
+        endpoint_url = f"{get_llm_inference_url(llm_service=self.llm_service)}{LLMEndpoint.CHAT_COMPLETIONS}"
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        ca_bundle = self.get_ca_bundle_path(insecure=insecure)
+
+        async def _send_request(engine: AsyncHttpEngine, inference_input: Any) -> Dict[str, Any]:
+            body = self.get_inference_body(
+                model_name=model_name,
+                inference_input=inference_input,
+                use_default_query=use_default_query,
+            )
+            response = await engine.request(
+                url=endpoint_url,
+                body=body.encode(),
+                headers=headers,
+                ca_bundle=ca_bundle,
+                insecure=not ca_bundle,
+                timeout=LLMEndpoint.DEFAULT_TIMEOUT,
+            )
+            return {"output": response.to_curl_output()}
+
+        return run_inference_batch(
+            inference_inputs=inference_inputs,
+            send_request=_send_request,
+            concurrency=concurrency,
+            retry_timeout=Timeout.TIMEOUT_30SEC,
+        )
+
 
 def _validate_unauthorized_response(res: Dict[str, Any], token: Optional[str], inference: LLMUserInference) -> None:
     """Validate response for unauthorized users."""
@@ -0,0 +1,475 @@
+import asyncio
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from simple_logger.logger import get_logger
+
+from utilities.http_engine import AsyncHttpEngine, HttpVersion, is_http2_enabled
+from utilities.inference_batch import SendRequest
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_MAX_IN_FLIGHT: int = 256
+CONCURRENCY_POLL_INTERVAL: float = 0.05
+REPORT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+
+class LoadMode:
+    # Open loop: requests are sent on a fixed schedule (requests per second), regardless of responses
+    RATE: str = "rate"
+    # Closed loop: a fixed number of requests is kept in flight
+    CONCURRENCY: str = "concurrency"
+
+
+@dataclass
+class LoadStage:
+    """
+    A load schedule stage.
+
+    The target (requests per second or concurrent requests, depending on the load mode) changes
+    linearly from `start` to `end` over the stage duration.
+    """
+
+    duration: float
+    start: float
+    end: float
+
+    def target_at(self, offset: float) -> float:
+        return self.start + (self.end - self.start) * offset / self.duration
+
+
+def constant_load(target: float, duration: float) -> list[LoadStage]:
+    """
+    Get a load schedule with a constant target.
+
+    Args:
+        target (float): requests per second or concurrent requests
+        duration (float): load duration in seconds
+
+    Returns:
+        list[LoadStage]: load schedule
+
+    """
+    return [LoadStage(duration=duration, start=target, end=target)]
+
+
+def ramp_load(start: float, end: float, duration: float) -> list[LoadStage]:
+    """
+    Get a load schedule with a target changing linearly from `start` to `end`.
+
+    Args:
+        start (float): target at the beginning of the load
+        end (float): target at the end of the load
+        duration (float): load duration in seconds
+
+    Returns:
+        list[LoadStage]: load schedule
+
+    """
+    return [LoadStage(duration=duration, start=start, end=end)]
+
+
+def step_load(targets: list[float], step_duration: float) -> list[LoadStage]:
+    """
+    Get a load schedule holding each target for `step_duration` seconds.
+
+    Args:
+        targets (list[float]): targets, in order
+        step_duration (float): duration of each step in seconds
+
+    Returns:
+        list[LoadStage]: load schedule
+
+    """
+    return [LoadStage(duration=step_duration, start=target, end=target) for target in targets]
+
+
+def get_target_at(stages: list[LoadStage], offset: float) -> float:
+    """
+    Get the schedule target at a given time.
+
+    Args:
+        stages (list[LoadStage]): load schedule
+        offset (float): seconds since the load started
+
+    Returns:
+        float: target at `offset`, 0 after the schedule ends
+
+    """
+    for stage in stages:
+        if offset < stage.duration:
+            return stage.target_at(offset=offset)
+
+        offset -= stage.duration
+
+    return 0.0
+
+
+def get_request_offsets(stages: list[LoadStage]) -> list[float]:
+    """
+    Get the intended send time of each request of an open-loop (requests per second) schedule.
+
+    The number of requests sent by time t in a stage is the integral of the rate, `start * t + slope * t^2 / 2`;
+    request k is sent when that integral reaches k.
+
+    Args:
+        stages (list[LoadStage]): load schedule, targets are requests per second
+
+    Returns:
+        list[float]: request send times, in seconds since the load started
+
+    """
+    offsets: list[float] = []
+    stage_start = 0.0
+
+    for stage in stages:
+        half_slope = (stage.end - stage.start) / (2 * stage.duration)
+        request_index = 0
+
+        while True:
+            if half_slope:
+                discriminant = stage.start**2 + 4 * half_slope * request_index
+                if discriminant < 0:
+                    break
+
+                offset = (math.sqrt(discriminant) - stage.start) / (2 * half_slope)
+
+            elif stage.start > 0:
+                offset = request_index / stage.start
+
+            else:
+                break
+
+            if offset >= stage.duration:
+                break
+
+            offsets.append(stage_start + offset)
+            request_index += 1
+
+        stage_start += stage.duration
+
+    return offsets
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram, in microseconds.
+
+    Values are counted in log-linear buckets with a fixed relative precision (`significant_figures`),
+    so recording is O(1) and memory depends on the value range, not on the number of samples.
+    """
+
+    def __init__(self, significant_figures: int = 3) -> None:
+        """
+        Args:
+            significant_figures (int): number of significant decimal digits kept for each value
+        """
+        self._sub_bucket_half_count_magnitude = math.ceil(math.log2(2 * 10**significant_figures)) - 1
+        self._sub_bucket_half_count = 1 << self._sub_bucket_half_count_magnitude
+        self._sub_bucket_mask = (self._sub_bucket_half_count << 1) - 1
+        self._counts: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0
+        self.min_value = 0
+        self.max_value = 0
+
+    def _get_index(self, value: int) -> int:
+        bucket_index = (value | self._sub_bucket_mask).bit_length() - self._sub_bucket_half_count_magnitude - 1
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self._sub_bucket_half_count_magnitude) + (
+            sub_bucket_index - self._sub_bucket_half_count
+        )
+
+    def _get_highest_equivalent_value(self, index: int) -> int:
+        bucket_index = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+
+        return (sub_bucket_index << bucket_index) + (1 << bucket_index) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Record a value.
+
+        Args:
+            value (int): value in microseconds
+
+        """
+        value = max(value, 0)
+        self._counts[self._get_index(value=value)] += 1
+        self.min_value = value if not self.count else min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Get the value at a given percentile.
+
+        Args:
+            percentile (float): percentile, between 0 and 100
+
+        Returns:
+            int: the highest value, within the histogram precision, below which `percentile` of the values fall
+
+        """
+        if not self.count:
+            return 0
+
+        target_count = max(1, math.ceil(percentile / 100 * self.count))
+        cumulative_count = 0
+
+        for index in sorted(self._counts):
+            cumulative_count += self._counts[index]
+            if cumulative_count >= target_count:
+                return min(self._get_highest_equivalent_value(index=index), self.max_value)
+
+        return self.max_value
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Get histogram summary in milliseconds.
+
+        Returns:
+            dict[str, float]: min, mean, report percentiles and max
+
+        """
+        summary = {"min": self.min_value / 1000, "mean": round(self.mean / 1000, 3)}
+        summary.update({
+            f"p{percentile:g}": self.percentile(percentile=percentile) / 1000 for percentile in REPORT_PERCENTILES
+        })
+        summary["max"] = self.max_value / 1000
+        return summary
+
+
+@dataclass
+class LoadReport:
+    """
+    Results of a load run.
+
+    `latency` is measured from the intended send time of each request, so time spent waiting to be sent
+    behind slow requests is included (coordinated-omission safe). `service_time` is measured from the actual send time.
+    """
+
+    name: str
+    mode: str
+    stages: list[LoadStage]
+    http_version: str = HttpVersion.HTTP_1_1
+    duration: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors_by_type: Counter[str] = field(default_factory=Counter)
+
+    def record_request(self, latency: float, service_time: float, error: Optional[Exception] = None) -> None:
+        """
+        Record a request.
+
+        Args:
+            latency (float): seconds from the intended send time to the response
+            service_time (float): seconds from the actual send time to the response
+            error (Exception): request error, if the request failed
+
+        """
+        self.requests += 1
+        if error:
+            self.errors += 1
+            self.errors_by_type[type(error).__name__] += 1
+            return
+
+        self.latency.record(value=round(latency * 1_000_000))
+        self.service_time.record(value=round(service_time * 1_000_000))
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return (self.requests - self.errors) / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "mode": self.mode,
+            "http_version": self.http_version,
+            "stages": [{"duration": stage.duration, "start": stage.start, "end": stage.end} for stage in self.stages],
+            "duration_seconds": round(self.duration, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 4),
+            "errors_by_type": dict(self.errors_by_type),
+            "throughput_rps": round(self.throughput, 3),
+            "latency_ms": self.latency.to_dict(),
+            "service_time_ms": self.service_time.to_dict(),
+        }
+
+    def write_json(self, path: Path) -> None:
+        """
+        Write the report to a JSON file.
+
+        Args:
+            path (Path): report file path
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        LOGGER.info(f"Load report {self.name} written to {path}")
+
+
+async def _send_and_record(
+    engine: AsyncHttpEngine,
+    send_request: SendRequest,
+    inference_input: Any,
+    intended_start: float,
+    report: LoadReport,
+) -> None:
+    start = time.perf_counter()
+    error: Optional[Exception] = None
+
+    try:
+        await send_request(engine, inference_input)
+
+    except Exception as ex:
+        error = ex
+
+    end = time.perf_counter()
+    report.record_request(latency=end - intended_start, service_time=end - start, error=error)
+
+
+async def _run_rate_load(
+    send_request: SendRequest, inference_input: Any, max_in_flight: int, report: LoadReport, http2: bool
+) -> None:
+    semaphore = asyncio.Semaphore(value=max_in_flight)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def _send(engine: AsyncHttpEngine, intended_start: float) -> None:
+        try:
+            await _send_and_record(
+                engine=engine,
+                send_request=send_request,
+                inference_input=inference_input,
+                intended_start=intended_start,
+                report=report,
+            )
+
+        finally:
+            semaphore.release()
+
+    async with AsyncHttpEngine(max_connections=max_in_flight, http2=http2) as engine:
+        load_start = time.perf_counter()
+
+        for offset in get_request_offsets(stages=report.stages):
+            if (delay := load_start + offset - time.perf_counter()) > 0:
+                await asyncio.sleep(delay)
+
+            # If `max_in_flight` requests are pending the request is sent late, its latency still counts from `offset`
+            await semaphore.acquire()
+            task = asyncio.create_task(_send(engine=engine, intended_start=load_start + offset))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+        report.duration = time.perf_counter() - load_start
+
+
+async def _run_concurrency_load(
+    send_request: SendRequest, inference_input: Any, report: LoadReport, http2: bool
+) -> None:
+    schedule_duration = sum(stage.duration for stage in report.stages)
+    num_workers = math.ceil(max(max(stage.start, stage.end) for stage in report.stages))
+
+    async with AsyncHttpEngine(max_connections=num_workers, http2=http2) as engine:
+        load_start = time.perf_counter()
+
+        async def _worker(worker_index: int) -> None:
+            while (offset := time.perf_counter() - load_start) < schedule_duration:
+                if worker_index >= get_target_at(stages=report.stages, offset=offset):
+                    await asyncio.sleep(CONCURRENCY_POLL_INTERVAL)
+                    continue
+
+                await _send_and_record(
+                    engine=engine,
+                    send_request=send_request,
+                    inference_input=inference_input,
+                    intended_start=time.perf_counter(),
+                    report=report,
+                )
+
+        await asyncio.gather(*[_worker(worker_index=worker_index) for worker_index in range(num_workers)])
+        report.duration = time.perf_counter() - load_start
+
+
+def run_inference_load(
+    send_request: SendRequest,
+    stages: list[LoadStage],
+    mode: str = LoadMode.RATE,
+    inference_input: Any = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    name: str = "inference-load",
+    http2: Optional[bool] = None,
+) -> LoadReport:
+    """
+    Run an inference load following a schedule and report latency, throughput and errors.
+
+    Args:
+        send_request (SendRequest): coroutine function which sends a single request,
+            e.g. from `UserInference.inference_request_sender`
+        stages (list[LoadStage]): load schedule, see `constant_load`, `ramp_load` and `step_load`
+        mode (str): `LoadMode.RATE` - stage targets are requests per second (open loop), or
+            `LoadMode.CONCURRENCY` - stage targets are concurrent requests (closed loop)
+        inference_input (Any): inference input sent with every request
+        max_in_flight (int): maximum number of pending requests in rate mode
+        name (str): report name
+        http2 (bool): send requests over HTTP/2, multiplexed over one connection per host, to compare with HTTP/1.1
+            which opens a connection per in-flight request. Defaults to the `--inference-http-version` option
+
+    Returns:
+        LoadReport: load report
+
+    Raises:
+        ValueError: If the load mode is not supported
+
+    """
+    http2 = is_http2_enabled() if http2 is None else http2
+    report = LoadReport(
+        name=name, mode=mode, stages=stages, http_version=HttpVersion.HTTP_2 if http2 else HttpVersion.HTTP_1_1
+    )
+    LOGGER.info(f"Running {mode} load {name} over HTTP/{report.http_version}: {stages}")
+
+    if mode == LoadMode.RATE:
+        asyncio.run(
+            _run_rate_load(
+                send_request=send_request,
+                inference_input=inference_input,
+                max_in_flight=max_in_flight,
+                report=report,
+                http2=http2,
+            )
+        )
+
+    elif mode == LoadMode.CONCURRENCY:
+        asyncio.run(
+            _run_concurrency_load(
+                send_request=send_request, inference_input=inference_input, report=report, http2=http2
+            )
+        )
+
+    else:
+        raise ValueError(f"Load mode {mode} not supported")
+
+    LOGGER.info(f"Load {name} results: {json.dumps(report.to_dict())}")
+    return report
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from functools import cache
+from typing import Any, Callable, Hashable, TypeVar
+
+import numpy as np
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+PAYLOAD_FILE_PREFIX: str = "@"
+TENSOR_FILE_SUFFIX: str = ".npy"
+TENSOR_DATA_KEY: str = "data"
+
+T = TypeVar("T")
+
+
+def is_tensor_file_reference(value: Any) -> bool:
+    """
+    Check if a value references a `.npy` tensor file, e.g. `@utilities/manifests/openvino/mnist-input.npy`
+
+    Args:
+        value (Any): value to check
+
+    Returns:
+        bool: True if the value is a tensor file reference
+
+    """
+    return isinstance(value, str) and value.startswith(PAYLOAD_FILE_PREFIX) and value.endswith(TENSOR_FILE_SUFFIX)
+
+
+class PayloadStore:
+    """
+    Process-wide store of inference payloads.
+
+    Tensor data referenced from inference configs as `"data": "@<path>.npy"` is memory-mapped on first use,
+    and payload files and rendered request bodies are kept so they are read and serialized only once per process.
+    """
+
+    def __init__(self) -> None:
+        self._tensors: dict[str, np.ndarray] = {}
+        # Payload file path -> (request body, whether tensor files were rendered into the body)
+        self._file_bodies: dict[str, tuple[bytes, bool]] = {}
+        self._body_files: dict[str, str] = {}
+        self._bodies: dict[Hashable, Any] = {}
+        self._body_files_dir = ""
+        self._lock = threading.RLock()
+
+    def load_tensor(self, path: str) -> np.ndarray:
+        """
+        Get a tensor stored in a `.npy` file, memory-mapped read-only on first use.
+
+        Args:
+            path (str): `.npy` file path
+
+        Returns:
+            np.ndarray: tensor
+
+        """
+        with self._lock:
+            if path not in self._tensors:
+                LOGGER.info(f"Memory-mapping tensor payload {path}")
+                self._tensors[path] = np.load(file=path, mmap_mode="r")
+
+            return self._tensors[path]
+
+    def resolve_tensors(self, payload: Any) -> tuple[Any, bool]:
+        """
+        Replace tensor file references in the `data` fields of a payload with the referenced tensors.
+
+        Args:
+            payload (Any): JSON payload, e.g. KServe v2 input tensors
+
+        Returns:
+            tuple[Any, bool]: payload with tensors, and whether any tensor file was referenced
+
+        """
+        if isinstance(payload, list):
+            resolved_items = [self.resolve_tensors(payload=item) for item in payload]
+            return [item for item, _ in resolved_items], any(resolved for _, resolved in resolved_items)
+
+        if isinstance(payload, dict):
+            resolved_payload = {}
+            has_tensors = False
+
+            for key, value in payload.items():
+                if key == TENSOR_DATA_KEY and is_tensor_file_reference(value=value):
+                    resolved_payload[key] = self.load_tensor(path=value.removeprefix(PAYLOAD_FILE_PREFIX))
+                    has_tensors = True
+
+                else:
+                    resolved_payload[key], resolved = self.resolve_tensors(payload=value)
+                    has_tensors = has_tensors or resolved
+
+            return resolved_payload, has_tensors
+
+        return payload, False
+
+    def dumps(self, payload: Any) -> str:
+        """
+        Serialize a payload to JSON, with referenced tensors as nested lists.
+
+        Args:
+            payload (Any): JSON payload
+
+        Returns:
+            str: JSON payload
+
+        """
+        resolved_payload, _ = self.resolve_tensors(payload=payload)
+        return json.dumps(resolved_payload, default=np.ndarray.tolist)
+
+    def read_file_body(self, path: str) -> bytes:
+        """
+        Get a request body read from a payload file, same as curl `-d @file` sends it.
+
+        Carriage returns and newlines are stripped; JSON files referencing tensor files are sent with the tensor data.
+
+        Args:
+            path (str): payload file path
+
+        Returns:
+            bytes: request body
+
+        """
+        with self._lock:
+            if path not in self._file_bodies:
+                self._file_bodies[path] = self._render_file_body(path=path)
+
+            return self._file_bodies[path][0]
+
+    def _render_file_body(self, path: str) -> tuple[bytes, bool]:
+        with open(path, "rb") as body_file:
+            body = body_file.read()
+
+        if path.endswith(".json"):
+            resolved_payload, has_tensors = self.resolve_tensors(payload=json.loads(body))
+            if has_tensors:
+                return json.dumps(resolved_payload, default=np.ndarray.tolist).encode(), True
+
+        return body.replace(b"\r", b"").replace(b"\n", b""), False
+
+    def get_body_file(self, path: str) -> str:
+        """
+        Get the path of a file holding the request body of a payload file, to send with curl `-d @file`.
+
+        Args:
+            path (str): payload file path
+
+        Returns:
+            str: path of the payload file, or of a rendered copy if the payload file references tensor files
+
+        """
+        with self._lock:
+            if path not in self._body_files:
+                body = self.read_file_body(path=path)
+
+                if self._file_bodies[path][1]:
+                    if not self._body_files_dir:
+                        self._body_files_dir = tempfile.mkdtemp(prefix="inference-payloads-")
+
+                    body_file_path = os.path.join(
+                        self._body_files_dir, f"{hashlib.sha256(path.encode()).hexdigest()[:16]}.json"
+                    )
+                    with open(body_file_path, "wb") as body_file:
+                        body_file.write(body)
+
+                    self._body_files[path] = body_file_path
+
+                else:
+                    self._body_files[path] = path
+
+            return self._body_files[path]
+
+    def get_body(self, key: Hashable, render: Callable[[], T]) -> T:
+        """
+        Get a pre-serialized request body.
+
+        Args:
+            key (Hashable): body key, e.g. (inference config, model name, inference type, protocol)
+            render (Callable): called to serialize the body if it is not cached
+
+        Returns:
+            Any: request body
+
+        """
+        with self._lock:
+            if key not in self._bodies:
+                self._bodies[key] = render()
+
+            return self._bodies[key]
+
+
+@cache
+def get_payload_store() -> PayloadStore:
+    """
+    Get the process-wide inference payload store.
+
+    Returns:
+        PayloadStore: inference payload store
+
+    """
+    return PayloadStore()
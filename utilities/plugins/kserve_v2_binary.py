@@ -0,0 +1,86 @@
+import json
+import struct
+from typing import Any
+
+import numpy as np
+
+from utilities.plugins.kserve_v2_grpc_plugin import BYTES_DATATYPE, BYTES_LENGTH_FORMAT
+
+# Binary tensor data extension of the KServe v2 (Open Inference Protocol) REST API
+INFERENCE_HEADER_CONTENT_LENGTH: str = "Inference-Header-Content-Length"
+BINARY_DATA_CONTENT_TYPE: str = "application/octet-stream"
+BINARY_DATA_SIZE_PARAMETER: str = "binary_data_size"
+# KServe v2 datatype -> little-endian NumPy dtype
+TENSOR_DTYPES: dict[str, str] = {
+    "BOOL": "|b1",
+    "UINT8": "|u1",
+    "UINT16": "<u2",
+    "UINT32": "<u4",
+    "UINT64": "<u8",
+    "INT8": "|i1",
+    "INT16": "<i2",
+    "INT32": "<i4",
+    "INT64": "<i8",
+    "FP16": "<f2",
+    "FP32": "<f4",
+    "FP64": "<f8",
+}
+
+
+def encode_binary_tensor_data(datatype: str, data: Any) -> bytes:
+    """
+    Serialize tensor data into the KServe v2 binary (row-major, little-endian) representation.
+
+    Args:
+        datatype (str): KServe v2 tensor datatype
+        data (Any): tensor data, flat or nested as the tensor shape
+
+    Returns:
+        bytes: binary tensor data
+
+    Raises:
+        ValueError: If the datatype is not supported
+
+    """
+    if datatype == BYTES_DATATYPE:
+        values = [value.encode() if isinstance(value, str) else value for value in np.ravel(data).tolist()]
+        return b"".join(struct.pack(BYTES_LENGTH_FORMAT, len(value)) + value for value in values)
+
+    if datatype not in TENSOR_DTYPES:
+        raise ValueError(f"Datatype {datatype} is not supported")
+
+    return np.asarray(data, dtype=TENSOR_DTYPES[datatype]).tobytes(order="C")
+
+
+def encode_binary_inference_request(request: dict[str, Any]) -> tuple[bytes, int]:
+    """
+    Encode a KServe v2 JSON inference request with the binary tensor data extension.
+
+    The data of every input tensor is moved out of the JSON header into a binary buffer appended to the body,
+    and the buffer size is set in the tensor `binary_data_size` parameter. Outputs are still requested as JSON.
+
+    Args:
+        request (dict[str, Any]): KServe v2 inference request
+
+    Returns:
+        tuple[bytes, int]: request body and the JSON header length, to send in the
+            `Inference-Header-Content-Length` header
+
+    """
+    inputs: list[dict[str, Any]] = []
+    buffers: list[bytes] = []
+
+    for tensor in request["inputs"]:
+        if "data" not in tensor:
+            inputs.append(tensor)
+            continue
+
+        buffer = encode_binary_tensor_data(datatype=tensor["datatype"], data=tensor["data"])
+        buffers.append(buffer)
+        inputs.append({
+            **{key: value for key, value in tensor.items() if key != "data"},
+            "parameters": {**tensor.get("parameters", {}), BINARY_DATA_SIZE_PARAMETER: len(buffer)},
+        })
+
+    header = json.dumps({**request, "inputs": inputs}, separators=(",", ":")).encode()
+    return header + b"".join(buffers), len(header)
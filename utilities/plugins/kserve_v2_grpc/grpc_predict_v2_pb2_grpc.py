@@ -0,0 +1,347 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+
+import grpc
+
+from utilities.plugins.kserve_v2_grpc import grpc_predict_v2_pb2 as grpc__predict__v2__pb2
+
+GRPC_GENERATED_VERSION = "1.68.1"
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f"The grpc package installed is at version {GRPC_VERSION},"
+        + " but the generated code in grpc_predict_v2_pb2_grpc.py depends on"
+        + f" grpcio>={GRPC_GENERATED_VERSION}."
+        + f" Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}"
+        + f" or downgrade your generated code using grpcio-tools<={GRPC_VERSION}."
+    )
+
+
+class GRPCInferenceServiceStub(object):
+    """Inference Server GRPC endpoints."""
+
+    def __init__(self, channel):  # type: ignore
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.ServerLive = channel.unary_unary(
+            "/inference.GRPCInferenceService/ServerLive",
+            request_serializer=grpc__predict__v2__pb2.ServerLiveRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ServerLiveResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+        self.ServerReady = channel.unary_unary(
+            "/inference.GRPCInferenceService/ServerReady",
+            request_serializer=grpc__predict__v2__pb2.ServerReadyRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ServerReadyResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+        self.ModelReady = channel.unary_unary(
+            "/inference.GRPCInferenceService/ModelReady",
+            request_serializer=grpc__predict__v2__pb2.ModelReadyRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ModelReadyResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+        self.ServerMetadata = channel.unary_unary(
+            "/inference.GRPCInferenceService/ServerMetadata",
+            request_serializer=grpc__predict__v2__pb2.ServerMetadataRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ServerMetadataResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+        self.ModelMetadata = channel.unary_unary(
+            "/inference.GRPCInferenceService/ModelMetadata",
+            request_serializer=grpc__predict__v2__pb2.ModelMetadataRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ModelMetadataResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+        self.ModelInfer = channel.unary_unary(
+            "/inference.GRPCInferenceService/ModelInfer",
+            request_serializer=grpc__predict__v2__pb2.ModelInferRequest.SerializeToString,  # type: ignore
+            response_deserializer=grpc__predict__v2__pb2.ModelInferResponse.FromString,  # type: ignore
+            _registered_method=True,
+        )
+
+
+class GRPCInferenceServiceServicer(object):
+    """Inference Server GRPC endpoints."""
+
+    def ServerLive(self, request, context):  # type: ignore
+        """The ServerLive API indicates if the inference server is able to receive
+        and respond to metadata and inference requests.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ServerReady(self, request, context):  # type: ignore
+        """The ServerReady API indicates if the server is ready for inferencing."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ModelReady(self, request, context):  # type: ignore
+        """The ModelReady API indicates if a specific model is ready for inferencing."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ServerMetadata(self, request, context):  # type: ignore
+        """The ServerMetadata API provides information about the server. Errors are
+        indicated by the google.rpc.Status returned for the request. The OK code
+        indicates success and other codes indicate failure.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ModelMetadata(self, request, context):  # type: ignore
+        """The per-model metadata API provides information about a model. Errors are
+        indicated by the google.rpc.Status returned for the request. The OK code
+        indicates success and other codes indicate failure.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ModelInfer(self, request, context):  # type: ignore
+        """The ModelInfer API performs inference using the specified model. Errors are
+        indicated by the google.rpc.Status returned for the request. The OK code
+        indicates success and other codes indicate failure.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+
+def add_GRPCInferenceServiceServicer_to_server(servicer, server):  # type: ignore
+    rpc_method_handlers = {
+        "ServerLive": grpc.unary_unary_rpc_method_handler(
+            servicer.ServerLive,
+            request_deserializer=grpc__predict__v2__pb2.ServerLiveRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ServerLiveResponse.SerializeToString,  # type: ignore
+        ),
+        "ServerReady": grpc.unary_unary_rpc_method_handler(
+            servicer.ServerReady,
+            request_deserializer=grpc__predict__v2__pb2.ServerReadyRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ServerReadyResponse.SerializeToString,  # type: ignore
+        ),
+        "ModelReady": grpc.unary_unary_rpc_method_handler(
+            servicer.ModelReady,
+            request_deserializer=grpc__predict__v2__pb2.ModelReadyRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ModelReadyResponse.SerializeToString,  # type: ignore
+        ),
+        "ServerMetadata": grpc.unary_unary_rpc_method_handler(
+            servicer.ServerMetadata,
+            request_deserializer=grpc__predict__v2__pb2.ServerMetadataRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ServerMetadataResponse.SerializeToString,  # type: ignore
+        ),
+        "ModelMetadata": grpc.unary_unary_rpc_method_handler(
+            servicer.ModelMetadata,
+            request_deserializer=grpc__predict__v2__pb2.ModelMetadataRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ModelMetadataResponse.SerializeToString,  # type: ignore
+        ),
+        "ModelInfer": grpc.unary_unary_rpc_method_handler(
+            servicer.ModelInfer,
+            request_deserializer=grpc__predict__v2__pb2.ModelInferRequest.FromString,  # type: ignore
+            response_serializer=grpc__predict__v2__pb2.ModelInferResponse.SerializeToString,  # type: ignore
+        ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler("inference.GRPCInferenceService", rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers("inference.GRPCInferenceService", rpc_method_handlers)
+
+
+# This class is part of an EXPERIMENTAL API.
+class GRPCInferenceService(object):
+    """Inference Server GRPC endpoints."""
+
+    @staticmethod
+    def ServerLive(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ServerLive",
+            grpc__predict__v2__pb2.ServerLiveRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ServerLiveResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ServerReady(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ServerReady",
+            grpc__predict__v2__pb2.ServerReadyRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ServerReadyResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ModelReady(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ModelReady",
+            grpc__predict__v2__pb2.ModelReadyRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ModelReadyResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ServerMetadata(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ServerMetadata",
+            grpc__predict__v2__pb2.ServerMetadataRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ServerMetadataResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ModelMetadata(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ModelMetadata",
+            grpc__predict__v2__pb2.ModelMetadataRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ModelMetadataResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ModelInfer(  # type: ignore
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ModelInfer",
+            grpc__predict__v2__pb2.ModelInferRequest.SerializeToString,  # type: ignore
+            grpc__predict__v2__pb2.ModelInferResponse.FromString,  # type: ignore
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -0,0 +1,309 @@
+import struct
+import threading
+from functools import cache
+from typing import Any, Optional
+
+import grpc
+from google.protobuf import json_format
+from simple_logger.logger import get_logger
+
+from utilities.certificates_utils import get_server_certificate
+from utilities.constants import Timeout
+from utilities.plugins.kserve_v2_grpc import grpc_predict_v2_pb2, grpc_predict_v2_pb2_grpc
+
+LOGGER = get_logger(name=__name__)
+
+# KServe v2 datatype -> (typed contents field, little-endian struct format)
+# FP16 has no typed contents field, raw FP16 tensors are decoded into `fp32_contents`.
+TENSOR_CONTENTS_FORMATS: dict[str, tuple[str, str]] = {
+    "BOOL": ("bool_contents", "?"),
+    "UINT8": ("uint_contents", "B"),
+    "UINT16": ("uint_contents", "H"),
+    "UINT32": ("uint_contents", "I"),
+    "UINT64": ("uint64_contents", "Q"),
+    "INT8": ("int_contents", "b"),
+    "INT16": ("int_contents", "h"),
+    "INT32": ("int_contents", "i"),
+    "INT64": ("int64_contents", "q"),
+    "FP16": ("fp32_contents", "e"),
+    "FP32": ("fp32_contents", "f"),
+    "FP64": ("fp64_contents", "d"),
+}
+GRPC_INFERENCE_SERVICE: str = "inference.GRPCInferenceService"
+BYTES_DATATYPE: str = "BYTES"
+BYTES_LENGTH_FORMAT: str = "<I"
+MAX_MESSAGE_LENGTH: int = 256 * 1024 * 1024
+
+
+def encode_raw_tensor_contents(datatype: str, contents: grpc_predict_v2_pb2.InferTensorContents) -> bytes:  # type: ignore[name-defined]
+    """
+    Serialize typed tensor contents into the KServe v2 raw (row-major, little-endian) representation.
+
+    Args:
+        datatype (str): KServe v2 tensor datatype
+        contents (InferTensorContents): typed tensor contents
+
+    Returns:
+        bytes: raw tensor contents
+
+    Raises:
+        ValueError: If the datatype is not supported
+
+    """
+    if datatype == BYTES_DATATYPE:
+        return b"".join(struct.pack(BYTES_LENGTH_FORMAT, len(value)) + value for value in contents.bytes_contents)
+
+    if datatype not in TENSOR_CONTENTS_FORMATS:
+        raise ValueError(f"Datatype {datatype} is not supported")
+
+    contents_field, struct_format = TENSOR_CONTENTS_FORMATS[datatype]
+    values = getattr(contents, contents_field)
+    return struct.pack(f"<{len(values)}{struct_format}", *values)
+
+
+def decode_raw_tensor_contents(
+    datatype: str,
+    raw_contents: bytes,
+    contents: grpc_predict_v2_pb2.InferTensorContents,  # type: ignore[name-defined]
+) -> None:
+    """
+    Deserialize KServe v2 raw tensor contents into typed tensor contents.
+
+    Args:
+        datatype (str): KServe v2 tensor datatype
+        raw_contents (bytes): raw tensor contents
+        contents (InferTensorContents): typed tensor contents to fill
+
+    Raises:
+        ValueError: If the datatype is not supported
+
+    """
+    if datatype == BYTES_DATATYPE:
+        offset = 0
+        length_size = struct.calcsize(BYTES_LENGTH_FORMAT)
+
+        while offset < len(raw_contents):
+            (length,) = struct.unpack_from(BYTES_LENGTH_FORMAT, raw_contents, offset)
+            offset += length_size
+            contents.bytes_contents.append(raw_contents[offset : offset + length])
+            offset += length
+
+        return
+
+    if datatype not in TENSOR_CONTENTS_FORMATS:
+        raise ValueError(f"Datatype {datatype} is not supported")
+
+    contents_field, struct_format = TENSOR_CONTENTS_FORMATS[datatype]
+    num_values = len(raw_contents) // struct.calcsize(struct_format)
+    getattr(contents, contents_field).extend(struct.unpack(f"<{num_values}{struct_format}", raw_contents))
+
+
+class KServeV2GRPCPlugin:
+    """
+    KServe v2 (Open Inference Protocol) gRPC client.
+
+    The stubs are generated from `utilities/manifests/common/grpc_predict_v2.proto` and checked in,
+    and the channel is kept open until the plugin is closed; use `get_kserve_v2_grpc_plugin_manager` to share
+    a plugin per target.
+    """
+
+    def __init__(self, host: str, use_tls: bool = False, ca_bundle: str = "") -> None:
+        """
+        Args:
+            host (str): The gRPC server host, in `host:port` format.
+            use_tls (bool): Whether to use TLS for the connection.
+            ca_bundle (str): Path to CA bundle used to verify the server; if not set with TLS,
+                the server certificate is trusted as is (same as `grpcurl -insecure`).
+        """
+        self.host = host
+        self.use_tls = use_tls
+        self.ca_bundle = ca_bundle
+        self.channel = self._create_channel()
+        self.stub = grpc_predict_v2_pb2_grpc.GRPCInferenceServiceStub(self.channel)
+
+    def _channel_credentials(self) -> Optional[grpc.ChannelCredentials]:
+        if not self.use_tls:
+            return None
+
+        if self.ca_bundle:
+            with open(self.ca_bundle, "rb") as fd:
+                return grpc.ssl_channel_credentials(root_certificates=fd.read())
+
+        hostname, _, port = self.host.rpartition(":")
+        cert = get_server_certificate(host=hostname, port=int(port))
+        return grpc.ssl_channel_credentials(root_certificates=cert.encode())
+
+    def _create_channel(self) -> grpc.Channel:
+        options = [
+            ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ]
+        credentials = self._channel_credentials()
+        LOGGER.info(f"Opening gRPC channel to {self.host}")
+
+        if credentials:
+            return grpc.secure_channel(target=self.host, credentials=credentials, options=options)
+
+        return grpc.insecure_channel(target=self.host, options=options)
+
+    def close(self) -> None:
+        LOGGER.info(f"Closing gRPC channel to {self.host}")
+        self.channel.close()
+
+    def server_ready(self, metadata: Optional[list[tuple[str, str]]] = None) -> bool:
+        """
+        Check if the inference server is ready.
+
+        Args:
+            metadata (list[tuple[str, str]]): gRPC request metadata
+
+        Returns:
+            bool: True if the server is ready, False otherwise
+
+        """
+        response = self.stub.ServerReady(
+            request=grpc_predict_v2_pb2.ServerReadyRequest(),  # type: ignore[attr-defined]
+            metadata=metadata,
+            timeout=Timeout.TIMEOUT_30SEC,
+        )
+        return response.ready
+
+    def model_metadata(
+        self, model_name: str, model_version: str = "", metadata: Optional[list[tuple[str, str]]] = None
+    ) -> dict[str, Any]:
+        """
+        Get model metadata.
+
+        Args:
+            model_name (str): model name
+            model_version (str): model version
+            metadata (list[tuple[str, str]]): gRPC request metadata
+
+        Returns:
+            dict[str, Any]: model metadata, in protobuf JSON format
+
+        """
+        response = self.stub.ModelMetadata(
+            request=grpc_predict_v2_pb2.ModelMetadataRequest(name=model_name, version=model_version),  # type: ignore[attr-defined]
+            metadata=metadata,
+            timeout=Timeout.TIMEOUT_30SEC,
+        )
+        return json_format.MessageToDict(message=response)
+
+    def model_infer(
+        self,
+        request: dict[str, Any],
+        raw_contents: bool = False,
+        metadata: Optional[list[tuple[str, str]]] = None,
+        timeout: int = Timeout.TIMEOUT_5MIN,
+    ) -> dict[str, Any]:
+        """
+        Send a ModelInfer request.
+
+        Args:
+            request (dict[str, Any]): ModelInferRequest in protobuf JSON format, as accepted by grpcurl
+            raw_contents (bool): send input tensors as `raw_input_contents` instead of typed contents
+            metadata (list[tuple[str, str]]): gRPC request metadata
+            timeout (int): request timeout in seconds
+
+        Returns:
+            dict[str, Any]: ModelInferResponse in protobuf JSON format; raw output contents are decoded into
+                typed contents, so the response has the same shape regardless of the server encoding
+
+        Raises:
+            grpc.RpcError: If the request fails
+
+        """
+        infer_request = json_format.ParseDict(js_dict=request, message=grpc_predict_v2_pb2.ModelInferRequest())  # type: ignore[attr-defined]
+
+        if raw_contents and not infer_request.raw_input_contents:
+            for tensor in infer_request.inputs:
+                infer_request.raw_input_contents.append(
+                    encode_raw_tensor_contents(datatype=tensor.datatype, contents=tensor.contents)
+                )
+                tensor.ClearField("contents")
+
+        response = self.stub.ModelInfer(request=infer_request, metadata=metadata, timeout=timeout)
+
+        if response.raw_output_contents:
+            for tensor, tensor_raw_contents in zip(response.outputs, response.raw_output_contents):
+                decode_raw_tensor_contents(
+                    datatype=tensor.datatype, raw_contents=tensor_raw_contents, contents=tensor.contents
+                )
+
+            response.ClearField("raw_output_contents")
+
+        return json_format.MessageToDict(message=response)
+
+
+class KServeV2GRPCPluginManager:
+    """
+    Keeps a KServe v2 gRPC plugin open per target for the whole session, so channels are reused across requests.
+
+    A target is the server the requests are sent to, e.g. the port-forwarded pod or service, so a target reached
+    through a re-opened tunnel (on a new local port) replaces its plugin, and the previous channel is closed.
+    """
+
+    def __init__(self) -> None:
+        self._plugins: dict[str, KServeV2GRPCPlugin] = {}
+        self._lock = threading.Lock()
+
+    def get_plugin(self, host: str, use_tls: bool = False, ca_bundle: str = "", target: str = "") -> KServeV2GRPCPlugin:
+        """
+        Get the plugin of a target, opening a new channel if the target host or TLS settings changed.
+
+        Args:
+            host (str): The gRPC server host, in `host:port` format.
+            use_tls (bool): Whether to use TLS for the connection.
+            ca_bundle (str): Path to CA bundle used to verify the server
+            target (str): target the host reaches, e.g. `<namespace>/<pod or service>:<port>` for a port-forwarded
+                host; defaults to the host
+
+        Returns:
+            KServeV2GRPCPlugin: KServe v2 gRPC plugin
+
+        """
+        target = target or host
+
+        with self._lock:
+            plugin = self._plugins.get(target)
+
+            if plugin and (plugin.host, plugin.use_tls, plugin.ca_bundle) != (host, use_tls, ca_bundle):
+                plugin.close()
+                plugin = None
+
+            if not plugin:
+                plugin = self._plugins[target] = KServeV2GRPCPlugin(host=host, use_tls=use_tls, ca_bundle=ca_bundle)
+
+            return plugin
+
+    def close_plugin(self, target: str) -> None:
+        """
+        Close the plugin of a target; used when the tunnel to the target is closed.
+
+        Args:
+            target (str): target of the plugin, as passed to `get_plugin`
+
+        """
+        with self._lock:
+            if plugin := self._plugins.pop(target, None):
+                plugin.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            for plugin in self._plugins.values():
+                plugin.close()
+
+            self._plugins.clear()
+
+
+@cache
+def get_kserve_v2_grpc_plugin_manager() -> KServeV2GRPCPluginManager:
+    """
+    Get the process-wide KServe v2 gRPC plugin manager.
+
+    Returns:
+        KServeV2GRPCPluginManager: KServe v2 gRPC plugin manager
+
+    """
+    return KServeV2GRPCPluginManager()
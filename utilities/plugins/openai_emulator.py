@@ -0,0 +1,201 @@
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from utilities.plugins.constant import OpenAIEnpoints
+
+LOGGER = get_logger(name=__name__)
+
+LOCALHOST = "127.0.0.1"
+EMBEDDING_SIZE = 8
+TRANSCRIPTION_TEXT = "The stale smell of old beer lingers."
+
+
+@dataclass
+class OpenAIEmulatorConfig:
+    """
+    Behavior of the OpenAI-compatible emulator.
+
+    Attributes:
+        tokens_per_second (float): token generation rate per request, 0 generates tokens instantly
+        time_to_first_token (float): delay in seconds before the first generated token
+        max_tokens (int): number of tokens generated if the request does not set `max_tokens`
+        model_name (str): model id reported by the models endpoint
+    """
+
+    tokens_per_second: float = 0.0
+    time_to_first_token: float = 0.0
+    max_tokens: int = 16
+    model_name: str = "emulated-model"
+
+
+class OpenAIEmulatorHandler(BaseHTTPRequestHandler):
+    """
+    Serves the OpenAI endpoints used by `OpenAIClient`: completions, chat completions, embeddings,
+    audio transcriptions and models, with SSE streaming for completions.
+
+    Token `i` of every response is ` token{i}`, so responses can be compared across runs.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Streamed events are small writes, Nagle's algorithm would hold them back until the previous one is acked
+    disable_nagle_algorithm = True
+    server: "OpenAIEmulatorServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        LOGGER.debug(format % args)
+
+    def _send_json(self, body: dict[str, Any], status: HTTPStatus = HTTPStatus.OK) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_event(self, data: bytes) -> None:
+        event = b"data: " + data + b"\n\n"
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+        self.wfile.flush()
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _generate_tokens(self, max_tokens: int) -> list[str]:
+        config = self.server.config
+        time.sleep(config.time_to_first_token)
+        if config.tokens_per_second:
+            time.sleep((max_tokens - 1) / config.tokens_per_second)
+
+        return [f" token{index}" for index in range(max_tokens)]
+
+    def _stream_tokens(self, max_tokens: int, chat: bool) -> None:
+        config = self.server.config
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        if chat:
+            self._send_event(data=json.dumps({"choices": [{"index": 0, "delta": {"role": "assistant"}}]}).encode())
+
+        time.sleep(config.time_to_first_token)
+        for index in range(max_tokens):
+            if index and config.tokens_per_second:
+                time.sleep(1 / config.tokens_per_second)
+
+            choice: dict[str, Any] = {"index": 0, "finish_reason": "length" if index == max_tokens - 1 else None}
+            if chat:
+                choice["delta"] = {"content": f" token{index}"}
+            else:
+                choice["text"] = f" token{index}"
+
+            self._send_event(data=json.dumps({"model": config.model_name, "choices": [choice]}).encode())
+
+        self._send_event(data=b"[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self) -> None:
+        if self.path != OpenAIEnpoints.MODELS_INFO:
+            self._send_json(body={"error": f"{self.path} not found"}, status=HTTPStatus.NOT_FOUND)
+            return
+
+        self._send_json(
+            body={
+                "object": "list",
+                "data": [
+                    {"id": self.server.config.model_name, "object": "model", "created": 0, "owned_by": "emulator"}
+                ],
+            }
+        )
+
+    def do_POST(self) -> None:
+        body = self._read_body()
+
+        if self.path == OpenAIEnpoints.AUDIO_TRANSCRIPTION:
+            self._send_json(body={"text": TRANSCRIPTION_TEXT})
+            return
+
+        if self.path not in (OpenAIEnpoints.COMPLETIONS, OpenAIEnpoints.CHAT_COMPLETIONS, OpenAIEnpoints.EMBEDDINGS):
+            self._send_json(body={"error": f"{self.path} not found"}, status=HTTPStatus.NOT_FOUND)
+            return
+
+        request = json.loads(body)
+
+        if self.path == OpenAIEnpoints.EMBEDDINGS:
+            inputs = request["input"] if isinstance(request["input"], list) else [request["input"]]
+            self._send_json(
+                body={
+                    "object": "list",
+                    "data": [
+                        {"object": "embedding", "index": index, "embedding": [0.1] * EMBEDDING_SIZE}
+                        for index in range(len(inputs))
+                    ],
+                }
+            )
+            return
+
+        chat = self.path == OpenAIEnpoints.CHAT_COMPLETIONS
+        max_tokens = request.get("max_tokens") or self.server.config.max_tokens
+
+        if request.get("stream"):
+            self._stream_tokens(max_tokens=max_tokens, chat=chat)
+            return
+
+        text = "".join(self._generate_tokens(max_tokens=max_tokens))
+        choice: dict[str, Any] = {"index": 0, "finish_reason": "length"}
+        if chat:
+            choice["message"] = {"role": "assistant", "content": text}
+        else:
+            choice["text"] = text
+
+        self._send_json(
+            body={
+                "model": self.server.config.model_name,
+                "choices": [choice],
+                "usage": {"completion_tokens": max_tokens},
+            }
+        )
+
+
+class OpenAIEmulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: OpenAIEmulatorConfig) -> None:
+        """
+        Args:
+            config (OpenAIEmulatorConfig): emulator behavior
+        """
+        self.config = config
+        super().__init__(server_address=(LOCALHOST, 0), RequestHandlerClass=OpenAIEmulatorHandler)
+
+    @property
+    def url(self) -> str:
+        return f"http://{LOCALHOST}:{self.server_port}"
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def start_openai_emulator(config: OpenAIEmulatorConfig) -> OpenAIEmulatorServer:
+    """
+    Start an OpenAI-compatible emulator on a free localhost port.
+
+    Args:
+        config (OpenAIEmulatorConfig): emulator behavior
+
+    Returns:
+        OpenAIEmulatorServer: started emulator, to stop when done; `url` is its base URL
+
+    """
+    server = OpenAIEmulatorServer(config=config)
+    threading.Thread(target=server.serve_forever, name="openai-emulator", daemon=True).start()
+    LOGGER.info(f"OpenAI emulator listening on {server.url}: {config}")
+    return server
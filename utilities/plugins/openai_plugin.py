@@ -1,17 +1,98 @@
 import json
-import requests
-import urllib3
-from tenacity import retry, stop_after_attempt, wait_exponential
+import threading
+import time
+from dataclasses import dataclass, field
+import httpx
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from types import TracebackType
 from typing import Any, Optional
-from urllib3.exceptions import InsecureRequestWarning
+from utilities.cassette import CassetteKind, get_cassette
+from utilities.constants import Timeout
+from utilities.exceptions import CassetteEntryNotFoundError
+from utilities.http_engine import is_http2_enabled
 from utilities.plugins.constant import OpenAIEnpoints, RestHeader
 from simple_logger.logger import get_logger
 
-urllib3.disable_warnings(category=InsecureRequestWarning)
-requests.packages
 LOGGER = get_logger(name=__name__)
 
 MAX_RETRIES = 5
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = Timeout.TIMEOUT_5MIN
+# httpcore trace event emitted once per new connection
+CONNECTION_OPENED_EVENT = "connection.connect_tcp.complete"
+SSE_DATA_FIELD = b"data:"
+SSE_DONE = b"[DONE]"
+
+
+@dataclass
+class StreamingResult:
+    """
+    Result of a streaming request.
+
+    Times are in seconds; `time_to_first_token` is measured from sending the request to the first
+    non-empty token, and `inter_token_latencies` holds the time between each pair of consecutive tokens.
+    """
+
+    text: str = ""
+    token_count: int = 0
+    time_to_first_token: float = 0.0
+    inter_token_latencies: list[float] = field(default_factory=list)
+    total_time: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Decode rate, tokens generated after the first token per second of generation."""
+        generation_time = sum(self.inter_token_latencies)
+        return (self.token_count - 1) / generation_time if generation_time else 0.0
+
+
+class SSEParser:
+    """
+    Incremental Server-Sent Events parser.
+
+    Chunks are appended to a single buffer and only the `data` field of each event is copied out;
+    a partial line at the end of a chunk is kept until the next chunk completes it.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._data: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Parse a chunk of the response body.
+
+        Args:
+            chunk (bytes): response body chunk
+
+        Returns:
+            list[bytes]: data of the events completed by the chunk
+        """
+        self._buffer += chunk
+        events: list[bytes] = []
+        start = 0
+
+        while (end := self._buffer.find(b"\n", start)) != -1:
+            line_end = end - 1 if end > start and self._buffer[end - 1] == 0x0D else end
+
+            # An empty line dispatches the event
+            if line_end == start:
+                if self._data:
+                    events.append(self._data[0] if len(self._data) == 1 else b"\n".join(self._data))
+                    self._data.clear()
+
+            elif self._buffer.startswith(SSE_DATA_FIELD, start, line_end):
+                data_start = start + len(SSE_DATA_FIELD)
+                if data_start < line_end and self._buffer[data_start] == 0x20:
+                    data_start += 1
+
+                self._data.append(bytes(self._buffer[data_start:line_end]))
+
+            start = end + 1
+
+        del self._buffer[:start]
+        return events
 
 
 class OpenAIClient:
@@ -23,9 +104,19 @@ class OpenAIClient:
         streaming (bool): Flag to indicate if streaming requests should be used.
         model_name (str, optional): The name of the model to use.
         request_func (Callable): The function to use for making requests.
+        client (httpx.Client): Pooled HTTP client; connections are kept alive and reused across requests.
     """
 
-    def __init__(self, host: Any, streaming: bool = False, model_name: Any = None) -> None:
+    def __init__(
+        self,
+        host: Any,
+        streaming: bool = False,
+        model_name: Any = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        http2: Optional[bool] = None,
+    ) -> None:
         """
         Initializes the OpenAIClient.
 
@@ -33,13 +124,73 @@ class OpenAIClient:
             host (str): The base URL for the API.
             streaming (bool, optional): If True, use streaming requests. Defaults to False.
             model_name (str, optional): The name of the model to use. Defaults to None.
+            pool_size (int, optional): Maximum number of connections kept open to the host.
+            connect_timeout (float, optional): Connect timeout in seconds.
+            read_timeout (float, optional): Timeout in seconds for each read of the response, not for the whole
+                response, so long streaming responses are not cut off.
+            http2 (bool, optional): Use HTTP/2 if the server supports it, concurrent requests are multiplexed over
+                one connection; requires the `h2` package. Defaults to the `--inference-http-version` option.
         """
         self.host = host
         self.streaming = streaming
         self.model_name = model_name
         self.request_func = self.streaming_request_http if streaming else self.request_http
+        self.client = httpx.Client(
+            verify=False,
+            http2=is_http2_enabled() if http2 is None else http2,
+            timeout=httpx.Timeout(timeout=read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            trust_env=False,
+        )
+        self._num_requests = 0
+        self._num_connections = 0
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self) -> "OpenAIClient":
+        return self
 
-    @retry(stop=stop_after_attempt(MAX_RETRIES), wait=wait_exponential(min=1, max=6))
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        LOGGER.info(f"Closing OpenAI client to {self.host}, pool stats: {self.pool_stats()}")
+        self.client.close()
+
+    def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == CONNECTION_OPENED_EVENT:
+            with self._stats_lock:
+                self._num_connections += 1
+
+    def _build_post_request(self, url: str, **kwargs: Any) -> httpx.Request:
+        with self._stats_lock:
+            self._num_requests += 1
+
+        return self.client.build_request(method="POST", url=url, extensions={"trace": self._trace}, **kwargs)
+
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            dict[str, int]: number of requests sent, connections opened and requests sent on a reused connection
+        """
+        with self._stats_lock:
+            return {
+                "requests": self._num_requests,
+                "connections_opened": self._num_connections,
+                "connections_reused": self._num_requests - self._num_connections,
+            }
+
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(min=1, max=6),
+        retry=retry_if_not_exception_type(CassetteEntryNotFoundError),
+    )
     def request_http(self, endpoint: str, query: dict[str, str], extra_param: Optional[dict[str, Any]] = None) -> Any:
         """
         Sends a HTTP POST request to the specified endpoint and processes the response.
@@ -53,26 +204,34 @@ class OpenAIClient:
             Any: The parsed response from the API.
 
         Raises:
-            requests.exceptions.RequestException: If there is a request error.
+            httpx.HTTPError: If there is a request error.
             json.JSONDecodeError: If there is a JSON decoding error.
         """
         headers = RestHeader.HEADERS
         data = self._construct_request_data(endpoint, query, extra_param)
-        try:
-            url = f"{self.host}{endpoint}"
-            response = requests.post(url, headers=headers, json=data, verify=False)
+        url = f"{self.host}{endpoint}"
+
+        def _send() -> Any:
+            response = self.client.send(request=self._build_post_request(url=url, headers=headers, json=data))
             LOGGER.info(response)
             response.raise_for_status()
-            message = response.json()
+            return response.json()
+
+        try:
+            message = get_cassette().play(kind=CassetteKind.OPENAI, target=endpoint, request=data, send=_send)
             return self._parse_response(endpoint, message)
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as err:
+        except (httpx.HTTPError, json.JSONDecodeError) as err:
             LOGGER.error(f"Test failed due to an unexpected exception: {err}")
             raise
 
-    @retry(stop=stop_after_attempt(MAX_RETRIES), wait=wait_exponential(min=1, max=6))
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(min=1, max=6),
+        retry=retry_if_not_exception_type(CassetteEntryNotFoundError),
+    )
     def streaming_request_http(
         self, endpoint: str, query: dict[str, Any], extra_param: Optional[dict[str, Any]] = None
-    ) -> str:
+    ) -> StreamingResult:
         """
         Sends a streaming HTTP POST request to the specified endpoint and processes the streamed response.
 
@@ -82,30 +241,66 @@ class OpenAIClient:
             extra_param (dict, optional): Additional parameters to include in the request.
 
         Returns:
-            str: The concatenated streaming response.
+            StreamingResult: The concatenated streaming response, with time to first token and inter-token latencies.
 
         Raises:
-            requests.exceptions.RequestException: If there is a request error.
+            httpx.HTTPError: If there is a request error.
             json.JSONDecodeError: If there is a JSON decoding error.
         """
         headers = RestHeader.HEADERS
         data = self._construct_request_data(endpoint, query, extra_param, streaming=True)
         tokens = []
+        result = StreamingResult()
+        parser = SSEParser()
+        url = f"{self.host}{endpoint}"
+
+        def _send() -> dict[str, Any]:
+            # Chunks are kept with their arrival time from the request start, as latin-1 text to be JSON serializable
+            request = self._build_post_request(url=url, headers=headers, json=data)
+            start_time = time.perf_counter()
+            response = self.client.send(request=request, stream=True)
+            try:
+                LOGGER.info(response)
+                response.raise_for_status()
+                chunks = [
+                    (time.perf_counter() - start_time, chunk.decode("latin-1")) for chunk in response.iter_bytes()
+                ]
+            finally:
+                response.close()
+
+            return {"chunks": chunks, "total_time": time.perf_counter() - start_time}
+
         try:
-            url = f"{self.host}{endpoint}"
-            response = requests.post(url, headers=headers, json=data, verify=False, stream=True)
-            LOGGER.info(response)
-            response.raise_for_status()
-            for line in response.iter_lines():
-                _, found, data = line.partition(b"data: ")
-                if found and data != b"[DONE]":
-                    message = json.loads(data)
-                    token = self._parse_streaming_response(endpoint, message)
+            stream = get_cassette().play(kind=CassetteKind.OPENAI, target=endpoint, request=data, send=_send)
+            last_token_time = 0.0
+            for chunk_time, chunk in stream["chunks"]:
+                for event_data in parser.feed(chunk=chunk.encode("latin-1")):
+                    if event_data == SSE_DONE:
+                        continue
+
+                    token = self._parse_streaming_response(endpoint, json.loads(event_data))
                     tokens.append(token)
-        except (requests.exceptions.RequestException, json.JSONDecodeError):
+                    if not token:
+                        continue
+
+                    if result.token_count:
+                        result.inter_token_latencies.append(chunk_time - last_token_time)
+                    else:
+                        result.time_to_first_token = chunk_time
+
+                    result.token_count += 1
+                    last_token_time = chunk_time
+        except (httpx.HTTPError, json.JSONDecodeError):
             LOGGER.error("Streaming request error")
             raise
-        return "".join(tokens)
+
+        result.total_time = stream["total_time"]
+        result.text = "".join(tokens)
+        LOGGER.info(
+            f"Streamed {result.token_count} tokens, time to first token: {result.time_to_first_token:.3f}s, "
+            f"{result.tokens_per_second:.1f} tokens/s"
+        )
+        return result
 
     @staticmethod
     def get_request_http(host: str, endpoint: str) -> Any:
@@ -120,25 +315,39 @@ class OpenAIClient:
             dict: The data from the response.
 
         Raises:
-            requests.exceptions.RequestException: If there is a request error.
+            httpx.HTTPError: If there is a request error.
             json.JSONDecodeError: If there is a JSON decoding error.
         """
         headers = RestHeader.HEADERS
         url = f"{host}{endpoint}"
-        try:
-            response = requests.get(url, headers=headers, verify=False)
+
+        def _send() -> Any:
+            response = httpx.get(
+                url=url,
+                headers=headers,
+                verify=False,
+                timeout=httpx.Timeout(timeout=DEFAULT_READ_TIMEOUT, connect=DEFAULT_CONNECT_TIMEOUT),
+                trust_env=False,
+            )
             LOGGER.info(response)
             response.raise_for_status()
-            message = response.json()
+            return response.json()
+
+        try:
+            message = get_cassette().play(kind=CassetteKind.OPENAI, target=endpoint, request=None, send=_send)
             data = message.get("data", [])
             keys_to_remove = ["created", "id"]
             if data:
                 data = OpenAIClient._remove_keys(data, keys_to_remove)
             return data
-        except (requests.exceptions.RequestException, json.JSONDecodeError):
+        except (httpx.HTTPError, json.JSONDecodeError):
             LOGGER.exception("Request error")
 
-    @retry(stop=stop_after_attempt(MAX_RETRIES), wait=wait_exponential(min=1, max=6))
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(min=1, max=6),
+        retry=retry_if_not_exception_type(CassetteEntryNotFoundError),
+    )
     def request_audio(
         self, endpoint: str, audio_file_path: str, model_name: str, filename: str = "harvard.wav", language: str = "en"
     ) -> Any:
@@ -154,7 +363,7 @@ class OpenAIClient:
         Returns:
             Any: The parsed response from the API.
         Raises:
-            requests.exceptions.RequestException: If there is a request error.
+            httpx.HTTPError: If there is a request error.
             json.JSONDecodeError: If there is a JSON decoding error.
         """
         headers = {k: v for k, v in RestHeader.HEADERS.items() if k != "Content-Type"}
@@ -163,16 +372,24 @@ class OpenAIClient:
             "response_format": "json",
             "language": language,
         }
-        try:
-            url = f"{self.host}{endpoint}"
+        url = f"{self.host}{endpoint}"
+
+        def _send() -> Any:
             with open(audio_file_path, "rb") as audio_file:
                 files = {"file": (filename, audio_file, "audio/wav")}
-                response = requests.post(url, headers=headers, files=files, data=data, verify=False)
+                response = self.client.send(
+                    request=self._build_post_request(url=url, headers=headers, files=files, data=data)
+                )
             LOGGER.info(response)
             response.raise_for_status()
-            message = response.json()
+            return response.json()
+
+        try:
+            message = get_cassette().play(
+                kind=CassetteKind.OPENAI, target=endpoint, request={"filename": filename, **data}, send=_send
+            )
             return self._parse_response(endpoint, message)
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as err:
+        except (httpx.HTTPError, json.JSONDecodeError) as err:
             LOGGER.error(f"Test failed due to an unexpected exception: {err}")
             raise
 
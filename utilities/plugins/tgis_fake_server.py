@@ -0,0 +1,127 @@
+import time
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+import grpc
+from simple_logger.logger import get_logger
+
+from utilities.plugins.tgis_grpc import generation_pb2_grpc
+
+LOGGER = get_logger(name=__name__)
+
+generation_pb2 = generation_pb2_grpc.generation__pb2
+LOCALHOST = "127.0.0.1"
+# TGIS generates 20 tokens if `max_new_tokens` is not set
+DEFAULT_MAX_NEW_TOKENS = 20
+
+
+@dataclass
+class FakeTGISConfig:
+    """
+    Behavior of the fake TGIS server.
+
+    Attributes:
+        tokens_per_second (float): token generation rate per sequence, 0 generates tokens instantly
+        time_to_first_token (float): delay in seconds before the first generated token
+        max_batch_size (int): maximum number of requests in a Generate call, larger batches are rejected
+        batched_decoding (bool): decode the requests of a Generate call together, as a real server does;
+            if False, the requests are decoded one after the other
+        model_name (str): model id reported by ModelInfo
+    """
+
+    tokens_per_second: float = 0.0
+    time_to_first_token: float = 0.0
+    max_batch_size: int = 16
+    batched_decoding: bool = True
+    model_name: str = "fake-model"
+
+
+class FakeGenerationServicer(generation_pb2_grpc.GenerationServiceServicer):
+    """
+    Stand-in TGIS generation service.
+
+    The generated text is deterministic, token `i` of every sequence is ` token{i}`,
+    so responses can be compared across runs.
+    """
+
+    def __init__(self, config: FakeTGISConfig) -> None:
+        self.config = config
+
+    def _token_delay(self) -> float:
+        return 1 / self.config.tokens_per_second if self.config.tokens_per_second else 0.0
+
+    @staticmethod
+    def _max_new_tokens(params: Any) -> int:
+        return params.stopping.max_new_tokens or DEFAULT_MAX_NEW_TOKENS
+
+    def Generate(self, request: Any, context: grpc.ServicerContext) -> Any:
+        if len(request.requests) > self.config.max_batch_size:
+            context.abort(
+                code=grpc.StatusCode.INVALID_ARGUMENT,
+                details=f"Batch size {len(request.requests)} exceeds {self.config.max_batch_size}",
+            )
+
+        max_new_tokens = self._max_new_tokens(params=request.params)
+        num_sequences = 1 if self.config.batched_decoding else len(request.requests)
+        time.sleep(num_sequences * (self.config.time_to_first_token + max_new_tokens * self._token_delay()))
+
+        return generation_pb2.BatchedGenerationResponse(  # type: ignore[attr-defined]
+            responses=[
+                generation_pb2.GenerationResponse(  # type: ignore[attr-defined]
+                    input_token_count=len(generation_request.text.split()),
+                    generated_token_count=max_new_tokens,
+                    text="".join(f" token{index}" for index in range(max_new_tokens)),
+                    stop_reason=generation_pb2.MAX_TOKENS,  # type: ignore[attr-defined]
+                )
+                for generation_request in request.requests
+            ]
+        )
+
+    def GenerateStream(self, request: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+        max_new_tokens = self._max_new_tokens(params=request.params)
+        token_delay = self._token_delay()
+
+        yield generation_pb2.GenerationResponse(input_token_count=len(request.request.text.split()))  # type: ignore[attr-defined]
+        time.sleep(self.config.time_to_first_token)
+
+        for index in range(max_new_tokens):
+            if index:
+                time.sleep(token_delay)
+
+            token = f" token{index}"
+            yield generation_pb2.GenerationResponse(  # type: ignore[attr-defined]
+                generated_token_count=index + 1,
+                text=token,
+                tokens=[generation_pb2.TokenInfo(text=token)] if request.params.response.generated_tokens else [],  # type: ignore[attr-defined]
+                stop_reason=generation_pb2.MAX_TOKENS if index == max_new_tokens - 1 else generation_pb2.NOT_FINISHED,  # type: ignore[attr-defined]
+            )
+
+    def ModelInfo(self, request: Any, context: grpc.ServicerContext) -> Any:
+        return generation_pb2.ModelInfoResponse(  # type: ignore[attr-defined]
+            model_kind=generation_pb2.ModelInfoResponse.DECODER_ONLY,  # type: ignore[attr-defined]
+            max_sequence_length=2048,
+            max_new_tokens=1024,
+        )
+
+
+def start_fake_tgis_server(config: FakeTGISConfig, max_workers: int = 32) -> tuple[grpc.Server, str]:
+    """
+    Start a fake TGIS server on a free localhost port.
+
+    Args:
+        config (FakeTGISConfig): server behavior
+        max_workers (int): maximum number of concurrent RPCs
+
+    Returns:
+        tuple[grpc.Server, str]: started server, to stop when done, and its `host:port` address
+
+    """
+    server = grpc.server(thread_pool=futures.ThreadPoolExecutor(max_workers=max_workers))
+    generation_pb2_grpc.add_GenerationServiceServicer_to_server(FakeGenerationServicer(config=config), server)
+    port = server.add_insecure_port(address=f"{LOCALHOST}:0")
+    server.start()
+
+    address = f"{LOCALHOST}:{port}"
+    LOGGER.info(f"Fake TGIS server listening on {address}: {config}")
+    return server, address
@@ -1,7 +1,12 @@
+import asyncio
+import time
 import grpc
-import socket
-import ssl
-import sys
+from functools import partial
+from google.protobuf import json_format
+from types import TracebackType
+from utilities.cassette import CassetteKind, get_cassette
+from utilities.certificates_utils import get_server_certificate
+from utilities.plugins.openai_plugin import StreamingResult
 from utilities.plugins.tgis_grpc import generation_pb2_grpc
 from typing import Any, Optional
 from simple_logger.logger import get_logger
@@ -9,6 +14,56 @@ from simple_logger.logger import get_logger
 
 LOGGER = get_logger(name=__name__)
 
+TLS_PORT = 443
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_STREAM_CONCURRENCY = 16
+# Ping only while calls are in flight, so idle channels are not closed by the server for too many pings
+CHANNEL_OPTIONS: list[tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 60_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.keepalive_permit_without_calls", 0),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+def get_channel_credentials(host: str, use_tls: bool) -> Optional[grpc.ChannelCredentials]:
+    """
+    Get gRPC channel credentials; with TLS the server certificate is trusted as is.
+
+    Args:
+        host (str): The gRPC server host.
+        use_tls (bool): Whether to use TLS for the connection.
+
+    Returns:
+        Optional[grpc.ChannelCredentials]: channel credentials, None without TLS
+    """
+    if use_tls:
+        cert = get_server_certificate(host=host, port=TLS_PORT).encode()
+        return grpc.ssl_channel_credentials(root_certificates=cert)
+    return None
+
+
+def single_generation_request(model_name: str, text: Optional[str]) -> Any:
+    """
+    Build a GenerateStream request, asking for the generated tokens in each response.
+
+    Args:
+        model_name (str): The model name to use.
+        text (str): The prompt.
+
+    Returns:
+        SingleGenerationRequest: streaming generation request
+    """
+    return generation_pb2_grpc.generation__pb2.SingleGenerationRequest(  # type: ignore
+        model_id=model_name,
+        request=generation_pb2_grpc.generation__pb2.GenerationRequest(text=text),  # type: ignore
+        params=generation_pb2_grpc.generation__pb2.Parameters(  # type: ignore
+            method=generation_pb2_grpc.generation__pb2.GREEDY,  # type: ignore
+            sampling=generation_pb2_grpc.generation__pb2.SamplingParameters(seed=1037),  # type: ignore
+            response=generation_pb2_grpc.generation__pb2.ResponseOptions(generated_tokens=True),  # type: ignore
+        ),
+    )
+
 
 class TGISGRPCPlugin:
     def __init__(self, host: str, model_name: str, streaming: bool = False, use_tls: bool = False):
@@ -26,69 +81,141 @@ class TGISGRPCPlugin:
         self.streaming = streaming
         self.use_tls = use_tls
         self.request_func = self.make_grpc_request_stream if streaming else self.make_grpc_request
+        self._channel: Optional[grpc.Channel] = None
+        self._stub: Optional[generation_pb2_grpc.GenerationServiceStub] = None
 
-    def _get_server_certificate(self, port: int) -> str:
-        if sys.version_info >= (3, 10):
-            return ssl.get_server_certificate((self.host, port))
-        ssl.SSLContext
-        context = ssl.SSLContext()
-        with (
-            socket.create_connection((self.host, port)) as sock,
-            context.wrap_socket(sock, server_hostname=self.host) as ssock,
-        ):
-            cert_der = ssock.getpeercert(binary_form=True)
-        return ssl.DER_cert_to_PEM_cert(cert_der)
+    def __enter__(self) -> "TGISGRPCPlugin":
+        return self
 
-    def _channel_credentials(self) -> Optional[grpc.ChannelCredentials]:
-        if self.use_tls:
-            cert = self._get_server_certificate(port=443).encode()
-            return grpc.ssl_channel_credentials(root_certificates=cert)
-        return None
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def _create_channel(self) -> grpc.Channel:
-        credentials = self._channel_credentials()
-        return grpc.secure_channel(self.host, credentials) if credentials else grpc.insecure_channel(self.host)
+        credentials = get_channel_credentials(host=self.host, use_tls=self.use_tls)
+        LOGGER.info(f"Opening gRPC channel to {self.host}")
+        if credentials:
+            return grpc.secure_channel(target=self.host, credentials=credentials, options=CHANNEL_OPTIONS)
+        return grpc.insecure_channel(target=self.host, options=CHANNEL_OPTIONS)
 
-    def make_grpc_request(self, query: dict[str, Any]) -> Any:
-        channel = self._create_channel()
-        stub = generation_pb2_grpc.GenerationServiceStub(channel)
+    @property
+    def stub(self) -> generation_pb2_grpc.GenerationServiceStub:
+        """Generation service stub; the channel is opened on first use and reused by all requests."""
+        if not self._stub:
+            self._channel = self._create_channel()
+            self._stub = generation_pb2_grpc.GenerationServiceStub(self._channel)
+        return self._stub
 
-        request = generation_pb2_grpc.generation__pb2.BatchedGenerationRequest(  # type: ignore
+    def close(self) -> None:
+        if self._channel:
+            LOGGER.info(f"Closing gRPC channel to {self.host}")
+            self._channel.close()
+            self._channel = None
+            self._stub = None
+
+    def _batched_generation_request(self, texts: list[Optional[str]]) -> Any:
+        return generation_pb2_grpc.generation__pb2.BatchedGenerationRequest(  # type: ignore
             model_id=self.model_name,
-            requests=[generation_pb2_grpc.generation__pb2.GenerationRequest(text=query.get("text"))],  # type: ignore
+            requests=[generation_pb2_grpc.generation__pb2.GenerationRequest(text=text) for text in texts],  # type: ignore
             params=generation_pb2_grpc.generation__pb2.Parameters(  # type: ignore
                 method=generation_pb2_grpc.generation__pb2.GREEDY,  # type: ignore
                 sampling=generation_pb2_grpc.generation__pb2.SamplingParameters(seed=1037),  # type: ignore
             ),
         )
 
+    @staticmethod
+    def _generation_result(response: Any) -> dict[str, Any]:
+        return {
+            "input_tokens": response.input_token_count,
+            "stop_reason": response.stop_reason,
+            "output_text": response.text,
+            "output_tokens": response.generated_token_count,
+        }
+
+    def make_grpc_request(self, query: dict[str, Any]) -> Any:
+        return get_cassette().play(
+            kind=CassetteKind.TGIS_GRPC,
+            target=f"{self.model_name}/Generate",
+            request=query,
+            send=partial(self._make_grpc_request, query=query),
+        )
+
+    def _make_grpc_request(self, query: dict[str, Any]) -> Any:
+        stub = self.stub
+
+        request = self._batched_generation_request(texts=[query.get("text")])
+
         try:
             response = stub.Generate(request=request)
             LOGGER.info(response)
-            response = response.responses[0]
-            return {
-                "input_tokens": response.input_token_count,
-                "stop_reason": response.stop_reason,
-                "output_text": response.text,
-                "output_tokens": response.generated_token_count,
-            }
+            return self._generation_result(response=response.responses[0])
         except grpc.RpcError as err:
             self._handle_grpc_error(err)
 
+    def make_grpc_batch_request(
+        self, queries: list[dict[str, Any]], max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    ) -> list[dict[str, Any]]:
+        """
+        Send many prompts in batched Generate calls, so the server can batch them.
+
+        Args:
+            queries (list[dict[str, Any]]): queries, each with the prompt in `text`
+            max_batch_size (int): maximum number of prompts sent in one Generate call
+
+        Returns:
+            list[dict[str, Any]]: one result per query, in the same order as `queries`, with the same
+                keys as `make_grpc_request` results (token counts, stop reason and output text)
+
+        Raises:
+            grpc.RpcError: If a Generate call fails
+            ValueError: If the server does not return one response per prompt
+        """
+        return get_cassette().play(
+            kind=CassetteKind.TGIS_GRPC,
+            target=f"{self.model_name}/Generate",
+            request=queries,
+            send=partial(self._make_grpc_batch_request, queries=queries, max_batch_size=max_batch_size),
+        )
+
+    def _make_grpc_batch_request(self, queries: list[dict[str, Any]], max_batch_size: int) -> list[dict[str, Any]]:
+        stub = self.stub
+        results: list[dict[str, Any]] = []
+
+        for batch_start in range(0, len(queries), max_batch_size):
+            batch = queries[batch_start : batch_start + max_batch_size]
+            request = self._batched_generation_request(texts=[query.get("text") for query in batch])
+
+            try:
+                response = stub.Generate(request=request)
+            except grpc.RpcError as err:
+                self._handle_grpc_error(err)
+                raise
+
+            if len(response.responses) != len(batch):
+                raise ValueError(f"Sent {len(batch)} prompts, got {len(response.responses)} responses")
+
+            LOGGER.info(f"Generated {len(batch)} responses, batch {batch_start // max_batch_size + 1}")
+            results.extend(self._generation_result(response=generation) for generation in response.responses)
+
+        return results
+
     def make_grpc_request_stream(self, query: dict[str, Any]) -> Any:
-        channel = self._create_channel()
-        stub = generation_pb2_grpc.GenerationServiceStub(channel)
+        return get_cassette().play(
+            kind=CassetteKind.TGIS_GRPC,
+            target=f"{self.model_name}/GenerateStream",
+            request=query,
+            send=partial(self._make_grpc_request_stream, query=query),
+        )
+
+    def _make_grpc_request_stream(self, query: dict[str, Any]) -> Any:
+        stub = self.stub
 
         tokens = []
-        request = generation_pb2_grpc.generation__pb2.SingleGenerationRequest(  # type: ignore
-            model_id=self.model_name,
-            request=generation_pb2_grpc.generation__pb2.GenerationRequest(text=query.get("text")),  # type: ignore
-            params=generation_pb2_grpc.generation__pb2.Parameters(  # type: ignore
-                method=generation_pb2_grpc.generation__pb2.GREEDY,  # type: ignore
-                sampling=generation_pb2_grpc.generation__pb2.SamplingParameters(seed=1037),  # type: ignore
-                response=generation_pb2_grpc.generation__pb2.ResponseOptions(generated_tokens=True),  # type: ignore
-            ),
-        )
+        request = single_generation_request(model_name=self.model_name, text=query.get("text"))
 
         try:
             resp_stream = stub.GenerateStream(request=request)
@@ -105,18 +232,148 @@ class TGISGRPCPlugin:
         except grpc.RpcError as err:
             self._handle_grpc_error(err)
 
-    def get_model_info(self) -> list[str]:  # type: ignore
-        channel = self._create_channel()
-        stub = generation_pb2_grpc.GenerationServiceStub(channel)
+    def get_model_info(self) -> Any:
+        """
+        Get the model info; the response is recorded in the cassette as a dict.
+
+        Returns:
+            ModelInfoResponse: model info, None if the request fails
+        """
+        model_info = get_cassette().play(
+            kind=CassetteKind.TGIS_GRPC,
+            target=f"{self.model_name}/ModelInfo",
+            request={},
+            send=self._get_model_info,
+        )
+        if model_info is None:
+            return None
+
+        return json_format.ParseDict(
+            js_dict=model_info,
+            message=generation_pb2_grpc.generation__pb2.ModelInfoResponse(),  # type: ignore
+        )
+
+    def _get_model_info(self) -> Optional[dict[str, Any]]:
+        stub = self.stub
 
         request = generation_pb2_grpc.generation__pb2.ModelInfoRequest()  # type: ignore
         LOGGER.info(request)
         try:
             response = stub.ModelInfo(request=request)
-            return response
+            return json_format.MessageToDict(message=response)
         except grpc.RpcError as err:
             self._handle_grpc_error(err)
+            return None
 
     def _handle_grpc_error(self, err: grpc.RpcError) -> None:
         """Handle gRPC errors."""
         LOGGER.error("gRPC Error: %s", err.details())
+
+
+class AsyncTGISGRPCPlugin:
+    """
+    asyncio TGIS client built on grpc.aio; concurrent GenerateStream calls share one channel.
+
+    Use as an async context manager, the channel is bound to the running event loop.
+    """
+
+    def __init__(self, host: str, model_name: str, use_tls: bool = False):
+        """
+        Args:
+            host (str): The gRPC server host.
+            model_name (str): The model name to use.
+            use_tls (bool): Whether to use TLS for the connection.
+        """
+        self.host = host
+        self.model_name = model_name
+        self.use_tls = use_tls
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._stub: Optional[generation_pb2_grpc.GenerationServiceStub] = None
+
+    async def __aenter__(self) -> "AsyncTGISGRPCPlugin":
+        credentials = get_channel_credentials(host=self.host, use_tls=self.use_tls)
+        LOGGER.info(f"Opening async gRPC channel to {self.host}")
+        if credentials:
+            self._channel = grpc.aio.secure_channel(target=self.host, credentials=credentials, options=CHANNEL_OPTIONS)
+        else:
+            self._channel = grpc.aio.insecure_channel(target=self.host, options=CHANNEL_OPTIONS)
+        self._stub = generation_pb2_grpc.GenerationServiceStub(self._channel)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._channel:
+            LOGGER.info(f"Closing async gRPC channel to {self.host}")
+            await self._channel.close()
+            self._channel = None
+            self._stub = None
+
+    async def make_grpc_request_stream(self, query: dict[str, Any]) -> StreamingResult:
+        """
+        Send a GenerateStream request and time the generated tokens.
+
+        Tokens delivered in the same response share its arrival time.
+
+        Args:
+            query (dict[str, Any]): query with the prompt in `text`
+
+        Returns:
+            StreamingResult: generated text, time to first token and inter-token latencies
+
+        Raises:
+            ValueError: If the plugin is not opened as a context manager
+            grpc.RpcError: If the request fails
+        """
+        if not self._stub:
+            raise ValueError(f"gRPC channel to {self.host} is not open")
+
+        result = StreamingResult()
+        tokens: list[str] = []
+        start_time = last_token_time = time.perf_counter()
+
+        async for resp in self._stub.GenerateStream(
+            request=single_generation_request(model_name=self.model_name, text=query.get("text"))
+        ):
+            response_time = time.perf_counter()
+            tokens.append(resp.text)
+
+            for _ in resp.tokens:
+                if result.token_count:
+                    result.inter_token_latencies.append(response_time - last_token_time)
+                else:
+                    result.time_to_first_token = response_time - start_time
+
+                result.token_count += 1
+                last_token_time = response_time
+
+        result.total_time = time.perf_counter() - start_time
+        result.text = "".join(tokens)
+        return result
+
+    async def make_grpc_request_streams(
+        self, queries: list[dict[str, Any]], concurrency: int = DEFAULT_STREAM_CONCURRENCY
+    ) -> list[StreamingResult]:
+        """
+        Run GenerateStream requests concurrently, with at most `concurrency` streams open.
+
+        Args:
+            queries (list[dict[str, Any]]): queries, each with the prompt in `text`
+            concurrency (int): maximum number of concurrent streams
+
+        Returns:
+            list[StreamingResult]: one result per query, in the same order as `queries`
+        """
+        semaphore = asyncio.Semaphore(value=concurrency)
+
+        async def _stream(query: dict[str, Any]) -> StreamingResult:
+            async with semaphore:
+                return await self.make_grpc_request_stream(query=query)
+
+        return await asyncio.gather(*[_stream(query=query) for query in queries])
@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.pod import Pod
+from ocp_resources.resource import Resource
+
+from utilities.exceptions import FailedPodsError
+
+# Container waiting reasons of images that can never be pulled
+IMAGE_ERROR_REASONS: tuple[str, ...] = ("InvalidImageName", "ErrImageNeverPull")
+# Container waiting reasons of image pulls that failed and are retried by the kubelet
+IMAGE_PULL_BACKOFF_REASONS: tuple[str, ...] = ("ImagePullBackOff", "ErrImagePull")
+CRASHLOOP_REASONS: tuple[str, ...] = (Resource.Status.CRASH_LOOPBACK_OFF,)
+TERMINATED_ERROR_REASONS: tuple[str, ...] = (Resource.Status.ERROR,)
+
+
+class PodHealthClass:
+    READY: str = "ready"
+    # Pod running, containers not ready yet
+    NOT_READY: str = "not-ready"
+    # Pod scheduled, containers being created or their images pulled
+    PULLING: str = "pulling"
+    CRASHLOOP: str = "crashloop"
+    IMAGE_ERROR: str = "image-error"
+    # Image pull failed and is retried, not failed by default
+    IMAGE_PULL_BACKOFF: str = "image-pull-backoff"
+    # Pod failed or a container terminated with an error
+    TERMINATED: str = "terminated"
+    # Pod marked for deletion
+    TERMINATING: str = "terminating"
+    COMPLETED: str = "completed"
+
+    FAILED_CLASSES: tuple[str, ...] = (CRASHLOOP, IMAGE_ERROR, TERMINATED)
+    RUNNING_CLASSES: tuple[str, ...] = (READY, NOT_READY, COMPLETED)
+
+
+@dataclass(frozen=True)
+class PodHealth:
+    """Health of a pod, classified from a single pod snapshot."""
+
+    name: str
+    health_class: str
+    reason: str
+    restarted_containers: list[str] = field(default_factory=list)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.health_class == PodHealthClass.READY
+
+    @property
+    def is_failed(self) -> bool:
+        return self.health_class in PodHealthClass.FAILED_CLASSES
+
+    @property
+    def is_running(self) -> bool:
+        return self.health_class in PodHealthClass.RUNNING_CLASSES
+
+
+def classify_pod_health(pod: ResourceInstance) -> PodHealth:
+    """
+    Classify the health of a pod from a pod snapshot, e.g. an item of a pods LIST or a watch event object.
+
+    The snapshot is not read again from the API server.
+
+    Args:
+        pod (ResourceInstance): pod snapshot
+
+    Returns:
+        PodHealth: pod health; `reason` is the container waiting or terminated reason of a failed, pulling or
+            image pull backoff pod, otherwise the pod phase
+
+    """
+    name = pod.metadata.name
+    pod_status = pod.status or {}
+    phase = pod_status.get("phase") or ""
+    container_statuses = (pod_status.get("initContainerStatuses") or []) + (pod_status.get("containerStatuses") or [])
+    restarted_containers = [
+        container_status.name for container_status in container_statuses if container_status.get("restartCount")
+    ]
+
+    def _pod_health(health_class: str, reason: str) -> PodHealth:
+        return PodHealth(name=name, health_class=health_class, reason=reason, restarted_containers=restarted_containers)
+
+    if pod.metadata.get("deletionTimestamp"):
+        return _pod_health(health_class=PodHealthClass.TERMINATING, reason=phase)
+
+    if phase == Pod.Status.SUCCEEDED:
+        return _pod_health(health_class=PodHealthClass.COMPLETED, reason=phase)
+
+    if phase == Pod.Status.FAILED:
+        return _pod_health(health_class=PodHealthClass.TERMINATED, reason=pod_status.get("reason") or phase)
+
+    waiting_reason = ""
+    for container_status in container_statuses:
+        state = container_status.get("state") or {}
+
+        if waiting_state := state.get("waiting"):
+            reason = waiting_state.get("reason") or ""
+
+            if reason in IMAGE_ERROR_REASONS:
+                return _pod_health(health_class=PodHealthClass.IMAGE_ERROR, reason=reason)
+
+            if reason in IMAGE_PULL_BACKOFF_REASONS:
+                return _pod_health(health_class=PodHealthClass.IMAGE_PULL_BACKOFF, reason=reason)
+
+            if reason in CRASHLOOP_REASONS:
+                return _pod_health(health_class=PodHealthClass.CRASHLOOP, reason=reason)
+
+            waiting_reason = waiting_reason or reason or "Waiting"
+
+        elif terminated_state := state.get("terminated"):
+            reason = terminated_state.get("reason") or ""
+
+            if reason in CRASHLOOP_REASONS:
+                return _pod_health(health_class=PodHealthClass.CRASHLOOP, reason=reason)
+
+            if reason in TERMINATED_ERROR_REASONS:
+                return _pod_health(health_class=PodHealthClass.TERMINATED, reason=reason)
+
+    if phase == Pod.Status.CRASH_LOOPBACK_OFF:
+        return _pod_health(health_class=PodHealthClass.CRASHLOOP, reason=phase)
+
+    for condition in pod_status.get("conditions") or []:
+        if condition.type == Pod.Status.READY and condition.status == Pod.Condition.Status.TRUE:
+            return _pod_health(health_class=PodHealthClass.READY, reason=phase)
+
+    if waiting_reason or phase == Pod.Status.PENDING:
+        return _pod_health(health_class=PodHealthClass.PULLING, reason=waiting_reason or phase)
+
+    return _pod_health(health_class=PodHealthClass.NOT_READY, reason=phase)
+
+
+def classify_pods_health(pods: Iterable[ResourceInstance]) -> list[PodHealth]:
+    """
+    Classify the health of pods from a single pods snapshot.
+
+    Args:
+        pods (Iterable[ResourceInstance]): pod snapshots, e.g. the items of a pods LIST
+
+    Returns:
+        list[PodHealth]: pods health
+
+    """
+    return [classify_pod_health(pod=pod) for pod in pods]
+
+
+def are_pods_ready(
+    pods: Iterable[ResourceInstance], failed_classes: tuple[str, ...] = PodHealthClass.FAILED_CLASSES
+) -> bool:
+    """
+    Check whether all pods of a pods snapshot are ready.
+
+    Args:
+        pods (Iterable[ResourceInstance]): pod snapshots, e.g. the items of a pods LIST
+        failed_classes (tuple[str, ...]): pod health classes considered failed
+
+    Returns:
+        bool: True if there are pods and all of them are ready, False otherwise
+
+    Raises:
+        FailedPodsError: If any pod is not ready and its health class is in `failed_classes`
+
+    """
+    pods_health = classify_pods_health(pods=pods)
+
+    if pods_health and all(pod_health.is_ready for pod_health in pods_health):
+        return True
+
+    if failed_pods := {
+        pod_health.name: pod_health.reason for pod_health in pods_health if pod_health.health_class in failed_classes
+    }:
+        raise FailedPodsError(pods=failed_pods)
+
+    return False
@@ -0,0 +1,336 @@
+import threading
+import time
+from collections import defaultdict
+from functools import cache
+from http import HTTPStatus
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.pod import Pod
+from simple_logger.logger import get_logger
+
+from utilities.resource_watch import WATCH_RETRY_SLEEP, WATCH_TRANSIENT_EXCEPTIONS, WatchEventType, get_resource_api
+
+LOGGER = get_logger(name=__name__)
+
+# Seconds a watch request is kept open before it is resumed from the last seen resourceVersion
+POD_INFORMER_WATCH_TIMEOUT: int = 60
+# Seconds the cache may lag behind the API server while the watch is reconnecting; lookups LIST pods when exceeded
+POD_INFORMER_MAX_STALENESS: int = 5
+# Seconds after the last lookup an informer stops watching its namespace
+POD_INFORMER_IDLE_TIMEOUT: int = 5 * 60
+# Seconds a lookup waits for the initial LIST of a new informer
+POD_INFORMER_SYNC_TIMEOUT: int = 10
+
+
+def parse_label_selector(label_selector: str) -> list[tuple[str, str, str]] | None:
+    """
+    Parse an equality-based label selector, e.g. `app=model,component!=router,tier`.
+
+    Args:
+        label_selector (str): label selector
+
+    Returns:
+        list[tuple[str, str, str]] | None: (key, operator, value) requirements, operator is one of `=`, `!=`,
+            `exists` and `!exists`; None if the selector has set-based requirements
+
+    """
+    requirements: list[tuple[str, str, str]] = []
+
+    for requirement in filter(None, (requirement.strip() for requirement in label_selector.split(","))):
+        if "(" in requirement or " " in requirement:
+            return None
+
+        if "!=" in requirement:
+            key, _, value = requirement.partition("!=")
+            requirements.append((key, "!=", value))
+
+        elif "=" in requirement:
+            key, _, value = requirement.partition("=")
+            requirements.append((key, "=", value.removeprefix("=")))
+
+        elif requirement.startswith("!"):
+            requirements.append((requirement.removeprefix("!"), "!exists", ""))
+
+        else:
+            requirements.append((requirement, "exists", ""))
+
+    return requirements
+
+
+class PodInformer:
+    """
+    Watches the pods of a namespace in a background thread and keeps them in a label-indexed in-memory cache.
+
+    Pods are listed once and then watched, resuming from the last seen resourceVersion; lookups are served
+    from the cache. If the watch is disconnected for longer than `max_staleness` seconds, or the client is not
+    allowed to watch pods, lookups LIST pods from the API server instead.
+    """
+
+    def __init__(
+        self,
+        client: DynamicClient,
+        namespace: str | None,
+        max_staleness: float = POD_INFORMER_MAX_STALENESS,
+        idle_timeout: float = POD_INFORMER_IDLE_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            client (DynamicClient): DynamicClient object, used to list and watch pods
+            namespace (str): watched namespace, None for all namespaces
+            max_staleness (float): seconds the cache may lag behind the API server
+            idle_timeout (float): seconds after the last lookup the informer stops
+        """
+        self.client = client
+        self.namespace = namespace
+        self.max_staleness = max_staleness
+        self.idle_timeout = idle_timeout
+        self._resource_api = get_resource_api(client=client, resource_class=Pod)
+        self._pods: dict[str, ResourceInstance] = {}
+        # "key=value" label -> names of the pods with the label
+        self._label_index: dict[str, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watching = False
+        self._can_watch = True
+        self._last_sync = 0.0
+        self._last_lookup = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"pod-informer-{namespace}", daemon=True)
+
+    def start(self) -> None:
+        LOGGER.info(f"Starting pod informer for namespace {self.namespace}")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive() and not self._stopped.is_set()
+
+    @property
+    def can_watch(self) -> bool:
+        return self._can_watch
+
+    def _index_pod(self, pod: ResourceInstance) -> None:
+        for key, value in (pod.metadata.labels or {}).items():
+            self._label_index[f"{key}={value}"].add(pod.metadata.name)
+
+    def _unindex_pod(self, pod: ResourceInstance) -> None:
+        for key, value in (pod.metadata.labels or {}).items():
+            if names := self._label_index.get(f"{key}={value}"):
+                names.discard(pod.metadata.name)
+
+    def _list(self) -> str:
+        pod_list = self._resource_api.get(namespace=self.namespace)
+
+        with self._lock:
+            self._pods = {pod.metadata.name: pod for pod in pod_list.items}
+            self._label_index.clear()
+            for pod in self._pods.values():
+                self._index_pod(pod=pod)
+
+            self._last_sync = time.monotonic()
+
+        self._synced.set()
+        return pod_list.metadata.resourceVersion
+
+    def _apply_event(self, event_type: str, pod: ResourceInstance) -> None:
+        with self._lock:
+            if previous_pod := self._pods.pop(pod.metadata.name, None):
+                self._unindex_pod(pod=previous_pod)
+
+            if event_type != WatchEventType.DELETED:
+                self._pods[pod.metadata.name] = pod
+                self._index_pod(pod=pod)
+
+            self._last_sync = time.monotonic()
+
+    def _run(self) -> None:
+        try:
+            self._watch_pods()
+
+        except Exception as ex:
+            LOGGER.warning(f"Pod informer for namespace {self.namespace} stopped, pods will be listed: {ex}")
+            self._can_watch = False
+
+        finally:
+            self._stopped.set()
+            self._synced.set()
+
+    def _watch_pods(self) -> None:
+        resource_version = ""
+
+        while not self._stopped.is_set():
+            if time.monotonic() - self._last_lookup > self.idle_timeout:
+                LOGGER.info(f"Stopping idle pod informer for namespace {self.namespace}")
+                self._stopped.set()
+                break
+
+            try:
+                if not resource_version:
+                    resource_version = self._list()
+
+                self._watching = True
+                for event in self.client.watch(
+                    resource=self._resource_api,
+                    namespace=self.namespace,
+                    resource_version=resource_version,
+                    timeout=POD_INFORMER_WATCH_TIMEOUT,
+                    allow_watch_bookmarks=True,
+                ):
+                    resource_version = event["object"].metadata.resourceVersion
+                    if event["type"] != WatchEventType.BOOKMARK:
+                        self._apply_event(event_type=event["type"], pod=event["object"])
+
+                    if self._stopped.is_set():
+                        break
+
+                with self._lock:
+                    self._last_sync = time.monotonic()
+
+            except (ApiException, *WATCH_TRANSIENT_EXCEPTIONS) as ex:
+                status = getattr(ex, "status", None)
+
+                if status == HTTPStatus.GONE:
+                    resource_version = ""
+
+                elif isinstance(ex, WATCH_TRANSIENT_EXCEPTIONS):
+                    LOGGER.warning(f"Pod informer for namespace {self.namespace} failed, listing again: {ex}")
+                    resource_version = ""
+                    time.sleep(WATCH_RETRY_SLEEP)
+
+                else:
+                    LOGGER.warning(f"Pod informer for namespace {self.namespace} stopped, pods will be listed: {ex}")
+                    self._can_watch = False
+                    self._stopped.set()
+
+            finally:
+                self._watching = False
+
+    def _is_fresh(self) -> bool:
+        return self._can_watch and (self._watching or time.monotonic() - self._last_sync <= self.max_staleness)
+
+    def get_pods(self, label_selector: str = "") -> list[ResourceInstance]:
+        """
+        Get the pods of the namespace matching a label selector.
+
+        Args:
+            label_selector (str): label selector
+
+        Returns:
+            list[ResourceInstance]: matching pods, from the cache if it is fresh, otherwise listed from the API server
+
+        """
+        self._last_lookup = time.monotonic()
+        self._synced.wait(timeout=POD_INFORMER_SYNC_TIMEOUT)
+        requirements = parse_label_selector(label_selector=label_selector)
+
+        if requirements is None or not self._synced.is_set() or not self._is_fresh():
+            return list(self._resource_api.get(namespace=self.namespace, label_selector=label_selector or None).items)
+
+        with self._lock:
+            names: set[str] | None = None
+            for key, operator, value in requirements:
+                if operator == "=":
+                    label_names = self._label_index.get(f"{key}={value}", set())
+                    names = label_names.copy() if names is None else names & label_names
+
+            pods = [self._pods[name] for name in names] if names is not None else list(self._pods.values())
+
+        # Sorted by name, same as the API server lists pods
+        return sorted(
+            (pod for pod in pods if self._matches(pod=pod, requirements=requirements)),
+            key=lambda pod: pod.metadata.name,
+        )
+
+    @staticmethod
+    def _matches(pod: ResourceInstance, requirements: list[tuple[str, str, str]]) -> bool:
+        labels = pod.metadata.labels or {}
+
+        for key, operator, value in requirements:
+            if (
+                (operator == "=" and labels.get(key) != value)
+                or (operator == "!=" and labels.get(key) == value)
+                or (operator == "exists" and key not in labels)
+                or (operator == "!exists" and key in labels)
+            ):
+                return False
+
+        return True
+
+
+class PodInformerManager:
+    """
+    Process-wide pod informers, one per (client, namespace), started on the first lookup in a namespace.
+    """
+
+    def __init__(self) -> None:
+        self._informers: dict[tuple[int, str | None], PodInformer] = {}
+        self._lock = threading.Lock()
+
+    def get_informer(self, client: DynamicClient, namespace: str | None) -> PodInformer:
+        """
+        Get the pod informer of a namespace, started if it is not running.
+
+        Args:
+            client (DynamicClient): DynamicClient object
+            namespace (str): namespace
+
+        Returns:
+            PodInformer: pod informer
+
+        """
+        key = (id(client), namespace)
+
+        with self._lock:
+            # Informers stopped because watching is not allowed are kept, their lookups LIST pods
+            if not (
+                (informer := self._informers.get(key))
+                and informer.client is client
+                and (informer.is_alive or not informer.can_watch)
+            ):
+                informer = self._informers[key] = PodInformer(client=client, namespace=namespace)
+                informer.start()
+
+        return informer
+
+    def get_pods(self, client: DynamicClient, namespace: str | None, label_selector: str = "") -> list[Pod]:
+        """
+        Get the pods of a namespace matching a label selector, served from the namespace pod informer.
+
+        Args:
+            client (DynamicClient): DynamicClient object
+            namespace (str): namespace
+            label_selector (str): label selector
+
+        Returns:
+            list[Pod]: matching pods
+
+        """
+        informer = self.get_informer(client=client, namespace=namespace)
+        return [
+            Pod(client=client, name=pod.metadata.name, namespace=pod.metadata.namespace)
+            for pod in informer.get_pods(label_selector=label_selector)
+        ]
+
+    def stop(self) -> None:
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+
+            self._informers.clear()
+
+
+@cache
+def get_pod_informer_manager() -> PodInformerManager:
+    """
+    Get the process-wide pod informer manager.
+
+    Returns:
+        PodInformerManager: pod informer manager
+
+    """
+    return PodInformerManager()
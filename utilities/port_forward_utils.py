@@ -0,0 +1,218 @@
+import socket
+import threading
+import time
+from functools import cache
+
+import portforward
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+LOCALHOST: str = "127.0.0.1"
+HEALTH_CHECK_INTERVAL: int = 30
+HEALTH_CHECK_TIMEOUT: int = 2
+# A failed stream to the target closes the probe connection well within this time
+HEALTH_CHECK_PROBE_TIMEOUT: float = 0.5
+
+
+def get_port_forward_target_name(namespace: str, pod_or_service: str, port: int) -> str:
+    """
+    Get the name of a port-forward target, used to key clients which reach the target through a tunnel.
+
+    Args:
+        namespace (str): namespace of the pod or service
+        pod_or_service (str): pod or service name
+        port (int): target port in the pod or service
+
+    Returns:
+        str: target name, `<namespace>/<pod or service>:<port>`
+
+    """
+    return f"{namespace}/{pod_or_service}:{port}"
+
+
+class PortForwardTunnel:
+    """
+    A long-lived port-forward tunnel to a pod or a service.
+
+    The local port is allocated by the OS, so tunnels opened by different pytest-xdist workers never collide.
+    """
+
+    def __init__(self, namespace: str, pod_or_service: str, port: int) -> None:
+        """
+        Args:
+            namespace (str): namespace of the pod or service
+            pod_or_service (str): pod or service name
+            port (int): target port in the pod or service
+        """
+        self.namespace = namespace
+        self.pod_or_service = pod_or_service
+        self.port = port
+        self._forwarder: portforward.PortForwarder | None = None
+        self._last_health_check: float = 0.0
+
+    @property
+    def local_port(self) -> int:
+        if not self._forwarder:
+            raise ValueError(f"Port forward to {self.namespace}/{self.pod_or_service}:{self.port} is not open")
+
+        return self._forwarder.from_port
+
+    def open(self) -> None:
+        LOGGER.info(f"Opening port forward to {self.namespace}/{self.pod_or_service}:{self.port}")
+        forwarder = portforward.PortForwarder(
+            namespace=self.namespace,
+            pod_or_service=self.pod_or_service,
+            from_port=0,
+            to_port=self.port,
+        )
+
+        try:
+            forwarder.forward()
+
+        except RuntimeError as err:
+            raise portforward.PortforwardError(err) from None
+
+        self._forwarder = forwarder
+        self._last_health_check = time.monotonic()
+        LOGGER.info(f"Port forward to {self.namespace}/{self.pod_or_service}:{self.port} on port {self.local_port}")
+
+    def close(self) -> None:
+        if self._forwarder:
+            LOGGER.info(f"Closing port forward to {self.namespace}/{self.pod_or_service}:{self.port}")
+            try:
+                self._forwarder.stop()
+
+            except RuntimeError as err:
+                LOGGER.warning(f"Failed to stop port forward to {self.pod_or_service}: {err}")
+
+            self._forwarder = None
+
+    def is_healthy(self) -> bool:
+        """
+        Check that the remote end of the tunnel is reachable.
+
+        The local listener accepts connections even when the target is gone; the tunnel then closes the
+        connection as soon as the stream to the target fails. Inference servers do not send data before a
+        request, so a connection still open after `HEALTH_CHECK_PROBE_TIMEOUT` seconds means the target is
+        reachable.
+        The check is skipped if the tunnel was checked in the last `HEALTH_CHECK_INTERVAL` seconds.
+
+        Returns:
+            bool: True if the tunnel is open and its remote end is reachable, False otherwise
+
+        """
+        if not self._forwarder:
+            return False
+
+        if time.monotonic() - self._last_health_check < HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            with socket.create_connection(
+                address=(LOCALHOST, self.local_port), timeout=HEALTH_CHECK_TIMEOUT
+            ) as connection:
+                connection.settimeout(HEALTH_CHECK_PROBE_TIMEOUT)
+                try:
+                    if not connection.recv(1):
+                        raise ConnectionAbortedError("Connection closed by the tunnel")
+
+                except TimeoutError:
+                    pass
+
+                self._last_health_check = time.monotonic()
+                return True
+
+        except OSError as err:
+            LOGGER.warning(f"Port forward to {self.namespace}/{self.pod_or_service}:{self.port} is not healthy: {err}")
+            return False
+
+
+class PortForwardManager:
+    """
+    Keeps port-forward tunnels open for the whole session, keyed by (namespace, pod or service, port).
+
+    Unhealthy tunnels are re-opened on the next lookup. Each tunnel is checked and opened under its own lock,
+    so lookups of other tunnels are not blocked by a health check or a tunnel being opened.
+    """
+
+    def __init__(self) -> None:
+        self._tunnels: dict[tuple[str, str, int], PortForwardTunnel] = {}
+        self._tunnel_locks: dict[tuple[str, str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get_tunnel_lock(self, key: tuple[str, str, int]) -> threading.Lock:
+        with self._lock:
+            return self._tunnel_locks.setdefault(key, threading.Lock())
+
+    def get_local_port(self, namespace: str, pod_or_service: str, port: int) -> int:
+        """
+        Get the local port of a tunnel to a pod or service, opening or re-opening the tunnel if needed.
+
+        Args:
+            namespace (str): namespace of the pod or service
+            pod_or_service (str): pod or service name
+            port (int): target port in the pod or service
+
+        Returns:
+            int: local port forwarded to the target port
+
+        Raises:
+            PortforwardError: If the tunnel could not be opened
+
+        """
+        key = (namespace, pod_or_service, port)
+
+        with self._get_tunnel_lock(key=key):
+            tunnel = self._tunnels.get(key)
+
+            if tunnel and not tunnel.is_healthy():
+                tunnel.close()
+                tunnel = None
+
+            if not tunnel:
+                tunnel = PortForwardTunnel(namespace=namespace, pod_or_service=pod_or_service, port=port)
+                tunnel.open()
+
+                with self._lock:
+                    self._tunnels[key] = tunnel
+
+            return tunnel.local_port
+
+    def close_tunnel(self, namespace: str, pod_or_service: str, port: int) -> None:
+        """
+        Close a tunnel; used when the target goes away or requests through the tunnel fail.
+
+        Args:
+            namespace (str): namespace of the pod or service
+            pod_or_service (str): pod or service name
+            port (int): target port in the pod or service
+
+        """
+        key = (namespace, pod_or_service, port)
+
+        with self._get_tunnel_lock(key=key):
+            with self._lock:
+                tunnel = self._tunnels.pop(key, None)
+
+            if tunnel:
+                tunnel.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            for tunnel in self._tunnels.values():
+                tunnel.close()
+
+            self._tunnels.clear()
+
+
+@cache
+def get_port_forward_manager() -> PortForwardManager:
+    """
+    Get the process-wide port-forward manager.
+
+    Returns:
+        PortForwardManager: port-forward manager
+
+    """
+    return PortForwardManager()
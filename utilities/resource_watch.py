@@ -0,0 +1,177 @@
+import time
+from http import HTTPStatus
+from typing import Callable
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import InternalServerError, ServerTimeoutError
+from kubernetes.dynamic.resource import Resource as DynamicResource
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.resource import NamespacedResource, Resource
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+LOGGER = get_logger(name=__name__)
+
+# Seconds to wait before listing again after a transient API error
+WATCH_RETRY_SLEEP: int = 1
+# Seconds between LIST calls when the client is not allowed to watch the resources
+WATCH_FALLBACK_POLL_INTERVAL: int = 5
+WATCH_TRANSIENT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    ConnectionAbortedError,
+    ConnectionResetError,
+    InternalServerError,
+    MaxRetryError,
+    ProtocolError,
+    ServerTimeoutError,
+)
+WATCH_NOT_ALLOWED_STATUSES: tuple[int, ...] = (HTTPStatus.FORBIDDEN, HTTPStatus.METHOD_NOT_ALLOWED)
+
+
+class WatchEventType:
+    ADDED: str = "ADDED"
+    MODIFIED: str = "MODIFIED"
+    DELETED: str = "DELETED"
+    BOOKMARK: str = "BOOKMARK"
+
+
+def get_resource_api(client: DynamicClient, resource_class: type[Resource]) -> DynamicResource:
+    """
+    Get the dynamic client API of a resource kind, through the openshift-python-wrapper resource.
+
+    Args:
+        client (DynamicClient): DynamicClient object
+        resource_class (type[Resource]): resource class, e.g. `Pod`
+
+    Returns:
+        DynamicResource: resource kind API
+
+    """
+    # The resource object is only used to resolve the kind API, its name and namespace are not used
+    if issubclass(resource_class, NamespacedResource):
+        return resource_class(client=client, name=resource_class.kind.lower(), namespace="default").api
+
+    return resource_class(client=client, name=resource_class.kind.lower()).api
+
+
+def wait_for_resources(
+    client: DynamicClient,
+    resource_class: type[Resource],
+    namespace: str | None,
+    condition: Callable[[list[ResourceInstance]], bool],
+    timeout: float,
+    name: str | None = None,
+    label_selector: str = "",
+    field_selector: str = "",
+) -> list[ResourceInstance]:
+    """
+    Wait for a condition on a set of resources, evaluated on every change of the resources.
+
+    The resources are listed once and then watched from the list resourceVersion. Every watch event updates
+    a local snapshot of the resources and the condition is evaluated on it, so the wait returns as soon as the
+    condition holds, without polling.
+    A watch closed by the API server is resumed from the last seen resourceVersion (bookmarks are requested
+    to keep it recent); if the resourceVersion has expired (410 Gone) or the API call failed with a transient
+    error, the resources are listed again. If the client is not allowed to watch the resources,
+    they are listed every `WATCH_FALLBACK_POLL_INTERVAL` seconds instead.
+
+    Args:
+        client (DynamicClient): DynamicClient object
+        resource_class (type[Resource]): resource class, e.g. `Pod`
+        namespace (str): resources namespace, None for cluster-scoped resources
+        condition (Callable): called with the current resources, returns True when the wait is done.
+            May raise to stop the wait, e.g. when a pod failed
+        timeout (int): time to wait in seconds
+        name (str): resource name, to wait for a single resource
+        label_selector (str): label selector of the resources
+        field_selector (str): field selector of the resources
+
+    Returns:
+        list[ResourceInstance]: resources for which the condition holds
+
+    Raises:
+        TimeoutExpiredError: If the condition does not hold before the timeout; `last_exp` is the last
+            transient API error, if the last API call failed
+
+    """
+    if name:
+        field_selector = ",".join(filter(None, [field_selector, f"metadata.name={name}"]))
+
+    selectors = {
+        "namespace": namespace,
+        "label_selector": label_selector or None,
+        "field_selector": field_selector or None,
+    }
+    description = f"{resource_class.kind} {namespace}/{name or label_selector or field_selector or '*'}"
+
+    timeout_watch = TimeoutWatch(timeout=timeout)
+    resource_api = get_resource_api(client=client, resource_class=resource_class)
+    resources: dict[str, ResourceInstance] = {}
+    resource_version = ""
+    can_watch = True
+    last_exception: Exception | None = None
+
+    while (remaining_time := timeout_watch.remaining_time()) > 0:
+        try:
+            if not resource_version:
+                resource_list = resource_api.get(**selectors)
+                resources = {resource.metadata.name: resource for resource in resource_list.items}
+                resource_version = resource_list.metadata.resourceVersion
+                last_exception = None
+
+                if condition(list(resources.values())):
+                    return list(resources.values())
+
+                if not can_watch:
+                    resource_version = ""
+                    time.sleep(min(WATCH_FALLBACK_POLL_INTERVAL, remaining_time))
+                    continue
+
+            for event in client.watch(
+                resource=resource_api,
+                resource_version=resource_version,
+                timeout=max(int(remaining_time), 1),
+                allow_watch_bookmarks=True,
+                **selectors,
+            ):
+                event_object = event["object"]
+                resource_version = event_object.metadata.resourceVersion
+
+                if event["type"] == WatchEventType.BOOKMARK:
+                    continue
+
+                if event["type"] == WatchEventType.DELETED:
+                    resources.pop(event_object.metadata.name, None)
+
+                else:
+                    resources[event_object.metadata.name] = event_object
+
+                if condition(list(resources.values())):
+                    return list(resources.values())
+
+                if not timeout_watch.remaining_time():
+                    break
+
+        except (ApiException, *WATCH_TRANSIENT_EXCEPTIONS) as ex:
+            status = getattr(ex, "status", None)
+
+            if status == HTTPStatus.GONE:
+                LOGGER.info(f"Watch of {description} expired at resourceVersion {resource_version}, listing again")
+                resource_version = ""
+
+            elif status in WATCH_NOT_ALLOWED_STATUSES and can_watch and resource_version:
+                LOGGER.warning(f"Not allowed to watch {description}, polling instead: {ex}")
+                can_watch = False
+                resource_version = ""
+
+            elif isinstance(ex, WATCH_TRANSIENT_EXCEPTIONS):
+                LOGGER.warning(f"Transient error while waiting for {description}: {ex}")
+                last_exception = ex
+                resource_version = ""
+                time.sleep(WATCH_RETRY_SLEEP)
+
+            else:
+                raise
+
+    raise TimeoutExpiredError(value=f"Waiting for {description}", last_exp=last_exception)
@@ -0,0 +1,128 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cache
+from typing import Optional
+
+from ocp_resources.service_account import ServiceAccount
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+# Same as the `oc create token` default duration
+DEFAULT_TOKEN_EXPIRATION_SECONDS: int = 3600
+# Tokens are minted again once less than this fraction of their lifetime is left
+TOKEN_REFRESH_RATIO: float = 0.2
+
+
+@dataclass(frozen=True)
+class ServiceAccountToken:
+    """A ServiceAccount token minted with the TokenRequest API."""
+
+    token: str
+    issued_at: datetime
+    expires_at: datetime
+
+    def needs_refresh(self) -> bool:
+        lifetime = self.expires_at - self.issued_at
+        return self.expires_at - datetime.now(tz=timezone.utc) < lifetime * TOKEN_REFRESH_RATIO
+
+
+class TokenService:
+    """
+    Mints ServiceAccount tokens with the TokenRequest API and caches them until they are close to expiry.
+
+    Tokens are keyed by the ServiceAccount UID as well as its namespace and name, so a ServiceAccount
+    re-created with the same name never gets a token of the deleted one.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: dict[tuple[Optional[str], Optional[str], str, Optional[str], int], ServiceAccountToken] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_token(
+        service_account: ServiceAccount,
+        audience: Optional[str] = None,
+        expiration_seconds: int = DEFAULT_TOKEN_EXPIRATION_SECONDS,
+    ) -> ServiceAccountToken:
+        """
+        Mint a new ServiceAccount token.
+
+        Args:
+            service_account (ServiceAccount): ServiceAccount object
+            audience (str, optional): token audience, the API server audience if not set
+            expiration_seconds (int): requested token lifetime; the API server may shorten it
+
+        Returns:
+            ServiceAccountToken: minted token
+
+        """
+        spec: dict[str, int | list[str]] = {"expirationSeconds": expiration_seconds}
+        if audience:
+            spec["audiences"] = [audience]
+
+        LOGGER.info(f"Requesting token for ServiceAccount {service_account.namespace}/{service_account.name}")
+        response = service_account.api.subresources["token"].create(
+            body={"apiVersion": "authentication.k8s.io/v1", "kind": "TokenRequest", "spec": spec},
+            name=service_account.name,
+            namespace=service_account.namespace,
+        )
+        return ServiceAccountToken(
+            token=response.status.token,
+            issued_at=datetime.now(tz=timezone.utc),
+            expires_at=datetime.fromisoformat(response.status.expirationTimestamp),
+        )
+
+    def get_token(
+        self,
+        service_account: ServiceAccount,
+        audience: Optional[str] = None,
+        expiration_seconds: int = DEFAULT_TOKEN_EXPIRATION_SECONDS,
+        refresh: bool = False,
+    ) -> str:
+        """
+        Get a ServiceAccount token, minting a new one if there is no cached token or it is close to expiry.
+
+        Args:
+            service_account (ServiceAccount): ServiceAccount object
+            audience (str, optional): token audience, the API server audience if not set
+            expiration_seconds (int): requested token lifetime
+            refresh (bool): mint a new token even if the cached one is still valid
+
+        Returns:
+            str: ServiceAccount token
+
+        """
+        key = (
+            service_account.namespace,
+            service_account.name,
+            service_account.instance.metadata.uid,
+            audience,
+            expiration_seconds,
+        )
+
+        with self._lock:
+            cached_token = self._tokens.get(key)
+
+            if refresh or not cached_token or cached_token.needs_refresh():
+                cached_token = self.request_token(
+                    service_account=service_account,
+                    audience=audience,
+                    expiration_seconds=expiration_seconds,
+                )
+                self._tokens[key] = cached_token
+
+            return cached_token.token
+
+
+@cache
+def get_token_service() -> TokenService:
+    """
+    Get the process-wide ServiceAccount token service.
+
+    Returns:
+        TokenService: token service
+
+    """
+    return TokenService()